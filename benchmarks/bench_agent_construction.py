@@ -0,0 +1,94 @@
+"""Micro-benchmark: per-tournament agent construction overhead.
+
+Compares building all five agents of a tournament from scratch (the
+pre-registry behaviour) against serving them from a warm AgentRegistry.
+Uses the offline 'test' model so no API key or network is needed.
+
+Run with: uv run python benchmarks/bench_agent_construction.py
+"""
+
+import argparse
+import time
+
+from adversarial_tournament.agents import (
+    AgentRegistry,
+    create_contestant_agent,
+    create_judge_agent,
+    create_persona_generator,
+    create_synthesizer_agent,
+)
+from adversarial_tournament.models.persona import Persona, PersonaSet
+
+MODEL = "test"
+
+
+def _persona(name: str, persona_type: str) -> Persona:
+    return Persona(
+        name=name,
+        role=f"{name} Role",
+        goal="Goal",
+        backstory="Backstory.",
+        persona_type=persona_type,
+        key_traits=["a", "b", "c"],
+        communication_style="Direct",
+    )
+
+
+PERSONAS = PersonaSet(
+    contestant_1=_persona("The Engineer", "contestant"),
+    contestant_2=_persona("The Communicator", "contestant"),
+    judge=_persona("The Critic", "judge"),
+    task_context="Benchmark task",
+    reasoning="Benchmark",
+)
+
+
+def build_fresh() -> None:
+    """Build every agent of one tournament from scratch."""
+    create_persona_generator(MODEL)
+    create_contestant_agent(PERSONAS.contestant_1, MODEL)
+    create_contestant_agent(PERSONAS.contestant_2, MODEL)
+    create_judge_agent(PERSONAS.judge, MODEL)
+    create_synthesizer_agent(PERSONAS.contestant_1, PERSONAS.contestant_2, MODEL)
+
+
+def build_from_registry(registry: AgentRegistry) -> None:
+    """Fetch every agent of one tournament from the registry."""
+    p = PERSONAS
+    registry.get("persona_generator", MODEL, (), lambda: create_persona_generator(MODEL))
+    registry.get("contestant", MODEL, (p.contestant_1,), lambda: create_contestant_agent(p.contestant_1, MODEL))
+    registry.get("contestant", MODEL, (p.contestant_2,), lambda: create_contestant_agent(p.contestant_2, MODEL))
+    registry.get("judge", MODEL, (p.judge,), lambda: create_judge_agent(p.judge, MODEL))
+    registry.get(
+        "synthesizer",
+        MODEL,
+        (p.contestant_1, p.contestant_2),
+        lambda: create_synthesizer_agent(p.contestant_1, p.contestant_2, MODEL),
+    )
+
+
+def _per_iteration_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    registry = AgentRegistry()
+    build_from_registry(registry)  # warm up
+
+    fresh = _per_iteration_us(build_fresh, args.iterations)
+    reused = _per_iteration_us(lambda: build_from_registry(registry), args.iterations)
+
+    print(f"fresh agents per tournament:    {fresh:9.1f} us")
+    print(f"registry agents per tournament: {reused:9.1f} us")
+    print(f"speedup: {fresh / reused:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
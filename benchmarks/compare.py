@@ -0,0 +1,77 @@
+"""Compare two benchmark result files from benchmarks/run_benchmarks.py.
+
+Prints the relative change of every headline number and exits non-zero if
+any of them regressed by more than the threshold.
+
+Run with: uv run python benchmarks/compare.py baseline.json candidate.json
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import ujson
+
+
+def _headline(report: dict) -> dict[str, tuple[float, bool]]:
+    """Map metric name -> (value, higher_is_better)."""
+    numbers = {"overhead.mean_ms": (report["overhead"]["mean_ms"], False)}
+    for mode, row in report["critical_path"].items():
+        numbers[f"critical_path.{mode}.total_s"] = (row["total_s"], False)
+    for row in report.get("fan_out", []):
+        numbers[f"fan_out.c{row['contestants']}.total_s"] = (row["total_s"], False)
+    for name, row in report.get("serialization", {}).get("writers", {}).items():
+        numbers[f"serialization.{name}.ms"] = (row["ms"], False)
+        numbers[f"serialization.{name}.peak_mb"] = (row["peak_mb"], False)
+    for mode, row in report.get("connection_pool", {}).get("modes", {}).items():
+        numbers[f"connection_pool.{mode}.elapsed_s"] = (row["elapsed_s"], False)
+    if "persona_index" in report:
+        index = report["persona_index"]
+        numbers["persona_index.near_duplicate_hit_rate"] = (index["hit_rate"]["near_duplicate"], True)
+        numbers["persona_index.p95_lookup_ms"] = (index["p95_lookup_ms"], False)
+    if "archive" in report:
+        numbers["archive.inserts_per_s"] = (report["archive"]["inserts_per_s"], True)
+        for name, ms in report["archive"]["lookup_ms"].items():
+            numbers[f"archive.{name}.lookup_ms"] = (ms, False)
+    if "startup" in report:
+        numbers["startup.help_ms"] = (report["startup"]["help_ms"], False)
+        numbers["startup.import_ms"] = (report["startup"]["import_ms"], False)
+    for row in report["throughput"]:
+        numbers[f"throughput.c{row['concurrency']}.tournaments_per_s"] = (
+            row["tournaments_per_s"],
+            True,
+        )
+    return numbers
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative change counted as a regression (default: 0.10)",
+    )
+    args = parser.parse_args()
+
+    baseline = _headline(ujson.loads(args.baseline.read_text()))
+    candidate = _headline(ujson.loads(args.candidate.read_text()))
+
+    regressions = 0
+    for name, (old, higher_is_better) in baseline.items():
+        if name not in candidate:
+            continue
+        new = candidate[name][0]
+        change = (new - old) / old if old else 0.0
+        worse = -change if higher_is_better else change
+        flag = "REGRESSION" if worse > args.threshold else ""
+        regressions += bool(flag)
+        print(f"{name:<45} {old:10.3f} -> {new:10.3f} ({change:+.1%}) {flag}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
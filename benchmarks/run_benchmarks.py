@@ -0,0 +1,534 @@
+"""Offline tournament benchmark suite.
+
+Runs AdversarialTournament against a simulated model with a seeded latency
+profile (no API key or network needed) and reports:
+
+- orchestration overhead: time per tournament with a zero-latency model
+- critical path: per-phase wall-clock time of a single tournament, for each
+  execution mode (sequential, overlapped Phase 0, pipelined rounds, both)
+- fan-out: wall-clock time of a single tournament for 2..N contestants
+- throughput scaling: tournaments per second for 1..N concurrent tournaments
+- serialization: time, peak memory and size of writing a batch of results
+  as one JSON array (--output-json) versus the JSONL sink (--output-jsonl)
+- connection pool: connections opened and wall-clock time of concurrent
+  tournaments against a local fake OpenAI-compatible server (with a simulated
+  per-connection handshake and response latency), with a new connection per
+  call, pydantic-ai's default client, one unsharded pool and the shared
+  ``ModelClients`` pool
+- persona index: fill rate of the near-duplicate persona index, its hit rate
+  on near-duplicate tasks (one word swapped) and on unrelated ones, and its
+  lookup latency once it holds --persona-index-tasks tasks
+- archive: insert rate of the SQLite result archive and the latency of its
+  lookups (full-text search, exact task, persona, slowest phase, by id) once it is filled
+- startup: wall-clock time of ``adversarial-tournament --help`` and the
+  ``-X importtime`` cumulative import time of the CLI module
+
+Results are written as JSON so runs on different commits can be compared
+with benchmarks/compare.py.
+
+Run with: uv run python benchmarks/run_benchmarks.py --output bench.json
+"""
+
+import argparse
+import asyncio
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+import ujson
+
+from adversarial_tournament import AdversarialTournament, TournamentResult
+from adversarial_tournament.archive import ResultArchive
+from adversarial_tournament.cache import PersonaIndex
+from adversarial_tournament.clients import HttpConfig, ModelClients
+from adversarial_tournament.exceptions import TournamentError
+from adversarial_tournament.models import PersonaSet
+from adversarial_tournament.sinks import JsonlSink
+from adversarial_tournament.testing import (
+    FakeOpenAIServer,
+    LatencyProfile,
+    create_simulated_model,
+)
+
+MODES = {
+    "sequential": {},
+    "overlap": {"overlap_persona_generation": True},
+    "pipeline": {"pipeline_rounds": True},
+    "overlap+pipeline": {"overlap_persona_generation": True, "pipeline_rounds": True},
+}
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def bench_overhead(iterations: int, words: int) -> dict:
+    """Time per tournament when the model answers instantly."""
+    tournament = AdversarialTournament(model=create_simulated_model(words=words))
+    await tournament.run("Warm-up task")
+
+    durations = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        await tournament.run(f"Overhead task {i}")
+        durations.append(time.perf_counter() - start)
+
+    return {
+        "iterations": iterations,
+        "mean_ms": statistics.fmean(durations) * 1e3,
+        "median_ms": statistics.median(durations) * 1e3,
+        "min_ms": min(durations) * 1e3,
+    }
+
+
+async def bench_critical_path(
+    latency: LatencyProfile, seed: int, iterations: int, words: int
+) -> dict:
+    """Per-phase wall-clock time of single tournaments in each execution mode."""
+    results = {}
+    for mode, options in MODES.items():
+        model = create_simulated_model(latency, seed=seed, words=words)
+        tournament = AdversarialTournament(model=model, **options)
+
+        totals: list[float] = []
+        phases: dict[str, list[float]] = {}
+        for i in range(iterations):
+            result = await tournament.run(f"Critical path task {i}")
+            totals.append(result.metrics.total_duration_s)
+            for phase in result.metrics.phases:
+                phases.setdefault(phase.phase, []).append(phase.duration_s)
+
+        results[mode] = {
+            "total_s": statistics.fmean(totals),
+            "phases_s": {name: statistics.fmean(values) for name, values in phases.items()},
+        }
+    return results
+
+
+async def bench_fan_out(
+    latency: LatencyProfile, seed: int, iterations: int, words: int, max_contestants: int
+) -> list[dict]:
+    """Wall-clock time of single tournaments with an increasing number of contestants."""
+    rows = []
+    for contestants in range(2, max_contestants + 1):
+        model = create_simulated_model(latency, seed=seed, words=words)
+        tournament = AdversarialTournament(model=model, contestants=contestants)
+
+        totals = []
+        for i in range(iterations):
+            result = await tournament.run(f"Fan-out task {i}")
+            totals.append(result.metrics.total_duration_s)
+
+        rows.append({"contestants": contestants, "total_s": statistics.fmean(totals)})
+    return rows
+
+
+async def bench_throughput(
+    latency: LatencyProfile, seed: int, levels: list[int], per_level: int, words: int
+) -> list[dict]:
+    """Tournaments per second for increasing numbers of concurrent tournaments."""
+    rows = []
+    for concurrency in levels:
+        tournament = AdversarialTournament(
+            model=create_simulated_model(latency, seed=seed, words=words)
+        )
+        count = max(per_level, concurrency)
+        tasks = [f"Throughput task {i}" for i in range(count)]
+
+        start = time.perf_counter()
+        failures = 0
+        async for outcome in tournament.run_many(tasks, max_concurrency=concurrency):
+            failures += isinstance(outcome, TournamentError)
+        elapsed = time.perf_counter() - start
+
+        rows.append(
+            {
+                "concurrency": concurrency,
+                "tournaments": count,
+                "failures": failures,
+                "elapsed_s": elapsed,
+                "tournaments_per_s": count / elapsed,
+            }
+        )
+    return rows
+
+
+def bench_serialization(result: TournamentResult, count: int) -> dict:
+    """Cost of saving ``count`` results with each output path."""
+    results = [result.model_copy(update={"task": f"Serialization task {i}"}) for i in range(count)]
+
+    def json_array(path: Path) -> None:
+        path.write_text(ujson.dumps([r.model_dump() for r in results], indent=2))
+
+    def jsonl(path: Path, compress: bool = False) -> None:
+        with JsonlSink(path, flush=False, compress=compress) as sink:
+            for r in results:
+                sink.write(r)
+
+    writers: dict[str, Callable[[Path], None]] = {
+        "json_array": json_array,
+        "jsonl": jsonl,
+        "jsonl_gzip": lambda path: jsonl(path, compress=True),
+    }
+
+    rows = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, write in writers.items():
+            path = Path(tmp) / name
+            start = time.perf_counter()
+            write(path)
+            elapsed = time.perf_counter() - start
+            path.unlink()
+
+            # Separate pass: tracing allocations slows the writer down
+            tracemalloc.start()
+            write(path)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            rows[name] = {
+                "ms": elapsed * 1e3,
+                "peak_mb": peak / 2**20,
+                "size_mb": path.stat().st_size / 2**20,
+            }
+            path.unlink()
+    return {"results": count, "writers": rows}
+
+
+async def bench_connection_pool(
+    tournaments: int, handshake_ms: float, latency_ms: float, words: int
+) -> dict:
+    """Connections opened by ``tournaments`` concurrent tournaments over real HTTP.
+
+    Each mode first runs a warm-up batch (building agents and filling the
+    pool), then the measured batch, so the numbers show steady state.
+    """
+    from pydantic_ai.models import cached_async_http_client
+
+    modes: dict[str, Callable[[], ModelClients]] = {
+        "per_call": lambda: ModelClients(HttpConfig(max_keepalive_connections=0)),
+        "pydantic_ai_default": lambda: ModelClients(client=cached_async_http_client(provider="openai")),
+        "single_pool": lambda: ModelClients(HttpConfig(pool_shards=1)),
+        "shared_pool": ModelClients,
+    }
+
+    rows = {}
+    saved = {name: os.environ.get(name) for name in ("OPENAI_BASE_URL", "OPENAI_API_KEY")}
+    async with FakeOpenAIServer(
+        words=words, handshake_s=handshake_ms / 1e3, latency_s=latency_ms / 1e3
+    ) as server:
+        os.environ["OPENAI_BASE_URL"] = server.base_url
+        os.environ.setdefault("OPENAI_API_KEY", "sk-fake")
+        try:
+            for mode, make_clients in modes.items():
+                tournament = AdversarialTournament(model="openai:gpt-4o-mini", clients=make_clients())
+                await asyncio.gather(*(tournament.run(f"Warm-up {i}") for i in range(tournaments)))
+
+                connections, requests = server.connections, server.requests
+                start = time.perf_counter()
+                await asyncio.gather(*(tournament.run(f"Pool task {i}") for i in range(tournaments)))
+                elapsed = time.perf_counter() - start
+                rows[mode] = {
+                    "connections": server.connections - connections,
+                    "requests": server.requests - requests,
+                    "elapsed_s": elapsed,
+                }
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+    return {
+        "tournaments": tournaments,
+        "handshake_ms": handshake_ms,
+        "latency_ms": latency_ms,
+        "modes": rows,
+    }
+
+
+def bench_persona_index(
+    personas: PersonaSet, count: int, lookups: int = 1000, batch: int = 1000, seed: int = 0
+) -> dict:
+    """Hit rates and lookup latency of a ``PersonaIndex`` holding ``count`` tasks."""
+    rng = random.Random(seed)
+    vocabulary = [f"term{i}" for i in range(5000)]
+
+    def words() -> list[str]:
+        return ["Write", "an", "email", "to", *rng.choices(vocabulary, k=24)]
+
+    stored = [words() for _ in range(count)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = PersonaIndex(Path(tmp) / "personas.sqlite")
+        start = time.perf_counter()
+        for offset in range(0, count, batch):
+            index.put_many(
+                ((" ".join(words), personas) for words in stored[offset : offset + batch]),
+                "bench",
+            )
+        fill_s = time.perf_counter() - start
+
+        def near_duplicate() -> str:
+            # The same template for another company: one word swapped
+            task = list(rng.choice(stored))
+            task[rng.randrange(4, len(task))] = "Globex"
+            return " ".join(task)
+
+        def unrelated() -> str:
+            return " ".join(words())
+
+        rates = {}
+        for kind, make_task in (("near_duplicate", near_duplicate), ("unrelated", unrelated)):
+            hits = sum(index.get(make_task(), "bench") is not None for _ in range(lookups))
+            rates[kind] = hits / lookups
+        stats = index.stats()
+        index.close()
+
+    return {
+        "tasks": count,
+        "puts_per_s": count / fill_s,
+        "hit_rate": rates,
+        "mean_lookup_ms": stats.mean_lookup_ms,
+        "p95_lookup_ms": stats.p95_lookup_ms,
+    }
+
+
+def bench_archive(result: TournamentResult, count: int, batch: int = 1000) -> dict:
+    """Insert rate and lookup latency of a ``ResultArchive`` holding ``count`` results."""
+    # Vary the searchable text so the full-text index is realistically selective
+    words = result.round_one.contestant_1_draft.split() or ["draft"]
+
+    def variant(i: int) -> TournamentResult:
+        topic = " ".join(words[(i * 7 + k) % len(words)] for k in range(8))
+        return result.model_copy(update={"task": f"Archive task {i}: {topic}"})
+
+    lookups: dict[str, Callable[[ResultArchive], object]] = {
+        "search": lambda archive: archive.search(f"{words[0]} {words[-1]}", limit=20),
+        "task": lambda archive: archive.find(task=variant(count // 2).task),
+        "persona": lambda archive: archive.find(persona=result.personas.judge.name),
+        "slowest": lambda archive: archive.slowest("round_three"),
+        "get": lambda archive: archive.get(count // 2),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp, ResultArchive(Path(tmp) / "archive.db") as archive:
+        start = time.perf_counter()
+        for offset in range(0, count, batch):
+            archive.add_many(variant(i) for i in range(offset, min(offset + batch, count)))
+        insert_s = time.perf_counter() - start
+
+        rows = {}
+        for name, lookup in lookups.items():
+            durations = []
+            for _ in range(20):
+                start = time.perf_counter()
+                lookup(archive)
+                durations.append(time.perf_counter() - start)
+            rows[name] = statistics.median(durations) * 1e3
+        size_mb = (Path(tmp) / "archive.db").stat().st_size / 2**20
+
+    return {
+        "results": count,
+        "inserts_per_s": count / insert_s,
+        "size_mb": size_mb,
+        "lookup_ms": rows,
+    }
+
+
+def bench_startup(iterations: int) -> dict:
+    """CLI startup cost, as a short-lived scheduler job would pay it."""
+    help_durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "adversarial_tournament.main", "--help"],
+            capture_output=True,
+            check=True,
+        )
+        help_durations.append(time.perf_counter() - start)
+
+    importtime = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import adversarial_tournament.main"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    import_us = next(
+        int(line.split("|")[1])
+        for line in importtime.splitlines()
+        if line.rstrip().endswith("| adversarial_tournament.main")
+    )
+
+    return {
+        "iterations": iterations,
+        "help_ms": statistics.median(help_durations) * 1e3,
+        "import_ms": import_us / 1e3,
+    }
+
+
+async def run_suite(args: argparse.Namespace) -> dict:
+    latency = LatencyProfile(
+        first_token_s=args.first_token,
+        sigma=args.sigma,
+        per_token_s=args.per_token,
+    )
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "latency": {
+                "first_token_s": latency.first_token_s,
+                "sigma": latency.sigma,
+                "per_token_s": latency.per_token_s,
+            },
+            "words": args.words,
+        },
+        "overhead": await bench_overhead(args.overhead_iterations, args.words),
+        "critical_path": await bench_critical_path(
+            latency, args.seed, args.iterations, args.words
+        ),
+        "fan_out": await bench_fan_out(
+            latency, args.seed, args.iterations, args.words, args.max_contestants
+        ),
+        "throughput": await bench_throughput(
+            latency, args.seed, levels, args.per_level, args.words
+        ),
+        "serialization": bench_serialization(
+            await AdversarialTournament(model=create_simulated_model(words=args.words)).run(
+                "Serialization task"
+            ),
+            args.serialization_results,
+        ),
+        "connection_pool": await bench_connection_pool(
+            args.pool_tournaments, args.handshake_ms, args.pool_latency_ms, args.words
+        ),
+        "persona_index": bench_persona_index(
+            (
+                await AdversarialTournament(model=create_simulated_model(words=args.words)).run(
+                    "Persona index task"
+                )
+            ).personas,
+            args.persona_index_tasks,
+        ),
+        "archive": bench_archive(
+            await AdversarialTournament(model=create_simulated_model(words=args.words)).run(
+                "Archive task"
+            ),
+            args.archive_results,
+        ),
+        "startup": bench_startup(args.startup_iterations),
+    }
+
+
+def _print_report(report: dict) -> None:
+    overhead = report["overhead"]
+    print(f"Orchestration overhead: {overhead['mean_ms']:.2f} ms/tournament (median {overhead['median_ms']:.2f})")
+    print()
+    print("Critical path (mean seconds):")
+    for mode, row in report["critical_path"].items():
+        phases = ", ".join(f"{name} {value:.2f}" for name, value in row["phases_s"].items())
+        print(f"  {mode:<17} total {row['total_s']:.2f}  [{phases}]")
+    print()
+    print("Fan-out (mean seconds):")
+    for row in report["fan_out"]:
+        print(f"  {row['contestants']} contestants: {row['total_s']:.2f}")
+    print()
+    print("Throughput:")
+    for row in report["throughput"]:
+        print(
+            f"  concurrency {row['concurrency']:>3}: {row['tournaments_per_s']:7.2f} tournaments/s"
+            f" ({row['tournaments']} in {row['elapsed_s']:.2f}s)"
+        )
+    print()
+    serialization = report["serialization"]
+    print(f"Serialization ({serialization['results']} results):")
+    for name, row in serialization["writers"].items():
+        print(
+            f"  {name:<11} {row['ms']:8.1f} ms  peak {row['peak_mb']:7.2f} MB  size {row['size_mb']:7.2f} MB"
+        )
+    print()
+    pool = report["connection_pool"]
+    print(
+        f"Connection pool ({pool['tournaments']} concurrent tournaments, "
+        f"{pool['handshake_ms']:g} ms handshake, {pool['latency_ms']:g} ms latency):"
+    )
+    for mode, row in pool["modes"].items():
+        print(
+            f"  {mode:<19} {row['connections']:4d} connections for {row['requests']} requests"
+            f"  {row['elapsed_s']:.2f}s"
+        )
+    print()
+    index = report["persona_index"]
+    print(
+        f"Persona index ({index['tasks']} tasks): {index['puts_per_s']:.0f} puts/s, hit rate"
+        f" near-duplicate {index['hit_rate']['near_duplicate']:.0%} /"
+        f" unrelated {index['hit_rate']['unrelated']:.0%},"
+        f" lookup mean {index['mean_lookup_ms']:.2f} ms, p95 {index['p95_lookup_ms']:.2f} ms"
+    )
+    print()
+    archive = report["archive"]
+    lookups = ", ".join(f"{name} {ms:.2f}" for name, ms in archive["lookup_ms"].items())
+    print(
+        f"Archive ({archive['results']} results, {archive['size_mb']:.1f} MB):"
+        f" {archive['inserts_per_s']:.0f} inserts/s, lookups (median ms) [{lookups}]"
+    )
+    print()
+    startup = report["startup"]
+    print(f"Startup: --help {startup['help_ms']:.1f} ms, CLI import {startup['import_ms']:.1f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline tournament benchmark suite")
+    parser.add_argument("--output", type=Path, metavar="FILE", help="Write results as JSON to FILE")
+    parser.add_argument("--seed", type=int, default=0, help="Latency distribution seed (default: 0)")
+    parser.add_argument("--first-token", type=float, default=0.4, metavar="S", help="Median time to first token (default: 0.4)")
+    parser.add_argument("--sigma", type=float, default=0.35, help="Log-normal spread of time to first token (default: 0.35)")
+    parser.add_argument("--per-token", type=float, default=0.004, metavar="S", help="Seconds per output token (default: 0.004)")
+    parser.add_argument("--words", type=int, default=40, help="Words per generated text field (default: 40)")
+    parser.add_argument("--iterations", type=int, default=3, help="Tournaments per critical-path mode (default: 3)")
+    parser.add_argument("--overhead-iterations", type=int, default=50, help="Tournaments for the overhead measurement (default: 50)")
+    parser.add_argument("--max-contestants", type=int, default=5, help="Largest fan-out measured (default: 5)")
+    parser.add_argument("--concurrency", default="1,2,4,8,16", help="Comma-separated concurrency levels (default: 1,2,4,8,16)")
+    parser.add_argument("--per-level", type=int, default=8, help="Tournaments per concurrency level (default: 8)")
+    parser.add_argument("--serialization-results", type=int, default=1000, help="Results written by the serialization measurement (default: 1000)")
+    parser.add_argument("--pool-tournaments", type=int, default=32, help="Concurrent tournaments in the connection pool measurement (default: 32)")
+    parser.add_argument("--handshake-ms", type=float, default=50.0, help="Simulated TCP+TLS handshake per new connection (default: 50)")
+    parser.add_argument("--pool-latency-ms", type=float, default=200.0, help="Simulated response latency of the fake server (default: 200)")
+    parser.add_argument("--persona-index-tasks", type=int, default=100_000, help="Tasks stored by the persona index measurement (default: 100000)")
+    parser.add_argument("--archive-results", type=int, default=20000, help="Results inserted by the archive measurement (default: 20000)")
+    parser.add_argument("--startup-iterations", type=int, default=5, help="CLI launches for the startup measurement (default: 5)")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_suite(args))
+    _print_report(report)
+
+    if args.output:
+        args.output.write_text(ujson.dumps(report, indent=2))
+        print(f"\nSaved results to: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,44 @@
-"""Adversarial Tournament - Multi-agent adversarial prompting with Pydantic AI."""
+"""Adversarial Tournament - Multi-agent adversarial prompting with Pydantic AI.
 
-from adversarial_tournament.tournament import AdversarialTournament
-from adversarial_tournament.models.tournament import TournamentResult
-from adversarial_tournament.models.persona import Persona, PersonaSet
+The public names below are imported on first access, so importing the
+package (or its CLI) does not load pydantic-ai until a tournament is built.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from adversarial_tournament.tournament import AdversarialTournament
+    from adversarial_tournament.models.tournament import TournamentResult
+    from adversarial_tournament.models.persona import Persona, PersonaSet
+    from adversarial_tournament.resilience import ResiliencePolicy
+
+# Public name -> module that defines it
+_LAZY_IMPORTS = {
+    "AdversarialTournament": "adversarial_tournament.tournament",
+    "TournamentResult": "adversarial_tournament.models.tournament",
+    "Persona": "adversarial_tournament.models.persona",
+    "PersonaSet": "adversarial_tournament.models.persona",
+    "ResiliencePolicy": "adversarial_tournament.resilience",
+}
 
 __all__ = [
     "AdversarialTournament",
     "TournamentResult",
     "Persona",
     "PersonaSet",
+    "ResiliencePolicy",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -2,10 +2,19 @@
 
 from adversarial_tournament.agents.persona_generator import create_persona_generator
 from adversarial_tournament.agents.contestant import create_contestant_agent
-from adversarial_tournament.agents.judge import create_judge_agent
+from adversarial_tournament.agents.judge import create_judge_agent, create_draft_judge_agent
+from adversarial_tournament.agents.synthesizer import (
+    create_synthesizer_agent,
+    create_patch_synthesizer_agent,
+)
+from adversarial_tournament.agents.registry import AgentRegistry
 
 __all__ = [
     "create_persona_generator",
     "create_contestant_agent",
     "create_judge_agent",
+    "create_draft_judge_agent",
+    "create_synthesizer_agent",
+    "create_patch_synthesizer_agent",
+    "AgentRegistry",
 ]
@@ -1,6 +1,7 @@
 """Contestant Agent Factory - Creates dynamic contestant agents from personas."""
 
 from pydantic_ai import Agent
+from pydantic_ai.models import Model
 
 from adversarial_tournament.models.persona import Persona
 from adversarial_tournament.prompts.templates import build_contestant_prompt
@@ -8,7 +9,7 @@ from adversarial_tournament.prompts.templates import build_contestant_prompt
 
 def create_contestant_agent(
     persona: Persona,
-    model: str = "openai:gpt-4o-mini",
+    model: Model | str = "openai:gpt-4o-mini",
 ) -> Agent[None, str]:
     """Create a contestant agent from a persona definition.
 
@@ -16,7 +17,7 @@ def create_contestant_agent(
 
     Args:
         persona: The persona definition for this contestant.
-        model: The model identifier (e.g., 'openai:gpt-4o-mini').
+        model: The model identifier (e.g., 'openai:gpt-4o-mini') or Model instance.
 
     Returns:
         A configured Pydantic AI Agent for content generation.
@@ -1,15 +1,19 @@
 """Judge Agent Factory - Creates dynamic adversarial judge agents from personas."""
 
-from pydantic_ai import Agent
+from pydantic_ai import Agent, ModelRetry
+from pydantic_ai.models import Model
 
 from adversarial_tournament.models.persona import Persona
-from adversarial_tournament.models.tournament import RoundTwoCritique
+from adversarial_tournament.models.tournament import DraftCritique, RoundTwoCritique
 from adversarial_tournament.prompts.templates import build_judge_prompt
 
 
 def create_judge_agent(
     persona: Persona,
-    model: str = "openai:gpt-4o-mini",
+    model: Model | str = "openai:gpt-4o-mini",
+    shared_prefix: bool = False,
+    contestants: int = 2,
+    require_scores: bool = False,
 ) -> Agent[None, RoundTwoCritique]:
     """Create a judge agent from a persona definition.
 
@@ -17,13 +21,70 @@ def create_judge_agent(
 
     Args:
         persona: The persona definition for this judge.
-        model: The model identifier (e.g., 'openai:gpt-4o-mini').
+        model: The model identifier (e.g., 'openai:gpt-4o-mini') or Model instance.
+        shared_prefix: Leave the persona out of the system prompt, for prompts
+            built with the "shared_prefix" layout (which carry it at the end).
+        contestants: Number of drafts every critique must cover.
+        require_scores: Ask the model again unless it scores every draft (for
+            tournaments that act on the scores); otherwise incomplete scores
+            are dropped.
 
     Returns:
         A configured Pydantic AI Agent for adversarial critique.
     """
-    return Agent(
+    agent = Agent(
         model,
         output_type=RoundTwoCritique,
+        instructions=None if shared_prefix else build_judge_prompt(persona),
+    )
+
+    @agent.output_validator
+    def check_counts(critique: RoundTwoCritique) -> RoundTwoCritique:
+        if len(critique.critiques) != contestants:
+            raise ModelRetry(
+                f"Critique all {contestants} drafts: extra_critiques needs "
+                f"{contestants - 2} entries, for drafts 3 to {contestants} in order."
+            )
+        if len(critique.scores) != contestants:
+            if require_scores:
+                raise ModelRetry(
+                    f"Score all {contestants} drafts: scores needs {contestants} entries."
+                )
+            return critique.model_copy(update={"scores": []})
+        return critique
+
+    return agent
+
+
+def create_draft_judge_agent(
+    persona: Persona,
+    model: Model | str = "openai:gpt-4o-mini",
+    require_scores: bool = False,
+) -> Agent[None, DraftCritique]:
+    """Create a judge agent that critiques one draft at a time.
+
+    Used by pipelined tournaments, where each draft is critiqued as soon as
+    it is written instead of waiting for both.
+
+    Args:
+        persona: The persona definition for this judge.
+        model: The model identifier (e.g., 'openai:gpt-4o-mini') or Model instance.
+        require_scores: Ask the model again unless it scores the draft (for
+            tournaments that act on the scores).
+
+    Returns:
+        A configured Pydantic AI Agent for single-draft critique.
+    """
+    agent = Agent(
+        model,
+        output_type=DraftCritique,
         instructions=build_judge_prompt(persona),
     )
+
+    @agent.output_validator
+    def check_score(critique: DraftCritique) -> DraftCritique:
+        if require_scores and critique.score is None:
+            raise ModelRetry("Score the draft from 0 to 10.")
+        return critique
+
+    return agent
@@ -1,26 +1,45 @@
 """Persona Generator Agent - Analyzes tasks and creates appropriate personas."""
 
-from pydantic_ai import Agent
+from pydantic_ai import Agent, ModelRetry
+from pydantic_ai.models import Model
 
 from adversarial_tournament.models.persona import PersonaSet
 from adversarial_tournament.prompts.templates import build_persona_generator_prompt
 
 
-def create_persona_generator(model: str = "openai:gpt-4o-mini") -> Agent[None, PersonaSet]:
+def create_persona_generator(
+    model: Model | str = "openai:gpt-4o-mini",
+    contestants: int = 2,
+    judges: int = 1,
+) -> Agent[None, PersonaSet]:
     """Create the persona generator agent.
 
-    This agent analyzes the input task and generates three personas:
-    - Two contestant personas with complementary expertise
-    - One adversarial judge persona representing affected stakeholders
+    This agent analyzes the input task and generates the tournament personas:
+    - Contestant personas with complementary expertise (two by default)
+    - Adversarial judge personas representing affected stakeholders (one by default)
 
     Args:
-        model: The model identifier (e.g., 'openai:gpt-4o-mini').
+        model: The model identifier (e.g., 'openai:gpt-4o-mini') or Model instance.
+        contestants: Number of contestant personas to generate (at least 2).
+        judges: Number of judge personas to generate (at least 1).
 
     Returns:
         A configured Pydantic AI Agent for persona generation.
     """
-    return Agent(
+    agent = Agent(
         model,
         output_type=PersonaSet,
-        instructions=build_persona_generator_prompt(),
+        instructions=build_persona_generator_prompt(contestants, judges),
     )
+
+    @agent.output_validator
+    def check_counts(personas: PersonaSet) -> PersonaSet:
+        if len(personas.contestants) != contestants or len(personas.judges) != judges:
+            raise ModelRetry(
+                f"Create exactly {contestants} contestants and {judges} judges: "
+                f"extra_contestants needs {contestants - 2} entries and "
+                f"extra_judges needs {judges - 1}."
+            )
+        return personas
+
+    return agent
@@ -0,0 +1,91 @@
+"""Agent Registry - Reuses built agents across tournament runs."""
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+from pydantic_ai import Agent
+from pydantic_ai.models import Model
+
+from adversarial_tournament.config import DEFAULT_AGENT_REGISTRY_SIZE
+from adversarial_tournament.models.persona import Persona
+from adversarial_tournament.utils import model_id
+
+AgentT = TypeVar("AgentT", bound=Agent[Any, Any])
+
+
+def persona_fingerprint(personas: Sequence[Persona]) -> str:
+    """Hash the persona definitions an agent's instructions are built from."""
+    digest = hashlib.sha256()
+    for persona in personas:
+        digest.update(persona.model_dump_json().encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class AgentRegistry:
+    """LRU cache of built agents keyed by (role, persona fingerprint, model).
+
+    Building a pydantic-ai ``Agent`` derives the output schema and resolves the
+    model/provider every time. Agents are stateless between runs, so repeated
+    and batched tournaments that share a role, personas and model can reuse
+    the same instance.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_AGENT_REGISTRY_SIZE):
+        """Create an empty registry.
+
+        Args:
+            max_size: Maximum number of agents kept before LRU eviction.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._agents: OrderedDict[tuple[str, str, str, int], Agent[Any, Any]] = OrderedDict()
+
+    def get(
+        self,
+        role: str,
+        model: Model | str,
+        personas: Sequence[Persona],
+        factory: Callable[[], AgentT],
+    ) -> AgentT:
+        """Return the cached agent for this key, building it with ``factory`` on a miss.
+
+        Args:
+            role: The tournament role the agent plays (e.g. 'judge').
+            model: The model the agent runs on.
+            personas: The personas the agent's instructions are built from.
+            factory: Builds the agent when it is not cached.
+
+        Returns:
+            The cached or newly built agent.
+        """
+        # Model instances are keyed by identity as well as name; the cached agent
+        # holds a reference to its model, so the id cannot be reused meanwhile.
+        instance_id = 0 if isinstance(model, str) else id(model)
+        key = (role, persona_fingerprint(personas), model_id(model), instance_id)
+
+        agent = self._agents.get(key)
+        if agent is not None:
+            self._agents.move_to_end(key)
+            self.hits += 1
+            return agent  # type: ignore[return-value]
+
+        self.misses += 1
+        agent = factory()
+        self._agents[key] = agent
+        if len(self._agents) > self.max_size:
+            self._agents.popitem(last=False)
+        return agent
+
+    def clear(self) -> None:
+        """Drop every cached agent."""
+        self._agents.clear()
+
+    def __len__(self) -> int:
+        return len(self._agents)
@@ -0,0 +1,87 @@
+"""Synthesizer Agent Factory - Creates the Round 3 collaboration agent."""
+
+from collections.abc import Sequence
+
+from pydantic_ai import Agent, ModelRetry
+from pydantic_ai.models import Model
+
+from adversarial_tournament.models.persona import Persona
+from adversarial_tournament.models.tournament import RoundThreeOutput, RoundThreePatch
+from adversarial_tournament.prompts.templates import build_synthesizer_prompt
+
+
+def create_synthesizer_agent(
+    lead_persona: Persona,
+    partner_persona: Persona,
+    model: Model | str = "openai:gpt-4o-mini",
+    shared_prefix: bool = False,
+    extra_partners: Sequence[Persona] = (),
+) -> Agent[None, RoundThreeOutput]:
+    """Create the synthesis agent for Round 3.
+
+    The lead contestant lends its identity to the agent, which merges every
+    draft and the judges' feedback into one final output.
+
+    Args:
+        lead_persona: The contestant persona leading the synthesis.
+        partner_persona: The contestant persona collaborating on the synthesis.
+        model: The model identifier (e.g., 'openai:gpt-4o-mini') or Model instance.
+        shared_prefix: Leave the personas out of the system prompt, for prompts
+            built with the "shared_prefix" layout (which carry them at the end).
+        extra_partners: Further contestants collaborating on the synthesis.
+
+    Returns:
+        A configured Pydantic AI Agent for the final synthesis.
+    """
+    return Agent(
+        model,
+        output_type=RoundThreeOutput,
+        instructions=(
+            None
+            if shared_prefix
+            else build_synthesizer_prompt(lead_persona, partner_persona, *extra_partners)
+        ),
+    )
+
+
+def create_patch_synthesizer_agent(
+    lead_persona: Persona,
+    partner_persona: Persona,
+    model: Model | str = "openai:gpt-4o-mini",
+    shared_prefix: bool = False,
+    extra_partners: Sequence[Persona] = (),
+) -> Agent[None, RoundThreePatch]:
+    """Create the patch-based synthesis agent for Round 3.
+
+    Instead of writing the final output, the agent picks one draft as the
+    base and returns edits against it, which the tournament applies locally.
+
+    Args:
+        lead_persona: The contestant persona leading the synthesis.
+        partner_persona: The contestant persona collaborating on the synthesis.
+        model: The model identifier (e.g., 'openai:gpt-4o-mini') or Model instance.
+        shared_prefix: Leave the personas out of the system prompt, for prompts
+            built with the "shared_prefix" layout (which carry them at the end).
+        extra_partners: Further contestants collaborating on the synthesis.
+
+    Returns:
+        A configured Pydantic AI Agent for patch-based synthesis.
+    """
+    drafts = 2 + len(extra_partners)
+    agent = Agent(
+        model,
+        output_type=RoundThreePatch,
+        instructions=(
+            None
+            if shared_prefix
+            else build_synthesizer_prompt(lead_persona, partner_persona, *extra_partners)
+        ),
+    )
+
+    @agent.output_validator
+    def check_base_draft(patch: RoundThreePatch) -> RoundThreePatch:
+        if patch.base_draft > drafts:
+            raise ModelRetry(f"base_draft must be a draft number from 1 to {drafts}.")
+        return patch
+
+    return agent
@@ -0,0 +1,358 @@
+"""Result Archive - Indexed SQLite store of tournament results.
+
+Results are stored once (compressed JSON) with the columns worth querying
+pulled out and indexed: the task, final output and key issues in an FTS5
+full-text index, per-phase timings, and the personas, which are normalized
+into their own table and deduplicated, so a persona reused by thousands of
+tournaments is stored once.
+"""
+
+import hashlib
+import sqlite3
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from adversarial_tournament.models.persona import Persona
+from adversarial_tournament.models.tournament import TournamentResult
+from adversarial_tournament.utils import normalize_task
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS personas (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    role TEXT NOT NULL,
+    persona_type TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS personas_name ON personas (name COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS tournaments (
+    id INTEGER PRIMARY KEY,
+    task TEXT NOT NULL,
+    task_key TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    model TEXT,
+    contestants INTEGER NOT NULL,
+    judges INTEGER NOT NULL,
+    promoted_draft INTEGER,
+    final_output TEXT NOT NULL,
+    key_issues TEXT NOT NULL,
+    total_duration_s REAL,
+    input_tokens INTEGER,
+    output_tokens INTEGER,
+    result BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tournaments_task_key ON tournaments (task_key);
+CREATE INDEX IF NOT EXISTS tournaments_created_at ON tournaments (created_at);
+
+CREATE TABLE IF NOT EXISTS tournament_personas (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id),
+    slot TEXT NOT NULL,
+    persona_id INTEGER NOT NULL REFERENCES personas (id),
+    PRIMARY KEY (tournament_id, slot)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tournament_personas_persona ON tournament_personas (persona_id);
+
+CREATE TABLE IF NOT EXISTS phase_metrics (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id),
+    phase TEXT NOT NULL,
+    started_at_s REAL NOT NULL,
+    duration_s REAL NOT NULL,
+    PRIMARY KEY (tournament_id, phase)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS phase_metrics_duration ON phase_metrics (phase, duration_s);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS tournaments_fts USING fts5 (
+    task, final_output, key_issues,
+    content='tournaments', content_rowid='id'
+);
+"""
+
+
+class ArchiveEntry(BaseModel):
+    """Summary of one archived tournament, as returned by searches."""
+
+    id: int = Field(description="Archive id of the tournament")
+    task: str = Field(description="The original task description")
+    created_at: float = Field(description="When the result was archived (Unix time)")
+    model: str | None = Field(default=None, description="The model the tournament ran on")
+    total_duration_s: float | None = Field(default=None, description="Wall-clock duration")
+    snippet: str | None = Field(
+        default=None, description="Matching excerpt, with matches in [brackets] (searches only)"
+    )
+
+
+def _persona_slots(result: TournamentResult) -> Iterator[tuple[str, Persona]]:
+    personas = result.personas
+    for number, persona in enumerate(personas.contestants, start=1):
+        yield f"contestant_{number}", persona
+    for number, persona in enumerate(personas.judges, start=1):
+        yield f"judge_{number}", persona
+
+
+class ResultArchive:
+    """SQLite archive of tournament results with full-text search.
+
+    Lookups by id, exact task, persona and slowest phase use B-tree indexes,
+    and text search uses FTS5 ranked by bm25, so queries stay fast as the
+    archive grows to millions of rows.
+    """
+
+    # Newest full-text matches ranked per search
+    RANK_WINDOW = 10_000
+
+    def __init__(self, path: str | Path):
+        """Open (or create) an archive.
+
+        Args:
+            path: SQLite database file, or ':memory:' for a process-local archive.
+        """
+        self.path = str(path)
+        self._conn = sqlite3.connect(self.path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def add(self, result: TournamentResult) -> int:
+        """Archive one result and return its id."""
+        return self.add_many([result])[0]
+
+    def add_many(self, results: Iterable[TournamentResult]) -> list[int]:
+        """Archive many results in one transaction and return their ids."""
+        ids = []
+        with self._transaction():
+            for result in results:
+                ids.append(self._insert(result))
+        return ids
+
+    def _insert(self, result: TournamentResult) -> int:
+        metrics = result.metrics
+        key_issues = "\n".join(result.round_two.key_issues) if result.round_two else ""
+        cursor = self._conn.execute(
+            """INSERT INTO tournaments (
+                task, task_key, created_at, model, contestants, judges, promoted_draft,
+                final_output, key_issues, total_duration_s, input_tokens, output_tokens, result
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                result.task,
+                self._task_key(result.task),
+                time.time(),
+                metrics.model if metrics else None,
+                len(result.personas.contestants),
+                len(result.personas.judges),
+                result.promoted_draft,
+                result.round_three.final_output,
+                key_issues,
+                metrics.total_duration_s if metrics else None,
+                metrics.input_tokens if metrics else None,
+                metrics.output_tokens if metrics else None,
+                zlib.compress(result.model_dump_json().encode()),
+            ),
+        )
+        tournament_id = cursor.lastrowid
+        assert tournament_id is not None
+
+        self._conn.execute(
+            "INSERT INTO tournaments_fts (rowid, task, final_output, key_issues) VALUES (?, ?, ?, ?)",
+            (tournament_id, result.task, result.round_three.final_output, key_issues),
+        )
+        self._conn.executemany(
+            "INSERT INTO tournament_personas (tournament_id, slot, persona_id) VALUES (?, ?, ?)",
+            [
+                (tournament_id, slot, self._persona_id(persona))
+                for slot, persona in _persona_slots(result)
+            ],
+        )
+        if metrics:
+            self._conn.executemany(
+                """INSERT OR REPLACE INTO phase_metrics (tournament_id, phase, started_at_s, duration_s)
+                VALUES (?, ?, ?, ?)""",
+                [(tournament_id, p.phase, p.started_at_s, p.duration_s) for p in metrics.phases],
+            )
+        return tournament_id
+
+    def _persona_id(self, persona: Persona) -> int:
+        """Return the id of an identical stored persona, storing it first if new."""
+        data = persona.model_dump_json()
+        fingerprint = hashlib.sha256(data.encode()).hexdigest()
+        self._conn.execute(
+            """INSERT OR IGNORE INTO personas (fingerprint, name, role, persona_type, data)
+            VALUES (?, ?, ?, ?, ?)""",
+            (fingerprint, persona.name, persona.role, persona.persona_type, data),
+        )
+        row = self._conn.execute(
+            "SELECT id FROM personas WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+        return row[0]
+
+    @staticmethod
+    def _task_key(task: str) -> str:
+        return hashlib.sha256(normalize_task(task).encode()).hexdigest()
+
+    def get(self, tournament_id: int) -> TournamentResult | None:
+        """Return an archived result, or None if there is no such id."""
+        row = self._conn.execute(
+            "SELECT result FROM tournaments WHERE id = ?", (tournament_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return TournamentResult.model_validate_json(zlib.decompress(row[0]))
+
+    def search(self, query: str, limit: int | None = 20) -> list[ArchiveEntry]:
+        """Full-text search over tasks, final outputs and key issues, best matches first.
+
+        Ranking scores every candidate, so with a ``limit``, for terms matching
+        more than ``RANK_WINDOW`` results only the newest ``RANK_WINDOW`` are
+        ranked; that keeps searches for common words fast on huge archives.
+        Without a limit every match is returned.
+
+        Args:
+            query: An FTS5 query (e.g. 'outage apology', '"root cause" NOT refund').
+            limit: Maximum number of entries returned, or None for all.
+
+        Raises:
+            ValueError: If the query is not valid FTS5 syntax.
+        """
+        try:
+            floor = None
+            if limit is not None:
+                # Walking the doclist newest-first is cheap; scoring it is not
+                floor = self._conn.execute(
+                    """SELECT rowid FROM tournaments_fts WHERE tournaments_fts MATCH ?
+                    ORDER BY rowid DESC LIMIT 1 OFFSET ?""",
+                    (query, self.RANK_WINDOW - 1),
+                ).fetchone()
+            rows = self._conn.execute(
+                """SELECT t.id, t.task, t.created_at, t.model, t.total_duration_s, m.snippet
+                FROM (
+                    SELECT rowid, rank, snippet(tournaments_fts, -1, '[', ']', '...', 16) AS snippet
+                    FROM tournaments_fts
+                    WHERE tournaments_fts MATCH ? AND rowid >= ?
+                    ORDER BY rank LIMIT ?
+                ) AS m
+                JOIN tournaments AS t ON t.id = m.rowid
+                ORDER BY m.rank""",
+                (query, floor[0] if floor else 0, -1 if limit is None else limit),
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"invalid search query {query!r}: {e}") from e
+        return [self._entry(row[:5], snippet=row[5]) for row in rows]
+
+    def find(
+        self, task: str | None = None, persona: str | None = None, limit: int | None = 20
+    ) -> list[ArchiveEntry]:
+        """Find tournaments by exact task and/or persona name, newest first.
+
+        Args:
+            task: The task description (compared after normalizing whitespace).
+            persona: Name of a persona that took part (case-insensitive).
+            limit: Maximum number of entries returned, or None for all.
+        """
+        columns = "t.id, t.task, t.created_at, t.model, t.total_duration_s"
+        persona_ids = "SELECT id FROM personas WHERE name = ? COLLATE NOCASE"
+        # Drive each query from its most selective index so it can stop at the limit
+        if task is not None:
+            sql = f"SELECT {columns} FROM tournaments AS t WHERE t.task_key = ?"
+            params: list[object] = [self._task_key(task)]
+            if persona is not None:
+                sql += f""" AND EXISTS (SELECT 1 FROM tournament_personas AS tp
+                    WHERE tp.tournament_id = t.id AND tp.persona_id IN ({persona_ids}))"""
+                params.append(persona)
+        elif persona is not None and limit is not None:
+            # One ordered index scan per stored variant of the persona, merged here
+            ids: set[int] = set()
+            for (persona_id,) in self._conn.execute(persona_ids, (persona,)).fetchall():
+                ids.update(
+                    row[0]
+                    for row in self._conn.execute(
+                        """SELECT tournament_id FROM tournament_personas WHERE persona_id = ?
+                        ORDER BY tournament_id DESC LIMIT ?""",
+                        (persona_id, limit),
+                    )
+                )
+            newest = sorted(ids, reverse=True)[:limit]
+            sql = f"SELECT {columns} FROM tournaments AS t WHERE t.id IN ({', '.join('?' * len(newest))})"
+            params = list(newest)
+        elif persona is not None:
+            sql = f"""SELECT DISTINCT {columns} FROM tournament_personas AS tp
+                JOIN tournaments AS t ON t.id = tp.tournament_id
+                WHERE tp.persona_id IN ({persona_ids})"""
+            params = [persona]
+        else:
+            sql = f"SELECT {columns} FROM tournaments AS t"
+            params = []
+
+        rows = self._conn.execute(
+            f"{sql} ORDER BY t.id DESC LIMIT ?", (*params, -1 if limit is None else limit)
+        ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def slowest(self, phase: str, limit: int | None = 20) -> list[ArchiveEntry]:
+        """Find the tournaments whose ``phase`` took longest, slowest first.
+
+        Args:
+            phase: The tournament phase (e.g. 'round_three').
+            limit: Maximum number of entries returned, or None for all.
+        """
+        rows = self._conn.execute(
+            """SELECT t.id, t.task, t.created_at, t.model, t.total_duration_s
+            FROM phase_metrics AS pm
+            JOIN tournaments AS t ON t.id = pm.tournament_id
+            WHERE pm.phase = ?
+            ORDER BY pm.duration_s DESC LIMIT ?""",
+            (phase, -1 if limit is None else limit),
+        ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def export(self, ids: Iterable[int]) -> Iterator[TournamentResult]:
+        """Yield the archived results with the given ids (unknown ids are skipped)."""
+        for tournament_id in ids:
+            result = self.get(tournament_id)
+            if result is not None:
+                yield result
+
+    def persona_count(self) -> int:
+        """Number of distinct personas stored."""
+        return self._conn.execute("SELECT COUNT(*) FROM personas").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database."""
+        self._conn.close()
+
+    def __enter__(self) -> "ResultArchive":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM tournaments").fetchone()[0]
+
+    @staticmethod
+    def _entry(row: tuple, snippet: str | None = None) -> ArchiveEntry:
+        tournament_id, task, created_at, model, total_duration_s = row
+        return ArchiveEntry(
+            id=tournament_id,
+            task=task,
+            created_at=created_at,
+            model=model,
+            total_duration_s=total_duration_s,
+            snippet=snippet,
+        )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """BEGIN/COMMIT around a block, rolling back if it raises."""
+        self._conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
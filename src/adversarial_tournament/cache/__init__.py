@@ -0,0 +1,13 @@
+"""On-disk caches that take repeated work off the tournament critical path."""
+
+from adversarial_tournament.cache.persona_cache import PersonaCache
+from adversarial_tournament.cache.persona_index import PersonaIndex, PersonaIndexStats
+from adversarial_tournament.cache.response_cache import CachingModel, ResponseCache
+
+__all__ = [
+    "CachingModel",
+    "PersonaCache",
+    "PersonaIndex",
+    "PersonaIndexStats",
+    "ResponseCache",
+]
@@ -0,0 +1,123 @@
+"""Persona Cache - Persists generated PersonaSets in SQLite with LRU/TTL eviction."""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+
+from pydantic_ai.models import Model
+
+from adversarial_tournament.config import DEFAULT_PERSONA_CACHE_MAX_ENTRIES
+from adversarial_tournament.models.persona import PersonaSet
+from adversarial_tournament.prompts.templates import build_persona_generator_prompt
+from adversarial_tournament.utils import model_id, normalize_task
+
+
+class PersonaCache:
+    """SQLite-backed cache of Phase 0 results.
+
+    Entries are keyed by the normalized task text, the model and a hash of the
+    persona generator instructions, so changing the prompt template or model
+    never serves stale personas. The least recently used entries are evicted
+    once ``max_entries`` is exceeded, and entries older than ``ttl`` seconds
+    are treated as misses.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = DEFAULT_PERSONA_CACHE_MAX_ENTRIES,
+        ttl: float | None = None,
+    ):
+        """Open (or create) a persona cache.
+
+        Args:
+            path: SQLite database file, or ':memory:' for a process-local cache.
+            max_entries: Maximum number of entries kept before LRU eviction.
+            ttl: Maximum entry age in seconds, or None to never expire.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._conn = sqlite3.connect(self.path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS personas (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS personas_accessed_at ON personas (accessed_at)"
+        )
+
+    @staticmethod
+    def make_key(task: str, model: Model | str, instructions: str | None = None) -> str:
+        """Build the cache key for a task, model and generator instructions."""
+        if instructions is None:
+            instructions = build_persona_generator_prompt()
+        prompt_hash = hashlib.sha256(instructions.encode()).hexdigest()
+        raw = "\0".join([normalize_task(task), model_id(model), prompt_hash])
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(
+        self, task: str, model: Model | str, instructions: str | None = None
+    ) -> PersonaSet | None:
+        """Return the cached personas for a task, or None on a miss."""
+        key = self.make_key(task, model, instructions)
+        row = self._conn.execute(
+            "SELECT value, created_at FROM personas WHERE key = ?", (key,)
+        ).fetchone()
+
+        now = time.time()
+        if row is None or (self.ttl is not None and now - row[1] > self.ttl):
+            if row is not None:
+                self._conn.execute("DELETE FROM personas WHERE key = ?", (key,))
+            self.misses += 1
+            return None
+
+        self._conn.execute(
+            "UPDATE personas SET accessed_at = ? WHERE key = ?", (now, key)
+        )
+        self.hits += 1
+        return PersonaSet.model_validate_json(row[0])
+
+    def put(
+        self,
+        task: str,
+        model: Model | str,
+        personas: PersonaSet,
+        instructions: str | None = None,
+    ) -> None:
+        """Store personas for a task, evicting the least recently used overflow."""
+        key = self.make_key(task, model, instructions)
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO personas (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, personas.model_dump_json(), now, now),
+        )
+        self._conn.execute(
+            """DELETE FROM personas WHERE key IN (
+                SELECT key FROM personas ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )""",
+            (self.max_entries,),
+        )
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._conn.execute("DELETE FROM personas")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM personas").fetchone()[0]
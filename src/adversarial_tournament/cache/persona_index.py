@@ -0,0 +1,321 @@
+"""Persona Index - Reuses PersonaSets across near-duplicate tasks (MinHash/LSH in SQLite)."""
+
+import hashlib
+import re
+import sqlite3
+import statistics
+import time
+from array import array
+from collections import deque
+from collections.abc import Iterable
+from pathlib import Path
+
+from pydantic import BaseModel
+from pydantic_ai.models import Model
+
+from adversarial_tournament.config import DEFAULT_PERSONA_INDEX_MAX_ENTRIES
+from adversarial_tournament.models.persona import PersonaSet
+from adversarial_tournament.prompts.templates import build_persona_generator_prompt
+from adversarial_tournament.utils import model_id, normalize_task
+
+# Most LSH candidates whose signatures are compared per lookup (most shared buckets first)
+_MAX_CANDIDATES = 64
+
+# Recent lookup durations kept for the latency statistics
+_LATENCY_WINDOW = 10_000
+
+_WORD = re.compile(r"\w+")
+
+# Version of the shingling, stored with the MinHash settings so older index files are refused
+_SHINGLES = "words"
+
+
+class PersonaIndexStats(BaseModel):
+    """Hit rate and lookup latency of a ``PersonaIndex``."""
+
+    entries: int
+    lookups: int
+    hits: int
+    misses: int
+    hit_rate: float
+    mean_lookup_ms: float
+    p95_lookup_ms: float
+
+
+class PersonaIndex:
+    """SQLite-backed similarity index of Phase 0 results.
+
+    Tasks are reduced to MinHash signatures of their set of words, and each
+    signature is split into ``bands`` LSH buckets. A lookup fetches the
+    stored tasks sharing a bucket with the new one and compares their
+    signatures; the most similar task whose estimated Jaccard similarity
+    reaches ``threshold`` lends its personas, with ``task_context`` rewritten
+    to the new task. So a templated task with a different company name still
+    hits, where ``PersonaCache`` (exact text) misses.
+
+    Like ``PersonaCache``, entries are scoped to the model and the persona
+    generator instructions. The oldest entries are evicted once
+    ``max_entries`` is exceeded. Storing a task that is already indexed
+    (after whitespace normalization) replaces its personas in place.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        threshold: float = 0.7,
+        num_perm: int = 64,
+        bands: int = 16,
+        max_entries: int = DEFAULT_PERSONA_INDEX_MAX_ENTRIES,
+        seed: int = 1,
+    ):
+        """Open (or create) a persona index.
+
+        Args:
+            path: SQLite database file, or ':memory:' for a process-local index.
+            threshold: Minimum estimated Jaccard similarity (0-1] of the words
+                of two tasks for their personas to be shared. A one-word swap
+                in a ten-word task scores 9/11 (about 0.82).
+            num_perm: MinHash permutations per signature.
+            bands: LSH bands the signature is split into; more bands find
+                less similar candidates (at more bucket lookups).
+            max_entries: Maximum number of tasks kept before the oldest are evicted.
+            seed: Seed of the MinHash hash functions.
+
+        Raises:
+            ValueError: If the settings are invalid, or differ from those the
+                index file was built with.
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        if bands < 1 or num_perm % bands:
+            raise ValueError("num_perm must be a positive multiple of bands")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.path = str(path)
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lookup_s: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+        self._salt = seed.to_bytes(8, "little", signed=True)
+
+        self._conn = sqlite3.connect(self.path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS settings (name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        params = f"{num_perm}:{bands}:{seed}:{_SHINGLES}"
+        self._conn.execute(
+            "INSERT OR IGNORE INTO settings (name, value) VALUES ('minhash', ?)", (params,)
+        )
+        stored = self._conn.execute(
+            "SELECT value FROM settings WHERE name = 'minhash'"
+        ).fetchone()[0]
+        if stored != params:
+            self._conn.close()
+            raise ValueError(
+                f"index was built with num_perm:bands:seed:shingles {stored}, not {params}"
+            )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY,
+                scope TEXT NOT NULL,
+                task_hash TEXT NOT NULL,
+                task TEXT NOT NULL,
+                signature BLOB NOT NULL,
+                personas TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                UNIQUE (scope, task_hash)
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS buckets (
+                bucket INTEGER NOT NULL,
+                task_id INTEGER NOT NULL,
+                PRIMARY KEY (bucket, task_id)
+            ) WITHOUT ROWID"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS buckets_task ON buckets (task_id)")
+
+    @staticmethod
+    def make_scope(model: Model | str, instructions: str | None = None) -> str:
+        """Build the scope (model and generator instructions) entries are shared within."""
+        if instructions is None:
+            instructions = build_persona_generator_prompt()
+        prompt_hash = hashlib.sha256(instructions.encode()).hexdigest()
+        return hashlib.sha256(f"{model_id(model)}\0{prompt_hash}".encode()).hexdigest()
+
+    @staticmethod
+    def shingles(task: str) -> set[str]:
+        """Return the set of lowercased words of a task.
+
+        Single words rather than bigrams: swapping one word of a short
+        template changes one shingle instead of two, so the company-name
+        case stays above the threshold for tasks of a handful of words.
+        """
+        return set(_WORD.findall(normalize_task(task).lower()))
+
+    def signature(self, task: str) -> array:
+        """Return the MinHash signature of a task.
+
+        The ``num_perm`` hash functions are the consecutive 32-bit words of
+        one SHAKE-128 digest per shingle, so the whole signature is a
+        column-wise minimum computed in C.
+        """
+        size = 4 * self.num_perm
+        columns = [
+            array("I", hashlib.shake_128(self._salt + shingle.encode()).digest(size))
+            for shingle in self.shingles(task) or {""}
+        ]
+        return array("I", map(min, zip(*columns)))
+
+    def similarity(self, first: array, second: array) -> float:
+        """Estimate the Jaccard similarity of two tasks from their signatures."""
+        return sum(x == y for x, y in zip(first, second)) / self.num_perm
+
+    def get(
+        self, task: str, model: Model | str, instructions: str | None = None
+    ) -> PersonaSet | None:
+        """Return the personas of the most similar stored task, or None on a miss."""
+        started = time.perf_counter()
+        try:
+            match = self._nearest(task, self.make_scope(model, instructions))
+        finally:
+            self._lookup_s.append(time.perf_counter() - started)
+
+        if match is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        personas = PersonaSet.model_validate_json(match)
+        return personas.model_copy(update={"task_context": task})
+
+    def put(
+        self,
+        task: str,
+        model: Model | str,
+        personas: PersonaSet,
+        instructions: str | None = None,
+    ) -> None:
+        """Store (or replace) the personas of a task, evicting the oldest overflow."""
+        self.put_many([(task, personas)], model, instructions)
+
+    def put_many(
+        self,
+        entries: Iterable[tuple[str, PersonaSet]],
+        model: Model | str,
+        instructions: str | None = None,
+    ) -> None:
+        """Store the personas of many tasks in one transaction (e.g. to seed the index)."""
+        scope = self.make_scope(model, instructions)
+        self._conn.execute("BEGIN")
+        try:
+            for task, personas in entries:
+                task_hash = hashlib.sha256(normalize_task(task).encode()).hexdigest()
+                signature = self.signature(task)
+                # A repeated task keeps its row (and its buckets, as the signature is the same)
+                self._conn.execute(
+                    "INSERT INTO tasks (scope, task_hash, task, signature, personas, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (scope, task_hash) DO UPDATE SET "
+                    "task = excluded.task, personas = excluded.personas, "
+                    "created_at = excluded.created_at",
+                    (
+                        scope,
+                        task_hash,
+                        task,
+                        signature.tobytes(),
+                        personas.model_dump_json(),
+                        time.time(),
+                    ),
+                )
+                task_id = self._conn.execute(
+                    "SELECT id FROM tasks WHERE scope = ? AND task_hash = ?", (scope, task_hash)
+                ).fetchone()[0]
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO buckets (bucket, task_id) VALUES (?, ?)",
+                    [(bucket, task_id) for bucket in self._buckets(scope, signature)],
+                )
+            # Ids only grow and updates keep theirs, so everything this far behind
+            # the newest is the overflow
+            newest = self._conn.execute("SELECT MAX(id) FROM tasks").fetchone()[0] or 0
+            cutoff = newest - self.max_entries
+            self._conn.execute("DELETE FROM buckets WHERE task_id <= ?", (cutoff,))
+            self._conn.execute("DELETE FROM tasks WHERE id <= ?", (cutoff,))
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def stats(self) -> PersonaIndexStats:
+        """Return the hit rate and recent lookup latency."""
+        lookups = self.hits + self.misses
+        durations = sorted(self._lookup_s)
+        p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))] if durations else 0.0
+        return PersonaIndexStats(
+            entries=len(self),
+            lookups=lookups,
+            hits=self.hits,
+            misses=self.misses,
+            hit_rate=self.hits / lookups if lookups else 0.0,
+            mean_lookup_ms=statistics.fmean(durations) * 1e3 if durations else 0.0,
+            p95_lookup_ms=p95 * 1e3,
+        )
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._conn.execute("DELETE FROM buckets")
+        self._conn.execute("DELETE FROM tasks")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def _buckets(self, scope: str, signature: array) -> list[int]:
+        """Hash each band of a signature (within its scope) to a signed 64-bit bucket id."""
+        rows = self.num_perm // self.bands
+        prefix = bytes.fromhex(scope)
+        buckets = []
+        for band in range(self.bands):
+            key = prefix + band.to_bytes(2, "little") + signature[band * rows : (band + 1) * rows].tobytes()
+            digest = hashlib.blake2b(key, digest_size=8).digest()
+            buckets.append(int.from_bytes(digest, "little", signed=True))
+        return buckets
+
+    def _nearest(self, task: str, scope: str) -> str | None:
+        """Return the personas JSON of the most similar stored task above the threshold."""
+        signature = self.signature(task)
+        buckets = self._buckets(scope, signature)
+        candidates = [
+            task_id
+            for task_id, _ in self._conn.execute(
+                f"""SELECT task_id, COUNT(*) AS shared FROM buckets
+                    WHERE bucket IN ({", ".join("?" * len(buckets))})
+                    GROUP BY task_id ORDER BY shared DESC, task_id DESC LIMIT ?""",
+                (*buckets, _MAX_CANDIDATES),
+            )
+        ]
+        if not candidates:
+            return None
+
+        best_id, best = None, 0.0
+        for task_id, stored in self._conn.execute(
+            f"SELECT id, signature FROM tasks WHERE id IN ({', '.join('?' * len(candidates))}) "
+            "AND scope = ?",
+            (*candidates, scope),
+        ):
+            score = self.similarity(signature, array("I", stored))
+            if score >= self.threshold and score > best:
+                best_id, best = task_id, score
+        if best_id is None:
+            return None
+        return self._conn.execute(
+            "SELECT personas FROM tasks WHERE id = ?", (best_id,)
+        ).fetchone()[0]
@@ -0,0 +1,349 @@
+"""Response Cache - Content-addressed record/replay of model responses.
+
+Every model request the tournament makes can be routed through a
+``CachingModel``, which stores the response under a hash of everything that
+determines it (model, instructions, messages, output schema and settings)
+and serves it back on later runs without touching the network.
+"""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Literal
+
+import pydantic_core
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelMessagesTypeAdapter,
+    ModelResponse,
+    ModelResponseStreamEvent,
+    TextPart,
+    ThinkingPart,
+    ToolCallPart,
+)
+from pydantic_ai.models import Model, ModelRequestParameters, StreamedResponse
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+from adversarial_tournament.exceptions import ResponseCacheMiss
+from adversarial_tournament.utils import model_id
+
+CacheMode = Literal["record", "replay", "read-through"]
+
+# File suffixes stored in a SQLite database rather than a directory
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+# Message/part fields that differ between otherwise identical requests
+_VOLATILE_FIELDS = frozenset(
+    {
+        "timestamp",
+        "run_id",
+        "tool_call_id",
+        "id",
+        "usage",
+        "provider_details",
+        "provider_response_id",
+        "metadata",
+    }
+)
+
+
+def _canonical_messages(messages: list[ModelMessage]) -> list[dict[str, Any]]:
+    """Dump messages as JSON data, dropping timestamps, ids and usage."""
+    canonical = []
+    for message in ModelMessagesTypeAdapter.dump_python(messages, mode="json"):
+        message = {k: v for k, v in message.items() if k not in _VOLATILE_FIELDS}
+        message["parts"] = [
+            {k: v for k, v in part.items() if k not in _VOLATILE_FIELDS}
+            for part in message["parts"]
+        ]
+        canonical.append(message)
+    return canonical
+
+
+def _dump_response(response: ModelResponse) -> str:
+    return ModelMessagesTypeAdapter.dump_json([response]).decode()
+
+
+def _load_response(data: str | bytes) -> ModelResponse:
+    response = ModelMessagesTypeAdapter.validate_json(data)[0]
+    assert isinstance(response, ModelResponse)
+    return response
+
+
+class _DirectoryStore:
+    """One JSON file per entry, sharded by the first two key characters."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        try:
+            return self._file(key).read_text()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, value: str) -> None:
+        target = self._file(key)
+        target.parent.mkdir(exist_ok=True)
+        # Write-then-rename so concurrent readers never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(value)
+        os.replace(tmp, target)
+
+    def clear(self) -> None:
+        for entry in self.path.glob("*/*.json"):
+            entry.unlink()
+
+    def close(self) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.path.glob("*/*.json"))
+
+
+class _SQLiteStore:
+    """All entries in a single SQLite table."""
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )"""
+        )
+
+    def get(self, key: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT value FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def put(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+            (key, value, time.time()),
+        )
+
+    def clear(self) -> None:
+        self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class ResponseCache:
+    """Content-addressed store of model responses.
+
+    Entries are keyed by the model, the request messages (including the
+    agent instructions and prompt), the output schema and the model settings.
+    Timestamps, run ids and tool call ids are ignored, so the same tournament
+    step always maps to the same entry.
+
+    Modes:
+        record: always call the model and (over)write the entry.
+        replay: only serve stored entries; a miss raises ``ResponseCacheMiss``.
+        read-through: serve stored entries, calling and storing on a miss.
+    """
+
+    def __init__(self, path: str | Path, mode: CacheMode = "read-through"):
+        """Open (or create) a response cache.
+
+        Args:
+            path: Directory to store entries in, or a SQLite database file
+                (``.db``, ``.sqlite``, ``.sqlite3``) or ':memory:'.
+            mode: One of 'record', 'replay' or 'read-through'.
+        """
+        if mode not in ("record", "replay", "read-through"):
+            raise ValueError(f"unknown cache mode: {mode!r}")
+
+        self.path = str(path)
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+
+        if self.path == ":memory:" or Path(path).suffix in SQLITE_SUFFIXES:
+            self._store: _DirectoryStore | _SQLiteStore = _SQLiteStore(self.path)
+        else:
+            self._store = _DirectoryStore(Path(path))
+
+    @staticmethod
+    def make_key(
+        model: Model | str,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> str:
+        """Build the cache key for one model request."""
+        params = model_request_parameters
+        payload = {
+            "model": model_id(model),
+            "messages": _canonical_messages(messages),
+            "settings": model_settings or {},
+            "output_mode": params.output_mode,
+            "output_object": params.output_object,
+            "output_tools": params.output_tools,
+            "function_tools": params.function_tools,
+            "prompted_output_template": params.prompted_output_template,
+            "allow_text_output": params.allow_text_output,
+        }
+        raw = pydantic_core.to_json(payload, fallback=str)
+        return hashlib.sha256(raw).hexdigest()
+
+    def get(self, key: str) -> ModelResponse | None:
+        """Return the stored response for a key, or None on a miss."""
+        value = self._store.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return _load_response(value)
+
+    def put(self, key: str, response: ModelResponse) -> None:
+        """Store a response under a key."""
+        self._store.put(key, _dump_response(response))
+
+    def wrap(self, model: Model | str) -> "CachingModel":
+        """Return ``model`` with every request routed through this cache."""
+        return CachingModel(model, self)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._store.clear()
+
+    def close(self) -> None:
+        """Release the underlying storage."""
+        self._store.close()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+@dataclass
+class _ReplayedStreamedResponse(StreamedResponse):
+    """Streams a stored response back, one event per part."""
+
+    _response: ModelResponse = field(kw_only=True)
+    _timestamp: datetime = field(
+        default_factory=lambda: datetime.now(timezone.utc), init=False
+    )
+
+    async def _get_event_iterator(self) -> AsyncIterator[ModelResponseStreamEvent]:
+        self._usage = self._response.usage
+        for i, part in enumerate(self._response.parts):
+            if isinstance(part, TextPart):
+                event = self._parts_manager.handle_text_delta(
+                    vendor_part_id=i, content=part.content
+                )
+            elif isinstance(part, ThinkingPart):
+                event = self._parts_manager.handle_thinking_delta(
+                    vendor_part_id=i, content=part.content
+                )
+            elif isinstance(part, ToolCallPart):
+                event = self._parts_manager.handle_tool_call_part(
+                    vendor_part_id=i,
+                    tool_name=part.tool_name,
+                    args=part.args,
+                    tool_call_id=part.tool_call_id,
+                )
+            else:
+                continue
+            if event is not None:
+                yield event
+
+    @property
+    def model_name(self) -> str:
+        return self._response.model_name or ""
+
+    @property
+    def provider_name(self) -> str | None:
+        return self._response.provider_name
+
+    @property
+    def timestamp(self) -> datetime:
+        return self._timestamp
+
+
+@dataclass(init=False)
+class CachingModel(WrapperModel):
+    """Model wrapper that records responses to, and replays them from, a cache.
+
+    The wrapper reports the wrapped model's name and system, so metrics and
+    agent reuse treat it exactly like the model it wraps.
+    """
+
+    cache: ResponseCache
+
+    def __init__(self, wrapped: Model | str, cache: ResponseCache):
+        super().__init__(wrapped)
+        self.cache = cache
+
+    def _lookup(self, key: str) -> ModelResponse | None:
+        if self.cache.mode == "record":
+            return None
+        cached = self.cache.get(key)
+        if cached is None and self.cache.mode == "replay":
+            raise ResponseCacheMiss(key)
+        return cached
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        key = self.cache.make_key(
+            self.wrapped, messages, model_settings, model_request_parameters
+        )
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        response = await self.wrapped.request(
+            messages, model_settings, model_request_parameters
+        )
+        self.cache.put(key, response)
+        return response
+
+    @asynccontextmanager
+    async def request_stream(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+        run_context: Any = None,
+    ) -> AsyncIterator[StreamedResponse]:
+        key = self.cache.make_key(
+            self.wrapped, messages, model_settings, model_request_parameters
+        )
+        cached = self._lookup(key)
+        if cached is not None:
+            yield _ReplayedStreamedResponse(
+                model_request_parameters=model_request_parameters, _response=cached
+            )
+            return
+
+        async with self.wrapped.request_stream(
+            messages, model_settings, model_request_parameters, run_context
+        ) as stream:
+            yield stream
+        # Only reached when the consumer finished without an error
+        self.cache.put(key, stream.get())
@@ -0,0 +1,154 @@
+"""Shared model clients - One pooled HTTP client behind every agent.
+
+A model given by name (``"openai:gpt-4o-mini"``) is resolved once per
+``ModelClients`` into a model whose provider sends its requests through one
+shared ``httpx.AsyncClient``. Every agent of a tournament, and every
+tournament sharing the ``ModelClients``, then reuses the same kept-alive
+connections (optionally over HTTP/2) instead of opening and handshaking new
+ones.
+"""
+
+import importlib.util
+import itertools
+import math
+import threading
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+import httpx
+from pydantic_ai.models import Model, infer_model
+from pydantic_ai.providers import Provider, infer_provider, infer_provider_class
+
+
+@dataclass(frozen=True)
+class HttpConfig:
+    """Connection pool settings of the shared HTTP client.
+
+    Attributes:
+        max_connections: Connections open at once across every model request.
+        max_keepalive_connections: Idle connections kept open for reuse; set
+            it to ``max_connections`` so bursts of concurrent calls never
+            reconnect.
+        keepalive_expiry_s: Seconds an idle connection is kept open.
+        pool_shards: Connection pools the limits are split across. httpcore
+            scans every pooled connection for every queued request whenever a
+            request starts or finishes, so one pool of ~100 busy connections
+            spends more CPU than the reconnects it saves; a few smaller pools
+            keep that scan short.
+        http2: Multiplex requests over HTTP/2 connections (needs the ``http2``
+            extra: ``pip install 'adversarial-tournament[http2]'``).
+        timeout_s: Read/write timeout of a request.
+        connect_timeout_s: Timeout for opening a connection.
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 100
+    keepalive_expiry_s: float = 60.0
+    pool_shards: int = 4
+    http2: bool = False
+    timeout_s: float = 600.0
+    connect_timeout_s: float = 5.0
+
+    def __post_init__(self) -> None:
+        if self.max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        if self.max_keepalive_connections < 0:
+            raise ValueError("max_keepalive_connections must not be negative")
+        if not 1 <= self.pool_shards <= self.max_connections:
+            raise ValueError("pool_shards must be between 1 and max_connections")
+
+    def build_client(self) -> httpx.AsyncClient:
+        """Create an HTTP client with these settings."""
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "http2=True needs the h2 package: pip install 'adversarial-tournament[http2]'"
+            )
+        limits = httpx.Limits(
+            max_connections=math.ceil(self.max_connections / self.pool_shards),
+            max_keepalive_connections=math.ceil(self.max_keepalive_connections / self.pool_shards),
+            keepalive_expiry=self.keepalive_expiry_s,
+        )
+        transports = [
+            httpx.AsyncHTTPTransport(http2=self.http2, limits=limits)
+            for _ in range(self.pool_shards)
+        ]
+        return httpx.AsyncClient(
+            transport=transports[0] if len(transports) == 1 else _ShardedTransport(transports),
+            timeout=httpx.Timeout(self.timeout_s, connect=self.connect_timeout_s),
+        )
+
+
+class _ShardedTransport(httpx.AsyncBaseTransport):
+    """Spreads requests round-robin over several connection pools."""
+
+    def __init__(self, transports: list[httpx.AsyncHTTPTransport]):
+        self.transports = transports
+        self._next = itertools.cycle(transports)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await next(self._next).handle_async_request(request)
+
+    async def aclose(self) -> None:
+        for transport in self.transports:
+            await transport.aclose()
+
+
+class ModelClients:
+    """Resolves model names to models sharing one pooled HTTP client.
+
+    Each model name is resolved once and the resulting model reused, so its
+    provider (and the SDK client inside it) is built once too. Providers that
+    cannot take an HTTP client (e.g. Bedrock, Vertex) fall back to their
+    defaults. ``Model`` instances are passed through unchanged.
+    """
+
+    _shared: ClassVar["ModelClients | None"] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, config: HttpConfig | None = None, client: httpx.AsyncClient | None = None):
+        """Create the clients.
+
+        Args:
+            config: Pool settings of the HTTP client created on first use.
+            client: An existing HTTP client to use instead (``config`` is then ignored).
+        """
+        self.config = config or HttpConfig()
+        self._client = client
+        self._models: dict[str, Model] = {}
+
+    @classmethod
+    def shared(cls) -> "ModelClients":
+        """The process-wide instance tournaments use unless given their own."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared HTTP client, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = self.config.build_client()
+        return self._client
+
+    def model(self, model: Model | str) -> Model:
+        """Return the shared model for a model name (``Model`` instances unchanged)."""
+        if not isinstance(model, str):
+            return model
+        if model not in self._models:
+            self._models[model] = infer_model(model, provider_factory=self._provider)
+        return self._models[model]
+
+    def _provider(self, name: str) -> Provider[Any]:
+        if name.startswith("gateway/") or name.startswith("google"):
+            return infer_provider(name)
+        try:
+            return infer_provider_class(name)(http_client=self.client)
+        except TypeError:
+            return infer_provider(name)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client; later requests open a new one."""
+        if self._client is not None:
+            await self._client.aclose()
+        self._models.clear()
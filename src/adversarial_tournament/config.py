@@ -5,3 +5,28 @@ DEBUG = False
 
 # Default model for all agents
 DEFAULT_MODEL = "openai:gpt-4o-mini"
+
+# Roles that can run on their own model (role_models / --model-<role>)
+MODEL_ROLES = ("persona_generator", "contestant", "judge", "synthesizer")
+
+# Small, low-latency model for the phases that do not write the final output
+FAST_MODEL = "openai:gpt-4.1-nano"
+
+# Named per-role model routings (--model-preset); roles a preset leaves out use
+# the tournament's model. "fast-review" runs Phase 0 (persona generation) and
+# Round 2 (critique) on the fast model, keeping drafts and synthesis as they are.
+MODEL_PRESETS: dict[str, dict[str, str]] = {
+    "fast-review": {"persona_generator": FAST_MODEL, "judge": FAST_MODEL},
+}
+
+# Default number of tournaments run at once in batch mode
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Maximum entries kept in the on-disk persona cache before LRU eviction
+DEFAULT_PERSONA_CACHE_MAX_ENTRIES = 10_000
+
+# Maximum tasks kept in the near-duplicate persona index before the oldest are evicted
+DEFAULT_PERSONA_INDEX_MAX_ENTRIES = 100_000
+
+# Maximum built agents kept for reuse across runs
+DEFAULT_AGENT_REGISTRY_SIZE = 256
@@ -0,0 +1,131 @@
+"""Events emitted while a tournament is running.
+
+``AdversarialTournament.stream`` yields these as the pipeline progresses:
+phase boundaries, token deltas from each agent, partially generated
+structured outputs and finally the completed result.
+``AdversarialTournament.run_events`` yields phase and agent call
+boundaries (with timings and token usage) instead of deltas, and the
+tournament's ``on_phase_start``/``on_phase_end``/``on_call_start``/
+``on_call_end`` hooks receive the phase and call events as they happen.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from adversarial_tournament.models.metrics import CallMetrics, PhaseMetrics
+from adversarial_tournament.models.tournament import TournamentResult
+
+Phase = Literal["phase_zero", "round_one", "round_two", "round_three"]
+
+
+@dataclass(frozen=True)
+class PhaseStarted:
+    """A tournament phase has started."""
+
+    phase: Phase
+
+
+@dataclass(frozen=True)
+class PhaseCompleted:
+    """A tournament phase has finished with its output."""
+
+    phase: Phase
+    output: BaseModel
+    metrics: PhaseMetrics | None = None
+
+
+@dataclass(frozen=True)
+class CallStarted:
+    """An agent call has started (once it has a call slot and rate-limit quota).
+
+    ``prompt_chars`` is the size of the user prompt; the agent's
+    instructions come on top of it.
+    """
+
+    phase: Phase
+    role: str
+    model: str
+    prompt_chars: int
+
+
+@dataclass(frozen=True)
+class CallCompleted:
+    """An agent call has finished; ``metrics`` holds its timing and token usage."""
+
+    phase: Phase
+    role: str
+    prompt_chars: int
+    metrics: CallMetrics
+
+
+@dataclass(frozen=True)
+class CallFailed:
+    """An agent call failed after its retries and fallbacks, or was cancelled."""
+
+    phase: Phase
+    role: str
+    model: str
+    prompt_chars: int
+    duration_s: float
+    error: BaseException
+
+
+@dataclass(frozen=True)
+class TextDelta:
+    """New text produced by an agent.
+
+    For structured outputs ``field`` names the string field that grew
+    (e.g. ``"critique_of_contestant_1"``); it is None for plain-text drafts.
+    """
+
+    phase: Phase
+    role: str
+    delta: str
+    field: str | None = None
+
+
+@dataclass(frozen=True)
+class PartialOutput:
+    """A partially generated structured output.
+
+    ``fields`` holds whatever has been parsed so far; required fields may
+    still be missing and the trailing string may be incomplete.
+    """
+
+    phase: Phase
+    role: str
+    fields: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class StreamRestarted:
+    """A streamed agent call is retried after it had already produced output.
+
+    The ``TextDelta`` and ``PartialOutput`` events of ``role`` in ``phase``
+    received so far are void: the retry streams its output from the start.
+    """
+
+    phase: Phase
+    role: str
+
+
+@dataclass(frozen=True)
+class TournamentCompleted:
+    """The tournament finished; always the last event of a stream."""
+
+    result: TournamentResult
+
+
+TournamentEvent = (
+    PhaseStarted
+    | PhaseCompleted
+    | CallStarted
+    | CallCompleted
+    | CallFailed
+    | TextDelta
+    | PartialOutput
+    | StreamRestarted
+    | TournamentCompleted
+)
@@ -0,0 +1,46 @@
+"""Exceptions raised by the adversarial tournament."""
+
+
+class TournamentError(Exception):
+    """A tournament failed before producing a result.
+
+    Batch runs yield this in place of a ``TournamentResult`` so that one
+    failing task does not stop the others. The underlying exception is
+    available as ``__cause__`` (and ``error``).
+    """
+
+    def __init__(self, task: str, error: BaseException):
+        super().__init__(f"Tournament failed for task {task!r}: {error}")
+        self.task = task
+        self.error = error
+        self.__cause__ = error
+
+
+class BudgetExceeded(TimeoutError):
+    """A tournament hit its deadline or token budget before any draft was written.
+
+    Once a draft exists the tournament returns it as a partial result
+    instead (see ``TournamentResult.stop_reason``).
+    """
+
+    def __init__(self, reason: str, completed_phases: list[str]):
+        done = ", ".join(completed_phases) or "no phase"
+        super().__init__(f"Tournament stopped at its {reason.replace('_', ' ')} ({done} completed)")
+        self.reason = reason
+        self.completed_phases = completed_phases
+
+
+class PatchError(ValueError):
+    """A patch-based synthesis edit could not be applied cleanly to its draft."""
+
+    def __init__(self, message: str, edit_index: int | None = None):
+        super().__init__(message)
+        self.edit_index = edit_index
+
+
+class ResponseCacheMiss(LookupError):
+    """A replay-only response cache had no entry for a model request."""
+
+    def __init__(self, key: str):
+        super().__init__(f"No cached response for request {key[:12]} (cache mode is 'replay')")
+        self.key = key
@@ -1,19 +1,734 @@
-"""CLI entry point for the adversarial tournament."""
+"""CLI entry point for the adversarial tournament.
+
+Only the standard library and the package's lightweight modules are imported
+at module level; pydantic-ai and everything built on it are imported once a
+tournament actually runs, so ``--help`` and argument errors return instantly.
+"""
 
 import argparse
 import sys
-from datetime import date
+from datetime import date, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from dotenv import load_dotenv
+from adversarial_tournament.config import (
+    DEBUG,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MODEL,
+    MODEL_PRESETS,
+    MODEL_ROLES,
+)
+from adversarial_tournament.exceptions import TournamentError
 
-from adversarial_tournament.tournament import AdversarialTournament
-from adversarial_tournament.config import DEBUG, DEFAULT_MODEL
+if TYPE_CHECKING:
+    from adversarial_tournament.archive import ArchiveEntry, ResultArchive
+    from adversarial_tournament.models.tournament import TournamentResult
+    from adversarial_tournament.sinks import JsonlSink
+    from adversarial_tournament.tournament import AdversarialTournament
 
 
-def main() -> int:
-    """Run the adversarial tournament from command line."""
+def parse_role_timeout(value: str) -> tuple[str, float]:
+    """Parse a ``ROLE=SECONDS`` command-line value."""
+    role, sep, seconds = value.partition("=")
+    try:
+        timeout = float(seconds)
+    except ValueError:
+        timeout = 0.0
+    if not sep or not role or timeout <= 0:
+        raise argparse.ArgumentTypeError(f"expected ROLE=SECONDS, got {value!r}")
+    return role, timeout
+
+
+def read_tasks_file(path: Path) -> list[str]:
+    """Read tasks from a line-delimited file.
+
+    Each non-blank line is one task. Lines starting with ``{`` are parsed as
+    JSON objects and must carry a ``"task"`` key; any other line is taken
+    verbatim as the task text.
+    """
+    import ujson
+
+    tasks = []
+    for line_no, line in enumerate(path.read_text().splitlines(), start=1):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            try:
+                task = ujson.loads(line)["task"]
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"{path}:{line_no}: expected a JSON object with a 'task' key") from e
+            tasks.append(str(task))
+        else:
+            tasks.append(line)
+    return tasks
+
+
+PHASE_TITLES = {
+    "phase_zero": "Phase 0: Persona Generation",
+    "round_one": "Round 1: Initial Drafts",
+    "round_two": "Round 2: The Roast",
+    "round_three": "Round 3: The Synthesis",
+}
+
+
+async def _stream_to_terminal(
+    tournament: "AdversarialTournament", task: str
+) -> "TournamentResult":
+    """Run one tournament, printing every round's tokens as they arrive."""
+    from adversarial_tournament.events import (
+        PhaseStarted,
+        StreamRestarted,
+        TextDelta,
+        TournamentCompleted,
+    )
+
+    result = None
+    current_label = None
+
+    async for event in tournament.stream(task):
+        if isinstance(event, PhaseStarted):
+            print(f"\n=== {PHASE_TITLES[event.phase]} ===", flush=True)
+            current_label = None
+        elif isinstance(event, TextDelta) and event.phase != "phase_zero":
+            # Concurrent agents interleave, so label every switch of speaker
+            label = event.role if event.field is None else f"{event.role}: {event.field}"
+            if label != current_label:
+                print(f"\n[{label}]", flush=True)
+                current_label = label
+            print(event.delta, end="", flush=True)
+        elif isinstance(event, StreamRestarted) and event.phase != "phase_zero":
+            # Text already printed can't be taken back; mark where the retry starts over
+            print(f"\n[{event.role}: retrying, output restarts]", flush=True)
+            current_label = None
+        elif isinstance(event, TournamentCompleted):
+            result = event.result
+
+    print()
+    assert result is not None
+    return result
+
+
+async def _run_batch(
+    tournament: "AdversarialTournament",
+    tasks: list[str],
+    max_concurrency: int,
+    quiet: bool,
+    resume: bool = False,
+    sink: "JsonlSink | None" = None,
+    archive: "ResultArchive | None" = None,
+) -> tuple[list["TournamentResult"], list[TournamentError]]:
+    """Run every task, reporting progress as each tournament completes.
+
+    With a ``sink`` or an ``archive``, each result is stored in it as soon as
+    it completes.
+    """
+    results: list["TournamentResult"] = []
+    errors: list[TournamentError] = []
+
+    async for outcome in tournament.run_many(
+        tasks, max_concurrency=max_concurrency, resume=resume
+    ):
+        if isinstance(outcome, TournamentError):
+            errors.append(outcome)
+            print(f"Error running tournament: {outcome}", file=sys.stderr)
+        else:
+            results.append(outcome)
+            if sink is not None:
+                sink.write(outcome)
+            if archive is not None:
+                archive.add(outcome)
+        if not quiet:
+            done = len(results) + len(errors)
+            print(f"[{done}/{len(tasks)}] {'failed' if isinstance(outcome, TournamentError) else 'done'}: {outcome.task}")
+
+    return results, errors
+
+
+def _batch_stats(results: list["TournamentResult"]) -> str:
+    """Summarize latency and token usage across a batch."""
+    metrics = [result.metrics for result in results if result.metrics]
+    if not metrics:
+        return "No metrics collected"
+
+    durations = sorted(m.total_duration_s for m in metrics)
+    p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+    phase_totals: dict[str, list[float]] = {}
+    for m in metrics:
+        for phase in m.phases:
+            phase_totals.setdefault(phase.phase, []).append(phase.duration_s)
+
+    lines = [
+        f"Tournaments: {len(metrics)} | mean {sum(durations) / len(durations):.2f}s | p95 {p95:.2f}s",
+        f"Tokens: {sum(m.input_tokens for m in metrics)} in "
+        f"({sum(m.cache_read_tokens for m in metrics)} cached) / "
+        f"{sum(m.output_tokens for m in metrics)} out | Retries: {sum(m.retries for m in metrics)}",
+    ]
+    lines += [
+        f"  {phase}: mean {sum(values) / len(values):.2f}s"
+        for phase, values in phase_totals.items()
+    ]
+    return "\n".join(lines)
+
+
+def _open_sink(args: argparse.Namespace) -> "JsonlSink | None":
+    """Open the ``--output-jsonl`` sink, if requested."""
+    if args.output_jsonl is None:
+        return None
+    from adversarial_tournament.sinks import JsonlSink
+
+    return JsonlSink(args.output_jsonl, fsync=args.jsonl_fsync)
+
+
+def _open_archive(args: argparse.Namespace) -> "ResultArchive | None":
+    """Open the ``--archive`` database, if requested."""
+    if args.archive is None:
+        return None
+    from adversarial_tournament.archive import ResultArchive
+
+    return ResultArchive(args.archive)
+
+
+def _write_transcripts(path: Path, results: list["TournamentResult"]) -> None:
+    """Write every transcript to ``path``, one result at a time."""
+    with path.open("w") as f:
+        for i, result in enumerate(results):
+            if i:
+                f.write("\n---\n\n")
+            f.write(result.to_markdown())
+
+
+def _main_batch(args: argparse.Namespace, tournament: "AdversarialTournament") -> int:
+    """Run every task in ``--tasks-file`` and save the combined outputs."""
+    import asyncio
+
+    import ujson
+
+    try:
+        tasks = read_tasks_file(args.tasks_file)
+    except (OSError, ValueError) as e:
+        print(f"Error reading tasks file: {e}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(f"Starting {len(tasks)} adversarial tournaments...")
+        print(f"Tasks file: {args.tasks_file}")
+        print(f"Model: {args.model}")
+        print(f"Concurrency: {args.concurrency}")
+        print()
+
+    sink = _open_sink(args)
+    archive = _open_archive(args)
+    try:
+        results, errors = asyncio.run(
+            _run_batch(
+                tournament, tasks, args.concurrency, args.quiet, args.resume, sink, archive
+            )
+        )
+    finally:
+        if sink is not None:
+            sink.close()
+        if archive is not None:
+            archive.close()
+    if sink is not None and not args.quiet:
+        print(f"Saved {sink.written} results to: {sink.path}")
+    if archive is not None and not args.quiet:
+        print(f"Archived {len(results)} results in: {archive.path}")
+
+    if not args.no_auto_output and results:
+        auto_path = Path(f"{date.today()}-OUTPUT.md")
+        _write_transcripts(auto_path, results)
+        if not args.quiet:
+            print(f"Saved transcripts to: {auto_path}")
+
+    if args.output_json:
+        args.output_json.write_text(
+            ujson.dumps([result.model_dump() for result in results], indent=2)
+        )
+        if not args.quiet:
+            print(f"Saved JSON to: {args.output_json}")
+
+    if args.output_md:
+        _write_transcripts(args.output_md, results)
+        if not args.quiet:
+            print(f"Saved Markdown to: {args.output_md}")
+
+    if args.stats:
+        print(_batch_stats(results), file=sys.stderr)
+        if tournament.persona_index is not None:
+            stats = tournament.persona_index.stats()
+            print(
+                f"Persona index: {stats.hits}/{stats.lookups} hits ({stats.hit_rate:.0%}) | "
+                f"lookup mean {stats.mean_lookup_ms:.2f}ms, p95 {stats.p95_lookup_ms:.2f}ms | "
+                f"{stats.entries} tasks",
+                file=sys.stderr,
+            )
+
+    if not args.quiet:
+        print()
+        print(f"Completed {len(results)} of {len(tasks)} tournaments ({len(errors)} failed)")
+
+    return 1 if errors else 0
+
+
+def _add_tournament_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options that configure the tournament (shared by ``serve``)."""
+    parser.add_argument(
+        "--model",
+        default=DEFAULT_MODEL,
+        help=f"Model to use (default: {DEFAULT_MODEL})",
+    )
+    for role in MODEL_ROLES:
+        parser.add_argument(
+            f"--model-{role.replace('_', '-')}",
+            dest=f"model_{role}",
+            metavar="MODEL",
+            help=f"Model for the {role.replace('_', ' ')} role (default: --model)",
+        )
+    parser.add_argument(
+        "--model-preset",
+        choices=sorted(MODEL_PRESETS),
+        help="Per-role model routing, e.g. fast-review runs personas and critique on a fast model",
+    )
+    parser.add_argument(
+        "--contestants",
+        type=int,
+        default=2,
+        metavar="N",
+        help="Number of contestants writing drafts (default: 2)",
+    )
+    parser.add_argument(
+        "--judges",
+        type=int,
+        default=1,
+        metavar="M",
+        help="Number of judges critiquing the drafts (default: 1)",
+    )
+    parser.add_argument(
+        "--max-concurrent-calls",
+        type=int,
+        metavar="N",
+        help="Maximum model calls in flight at once per tournament (default: unbounded)",
+    )
+    parser.add_argument(
+        "--acceptance-threshold",
+        type=float,
+        metavar="SCORE",
+        help="Skip Round 3 and promote the best draft when judges score it at least SCORE (0-10)",
+    )
+    parser.add_argument(
+        "--overlap-personas",
+        action="store_true",
+        help="Start each contestant's draft as soon as its persona is generated",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Critique each draft as soon as it is written instead of waiting for both",
+    )
+    parser.add_argument(
+        "--prompt-layout",
+        choices=["persona_first", "shared_prefix"],
+        default="persona_first",
+        help="Round 2/3 prompt layout; shared_prefix enables provider prompt caching (default: persona_first)",
+    )
+    parser.add_argument(
+        "--synthesis-mode",
+        choices=["full", "patch"],
+        default="full",
+        help="Round 3 rewrites the output (full) or edits the best draft (patch) (default: full)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Per-attempt timeout for every model call (default: none)",
+    )
+    parser.add_argument(
+        "--role-timeout",
+        type=parse_role_timeout,
+        action="append",
+        default=[],
+        metavar="ROLE=SECONDS",
+        help="Per-attempt timeout for one role, e.g. synthesizer=120 or contestant=60 (repeatable)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=2,
+        metavar="N",
+        help="Retries per model on timeouts and transient errors (default: 2)",
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Fire a duplicate request when a call outlives its role's p95 latency",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help="Stop each tournament after SECONDS and return its best draft so far",
+    )
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        metavar="N",
+        help="Stop each tournament once its calls used N tokens and return its best draft so far",
+    )
+    parser.add_argument(
+        "--fallback-model",
+        action="append",
+        default=[],
+        metavar="MODEL",
+        help="Model to fall back to when retries are exhausted (repeatable, tried in order)",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        metavar="N",
+        help="Requests per minute allowed per model, shared by every tournament in the batch",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=float,
+        metavar="N",
+        help="Tokens per minute allowed per model, shared by every tournament in the batch",
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=100,
+        metavar="N",
+        help="HTTP connections kept open and shared by every model call (default: 100)",
+    )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Multiplex model requests over HTTP/2 (needs: pip install 'adversarial-tournament[http2]')",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=Path,
+        metavar="DIR",
+        help="Save every completed phase to a checkpoint file per task in DIR",
+    )
+    parser.add_argument(
+        "--persona-cache",
+        type=Path,
+        metavar="FILE",
+        help="Reuse generated personas for repeated tasks via a SQLite cache at FILE",
+    )
+    parser.add_argument(
+        "--persona-cache-ttl",
+        type=float,
+        metavar="SECONDS",
+        help="Expire cached personas after SECONDS (default: never)",
+    )
+    parser.add_argument(
+        "--persona-index",
+        type=Path,
+        metavar="FILE",
+        help="Reuse personas for near-duplicate tasks via a SQLite MinHash index at FILE",
+    )
+    parser.add_argument(
+        "--persona-similarity",
+        type=float,
+        default=0.7,
+        metavar="THRESHOLD",
+        help="Minimum task similarity (0-1] for --persona-index to reuse personas (default: 0.7)",
+    )
+    parser.add_argument(
+        "--response-cache",
+        type=Path,
+        metavar="PATH",
+        help="Record/replay every model response in PATH (a directory, or a .db/.sqlite file)",
+    )
+    parser.add_argument(
+        "--cache-mode",
+        choices=["record", "replay", "read-through"],
+        default="read-through",
+        help="How --response-cache is used (default: read-through)",
+    )
+
+
+def _check_tournament_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Reject invalid tournament options with a usage error."""
+    if args.contestants < 2:
+        parser.error("--contestants must be at least 2")
+    if args.judges < 1:
+        parser.error("--judges must be at least 1")
+    if args.max_concurrent_calls is not None and args.max_concurrent_calls < 1:
+        parser.error("--max-concurrent-calls must be at least 1")
+    if args.acceptance_threshold is not None and not 0 <= args.acceptance_threshold <= 10:
+        parser.error("--acceptance-threshold must be between 0 and 10")
+    if args.timeout is not None and args.timeout <= 0:
+        parser.error("--timeout must be positive")
+    if args.retries < 0:
+        parser.error("--retries must not be negative")
+    if args.deadline is not None and args.deadline <= 0:
+        parser.error("--deadline must be positive")
+    if args.token_budget is not None and args.token_budget < 1:
+        parser.error("--token-budget must be at least 1")
+    if (args.rpm is not None and args.rpm <= 0) or (args.tpm is not None and args.tpm <= 0):
+        parser.error("--rpm and --tpm must be positive")
+    if args.max_connections < 1:
+        parser.error("--max-connections must be at least 1")
+    if not 0 < args.persona_similarity <= 1:
+        parser.error("--persona-similarity must be in (0, 1]")
+
+
+def _build_tournament(args: argparse.Namespace) -> "AdversarialTournament":
+    """Build the tournament described by the tournament options."""
+    from adversarial_tournament.cache.persona_cache import PersonaCache
+    from adversarial_tournament.cache.persona_index import PersonaIndex
+    from adversarial_tournament.cache.response_cache import ResponseCache
+    from adversarial_tournament.clients import HttpConfig, ModelClients
+    from adversarial_tournament.resilience import ResiliencePolicy
+    from adversarial_tournament.scheduler import RateLimit, RateLimitScheduler
+    from adversarial_tournament.tournament import AdversarialTournament
+
+    role_models = dict(MODEL_PRESETS[args.model_preset]) if args.model_preset else {}
+    for role in MODEL_ROLES:
+        if getattr(args, f"model_{role}"):
+            role_models[role] = getattr(args, f"model_{role}")
+
+    persona_cache = None
+    if args.persona_cache:
+        persona_cache = PersonaCache(args.persona_cache, ttl=args.persona_cache_ttl)
+
+    persona_index = None
+    if args.persona_index:
+        persona_index = PersonaIndex(args.persona_index, threshold=args.persona_similarity)
+
+    response_cache = None
+    if args.response_cache:
+        response_cache = ResponseCache(args.response_cache, mode=args.cache_mode)
+
+    scheduler = None
+    if args.rpm or args.tpm:
+        scheduler = RateLimitScheduler(
+            default=RateLimit(requests_per_minute=args.rpm, tokens_per_minute=args.tpm)
+        )
+
+    return AdversarialTournament(
+        model=args.model,
+        role_models=role_models,
+        contestants=args.contestants,
+        judges=args.judges,
+        max_concurrent_calls=args.max_concurrent_calls,
+        acceptance_threshold=args.acceptance_threshold,
+        overlap_persona_generation=args.overlap_personas,
+        pipeline_rounds=args.pipeline,
+        prompt_layout=args.prompt_layout,
+        synthesis_mode=args.synthesis_mode,
+        persona_cache=persona_cache,
+        persona_index=persona_index,
+        response_cache=response_cache,
+        resilience=ResiliencePolicy(
+            timeout_s=args.timeout,
+            role_timeouts=dict(args.role_timeout),
+            max_attempts=args.retries + 1,
+            hedge_quantile=0.95 if args.hedge else None,
+            fallback_models=tuple(args.fallback_model),
+        ),
+        scheduler=scheduler,
+        deadline_s=args.deadline,
+        token_budget=args.token_budget,
+        checkpoint_dir=args.checkpoint_dir,
+        clients=ModelClients(
+            HttpConfig(
+                max_connections=args.max_connections,
+                max_keepalive_connections=args.max_connections,
+                pool_shards=min(HttpConfig.pool_shards, args.max_connections),
+                http2=args.http2,
+            )
+        ),
+    )
+
+
+def _read_results(path: Path) -> list["TournamentResult"]:
+    """Read the results of an ``--output-json`` (object or array) or ``--output-jsonl`` file."""
+    from pydantic import TypeAdapter
+
+    from adversarial_tournament.models.tournament import TournamentResult
+    from adversarial_tournament.sinks import JsonlSink
+
+    data = path.read_bytes()
+    if data.lstrip().startswith(b"["):
+        return TypeAdapter(list[TournamentResult]).validate_json(data)
+    if path.suffix == ".json":
+        return [TournamentResult.model_validate_json(data)]
+    return list(JsonlSink.read(path))
+
+
+def _print_entries(entries: list["ArchiveEntry"], as_json: bool) -> None:
+    """Print archive search results, one per line (or as JSON lines)."""
+    for entry in entries:
+        if as_json:
+            print(entry.model_dump_json())
+            continue
+        created = datetime.fromtimestamp(entry.created_at).strftime("%Y-%m-%d %H:%M")
+        print(f"#{entry.id}  {created}  {entry.task}")
+        if entry.snippet:
+            print(f"    {' '.join(entry.snippet.split())}")
+
+
+def archive_main(argv: list[str]) -> int:
+    """Run the ``archive`` command: search, inspect, export and import archived results."""
+    parser = argparse.ArgumentParser(
+        prog="adversarial-tournament archive",
+        description="Search, inspect, export and import results stored with --archive",
+        epilog='To run a tournament on the task "archive", use: adversarial-tournament -- archive',
+    )
+    parser.add_argument("db", type=Path, help="The archive database")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search = commands.add_parser("search", help="Full-text search of tasks, outputs and key issues")
+    search.add_argument("query", help="FTS5 query, e.g. 'outage apology' or '\"root cause\" NOT refund'")
+
+    find = commands.add_parser("find", help="Look up results by task and/or persona, newest first")
+    find.add_argument("--task", help="Exact task (whitespace-insensitive)")
+    find.add_argument("--persona", metavar="NAME", help="A persona that took part")
+
+    slowest = commands.add_parser("slowest", help="Results whose phase took longest")
+    slowest.add_argument(
+        "phase", choices=["phase_zero", "round_one", "round_two", "round_three"]
+    )
+
+    for command in (search, find, slowest):
+        command.add_argument("--limit", type=int, default=20, metavar="N", help="Maximum results (default: 20)")
+        command.add_argument("--json", action="store_true", help="Print one JSON object per line")
+
+    show = commands.add_parser("show", help="Print one archived result")
+    show.add_argument("id", type=int, help="Archive id of the result")
+    show.add_argument("--format", choices=["markdown", "json"], default="markdown")
+
+    export = commands.add_parser("export", help="Export matching results as JSON Lines")
+    export.add_argument("output", type=Path, help="JSONL file to append to (gzipped if it ends in .gz)")
+    export.add_argument("--query", help="Only results matching this full-text query")
+    export.add_argument("--task", help="Only results for this exact task")
+    export.add_argument("--persona", metavar="NAME", help="Only results this persona took part in")
+    export.add_argument("--ids", type=int, nargs="+", metavar="ID", help="Only these results")
+
+    import_ = commands.add_parser("import", help="Archive results from JSON or JSONL output files")
+    import_.add_argument("files", type=Path, nargs="+", help="--output-json or --output-jsonl files")
+
+    args = parser.parse_args(argv)
+
+    from adversarial_tournament.archive import ResultArchive
+    from adversarial_tournament.sinks import JsonlSink
+
+    with ResultArchive(args.db) as archive:
+        if args.command == "search":
+            try:
+                entries = archive.search(args.query, limit=args.limit)
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 1
+            _print_entries(entries, args.json)
+        elif args.command == "find":
+            entries = archive.find(task=args.task, persona=args.persona, limit=args.limit)
+            _print_entries(entries, args.json)
+        elif args.command == "slowest":
+            _print_entries(archive.slowest(args.phase, limit=args.limit), args.json)
+        elif args.command == "show":
+            result = archive.get(args.id)
+            if result is None:
+                print(f"Error: no archived result #{args.id}", file=sys.stderr)
+                return 1
+            print(result.to_markdown() if args.format == "markdown" else result.model_dump_json(indent=2))
+        elif args.command == "export":
+            if args.ids:
+                ids = args.ids
+            elif args.query:
+                try:
+                    ids = [entry.id for entry in archive.search(args.query, limit=None)]
+                except ValueError as e:
+                    print(f"Error: {e}", file=sys.stderr)
+                    return 1
+            else:
+                entries = archive.find(task=args.task, persona=args.persona, limit=None)
+                ids = [entry.id for entry in reversed(entries)]
+            with JsonlSink(args.output) as sink:
+                for result in archive.export(ids):
+                    sink.write(result)
+            print(f"Exported {sink.written} results to: {args.output}")
+        else:
+            count = 0
+            for path in args.files:
+                try:
+                    count += len(archive.add_many(_read_results(path)))
+                except (OSError, ValueError) as e:
+                    print(f"Error reading {path}: {e}", file=sys.stderr)
+                    return 1
+            print(f"Archived {count} results in: {archive.path}")
+    return 0
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    """Run the tournament service until interrupted."""
+    import asyncio
+
+    from adversarial_tournament.server import TournamentService
+
+    service = TournamentService(_build_tournament(args), max_concurrency=args.concurrency)
+    server = await service.serve(args.host, args.port)
+    host, port = server.sockets[0].getsockname()[:2]
+    print(f"Serving tournaments on http://{host}:{port} (model: {args.model})", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await service.close()
+
+
+def serve_main(argv: list[str]) -> int:
+    """Run the ``serve`` command: a long-running HTTP service for tournament jobs."""
+    parser = argparse.ArgumentParser(
+        prog="adversarial-tournament serve",
+        description="Accept tournament jobs over HTTP and stream their progress as Server-Sent Events",
+        epilog='To run a tournament on the task "serve", use: adversarial-tournament -- serve',
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on (default: 8000)")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        metavar="N",
+        help=f"Maximum tournaments running at once (default: {DEFAULT_MAX_CONCURRENCY})",
+    )
+    _add_tournament_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    _check_tournament_arguments(parser, args)
+
+    import asyncio
+
+    from dotenv import load_dotenv
+
     load_dotenv()
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def main() -> int:
+    """Run the adversarial tournament from command line.
+
+    A first argument of ``archive`` or ``serve`` selects that command; a task
+    with one of those names is passed after ``--``.
+    """
+    if sys.argv[1:2] == ["archive"]:
+        return archive_main(sys.argv[2:])
+    if sys.argv[1:2] == ["serve"]:
+        return serve_main(sys.argv[2:])
 
     parser = argparse.ArgumentParser(
         description="Adversarial Tournament - Multi-agent content refinement using Pydantic AI",
@@ -24,17 +739,40 @@ Examples:
   %(prog)s "Write a press release" --output-json result.json
   %(prog)s "Write an email" --model openai:gpt-4o
   %(prog)s "Write an email" --no-auto-output
+  %(prog)s "Write an email" --stream
+  %(prog)s "Write an email" --contestants 4 --judges 2
+  %(prog)s --tasks-file tasks.jsonl --concurrency 8
+  %(prog)s "Write an email" --response-cache .responses --cache-mode replay
+  %(prog)s "Write an email" --archive results.db
+  %(prog)s archive results.db search "outage apology"
+  %(prog)s serve --port 8000 --concurrency 16
+  %(prog)s -- archive   (a task named like a command goes after --)
         """,
     )
 
     parser.add_argument(
         "task",
+        nargs="?",
         help="The task/prompt for the tournament",
     )
     parser.add_argument(
-        "--model",
-        default=DEFAULT_MODEL,
-        help=f"Model to use (default: {DEFAULT_MODEL})",
+        "--tasks-file",
+        type=Path,
+        metavar="FILE",
+        help="Run one tournament per line of FILE (plain text or JSONL with a 'task' key)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        metavar="N",
+        help=f"Maximum tournaments running at once with --tasks-file (default: {DEFAULT_MAX_CONCURRENCY})",
+    )
+    _add_tournament_arguments(parser)
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue tasks with a checkpoint in --checkpoint-dir from their last completed phase",
     )
     parser.add_argument(
         "--output-json",
@@ -42,6 +780,23 @@ Examples:
         metavar="FILE",
         help="Save JSON output to file",
     )
+    parser.add_argument(
+        "--output-jsonl",
+        type=Path,
+        metavar="FILE",
+        help="Append each result to FILE as one JSON line as soon as it completes (gzipped if FILE ends in .gz)",
+    )
+    parser.add_argument(
+        "--jsonl-fsync",
+        action="store_true",
+        help="Force every --output-jsonl line to disk before continuing",
+    )
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        metavar="DB",
+        help="Store every result in the searchable SQLite archive DB (see the 'archive' command)",
+    )
     parser.add_argument(
         "--output-md",
         type=Path,
@@ -53,6 +808,16 @@ Examples:
         action="store_true",
         help="Disable auto-generated YYYY-MM-DD-OUTPUT.md file",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream drafts, critique and final output to the terminal as they are generated",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print per-phase latency and token usage to stderr",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -66,6 +831,27 @@ Examples:
 
     args = parser.parse_args()
 
+    if (args.task is None) == (args.tasks_file is None):
+        parser.error("provide either a task or --tasks-file (but not both)")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.stream and args.tasks_file:
+        parser.error("--stream cannot be combined with --tasks-file")
+    if args.stream and args.quiet:
+        parser.error("--stream cannot be combined with --quiet")
+    _check_tournament_arguments(parser, args)
+    if args.resume and args.checkpoint_dir is None:
+        parser.error("--resume requires --checkpoint-dir")
+    if args.resume and args.stream:
+        parser.error("--resume cannot be combined with --stream")
+
+    # Deferred until a tournament actually runs (see the module docstring)
+    import asyncio
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
     # Determine verbosity
     verbose = DEBUG
     if args.verbose:
@@ -73,6 +859,11 @@ Examples:
     if args.quiet:
         verbose = False
 
+    tournament = _build_tournament(args)
+
+    if args.tasks_file:
+        return _main_batch(args, tournament)
+
     if not args.quiet:
         print(f"Starting adversarial tournament...")
         print(f"Task: {args.task}")
@@ -80,12 +871,19 @@ Examples:
         print()
 
     # Run the tournament
-    tournament = AdversarialTournament(model=args.model)
 
+    checkpoint = tournament.checkpoint_path(args.task)
     try:
-        result = tournament.run_sync(args.task)
+        if args.stream:
+            result = asyncio.run(_stream_to_terminal(tournament, args.task))
+        elif args.resume and checkpoint is not None and checkpoint.exists():
+            result = asyncio.run(tournament.resume(checkpoint))
+        else:
+            result = tournament.run_sync(args.task)
     except Exception as e:
         print(f"Error running tournament: {e}", file=sys.stderr)
+        if checkpoint is not None and checkpoint.exists():
+            print(f"Completed phases saved to {checkpoint}; rerun with --resume", file=sys.stderr)
         return 1
 
     # Auto-output (unless disabled)
@@ -106,7 +904,35 @@ Examples:
         if not args.quiet:
             print(f"Saved Markdown to: {args.output_md}")
 
-    # Print final output
+    sink = _open_sink(args)
+    if sink is not None:
+        with sink:
+            sink.write(result)
+        if not args.quiet:
+            print(f"Appended result to: {sink.path}")
+
+    archive = _open_archive(args)
+    if archive is not None:
+        with archive:
+            archive_id = archive.add(result)
+        if not args.quiet:
+            print(f"Archived result #{archive_id} in: {archive.path}")
+
+    if args.stats and result.metrics:
+        print(result.metrics.to_markdown(), file=sys.stderr)
+
+    if result.partial:
+        print(
+            f"Stopped at the {result.stop_reason.replace('_', ' ')} after "
+            f"{', '.join(result.completed_phases)}; returning draft #{result.promoted_draft}",
+            file=sys.stderr,
+        )
+
+    # Print final output (already shown token by token when streaming,
+    # unless Round 3 was skipped or only streamed edits)
+    if args.stream and result.promoted_draft is None and args.synthesis_mode == "full":
+        return 0
+
     if not args.quiet:
         print()
         print("=" * 60)
@@ -1,18 +1,34 @@
 """Pydantic models for tournament data structures."""
 
+from adversarial_tournament.models.metrics import (
+    CallMetrics,
+    PhaseMetrics,
+    TournamentMetrics,
+)
 from adversarial_tournament.models.persona import Persona, PersonaSet
 from adversarial_tournament.models.tournament import (
     RoundOneOutput,
+    DraftCritique,
     RoundTwoCritique,
     RoundThreeOutput,
+    DraftEdit,
+    RoundThreePatch,
     TournamentResult,
 )
+from adversarial_tournament.models.checkpoint import TournamentCheckpoint
 
 __all__ = [
+    "CallMetrics",
+    "PhaseMetrics",
+    "TournamentMetrics",
     "Persona",
     "PersonaSet",
     "RoundOneOutput",
+    "DraftCritique",
     "RoundTwoCritique",
     "RoundThreeOutput",
+    "DraftEdit",
+    "RoundThreePatch",
     "TournamentResult",
+    "TournamentCheckpoint",
 ]
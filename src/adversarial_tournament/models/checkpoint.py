@@ -0,0 +1,55 @@
+"""Checkpoint of a tournament's completed phases, for resuming after a failure."""
+
+import os
+import tempfile
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from adversarial_tournament.models.persona import PersonaSet
+from adversarial_tournament.models.tournament import (
+    RoundOneOutput,
+    RoundThreeOutput,
+    RoundTwoCritique,
+)
+
+
+class TournamentCheckpoint(BaseModel):
+    """The outputs of every phase a tournament has completed so far."""
+
+    task: str = Field(description="The original task description")
+    contestants: int = Field(default=2, description="Number of contestants the tournament runs")
+    judges: int = Field(default=1, description="Number of judges the tournament runs")
+    personas: PersonaSet | None = Field(default=None, description="Phase 0 output")
+    round_one: RoundOneOutput | None = Field(default=None, description="Round 1 output")
+    round_two: RoundTwoCritique | None = Field(default=None, description="Round 2 output")
+    round_three: RoundThreeOutput | None = Field(default=None, description="Round 3 output")
+    promoted_draft: int | None = Field(
+        default=None, description="Draft promoted to the final output when Round 3 was skipped"
+    )
+
+    @property
+    def completed_phases(self) -> list[str]:
+        """The phases whose outputs are stored, in tournament order."""
+        outputs: dict[str, BaseModel | None] = {
+            "phase_zero": self.personas,
+            "round_one": self.round_one,
+            "round_two": self.round_two,
+            "round_three": self.round_three,
+        }
+        return [phase for phase, output in outputs.items() if output is not None]
+
+    def save(self, path: str | Path) -> None:
+        """Write the checkpoint as JSON, atomically replacing any previous one."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a crash mid-write never corrupts the last checkpoint
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(self.model_dump_json(indent=2))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "TournamentCheckpoint":
+        """Read a checkpoint written by ``save``."""
+        return cls.model_validate_json(Path(path).read_text())
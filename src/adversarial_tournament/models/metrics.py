@@ -0,0 +1,99 @@
+"""Latency and token-usage metrics collected while a tournament runs."""
+
+from pydantic import BaseModel, Field, computed_field
+
+
+class CallMetrics(BaseModel):
+    """Timing and usage of a single agent call."""
+
+    phase: str = Field(description="The tournament phase the call belongs to")
+    role: str = Field(description="The role that made the call (e.g. 'judge')")
+    model: str = Field(description="The model the call ran on")
+    started_at_s: float = Field(description="Start time relative to the tournament start")
+    duration_s: float = Field(description="Wall-clock duration of the call")
+    input_tokens: int = Field(default=0, description="Request (prompt) tokens")
+    cache_read_tokens: int = Field(
+        default=0, description="Request tokens served from the provider's prompt cache"
+    )
+    output_tokens: int = Field(default=0, description="Response (completion) tokens")
+    requests: int = Field(default=0, description="Model requests made, including retries")
+    retries: int = Field(
+        default=0,
+        description="Requests beyond the first (output validation and transient-error retries)",
+    )
+    attempts: int = Field(
+        default=1, description="Attempts made, including transient-error retries and fallbacks"
+    )
+    hedged: bool = Field(default=False, description="Whether a duplicate (hedged) request was fired")
+
+
+class PhaseMetrics(BaseModel):
+    """Wall-clock timing of one tournament phase."""
+
+    phase: str = Field(description="The tournament phase")
+    started_at_s: float = Field(description="Start time relative to the tournament start")
+    duration_s: float = Field(description="Wall-clock duration of the phase")
+
+
+class TournamentMetrics(BaseModel):
+    """Per-phase and per-call metrics for one tournament."""
+
+    total_duration_s: float = Field(description="Wall-clock duration of the whole tournament")
+    model: str | None = Field(
+        default=None,
+        description="The tournament's model (roles in role_models may run on others)",
+    )
+    phases: list[PhaseMetrics] = Field(default_factory=list, description="Timing per phase")
+    calls: list[CallMetrics] = Field(default_factory=list, description="Timing and usage per agent call")
+
+    @computed_field
+    @property
+    def input_tokens(self) -> int:
+        """Request tokens across all calls."""
+        return sum(call.input_tokens for call in self.calls)
+
+    @computed_field
+    @property
+    def cache_read_tokens(self) -> int:
+        """Request tokens served from the provider's prompt cache across all calls."""
+        return sum(call.cache_read_tokens for call in self.calls)
+
+    @computed_field
+    @property
+    def output_tokens(self) -> int:
+        """Response tokens across all calls."""
+        return sum(call.output_tokens for call in self.calls)
+
+    @computed_field
+    @property
+    def retries(self) -> int:
+        """Retries across all calls."""
+        return sum(call.retries for call in self.calls)
+
+    @computed_field
+    @property
+    def hedged_calls(self) -> int:
+        """Calls that fired a duplicate (hedged) request."""
+        return sum(call.hedged for call in self.calls)
+
+    def to_markdown(self) -> str:
+        """Render the metrics as markdown tables."""
+        phase_rows = "\n".join(
+            f"| {p.phase} | {p.started_at_s:.2f} | {p.duration_s:.2f} |" for p in self.phases
+        )
+        call_rows = "\n".join(
+            f"| {c.phase} | {c.role} | {c.model} | {c.started_at_s:.2f} | {c.duration_s:.2f} "
+            f"| {c.input_tokens} | {c.cache_read_tokens} | {c.output_tokens} | {c.requests} | {c.retries} |"
+            for c in self.calls
+        )
+
+        return f"""**Total time**: {self.total_duration_s:.2f}s | **Tokens**: {self.input_tokens} in ({self.cache_read_tokens} cached) / {self.output_tokens} out | **Retries**: {self.retries} | **Hedged calls**: {self.hedged_calls}
+
+| Phase | Start (s) | Duration (s) |
+| --- | --- | --- |
+{phase_rows}
+
+| Phase | Role | Model | Start (s) | Duration (s) | Input tokens | Cached tokens | Output tokens | Requests | Retries |
+| --- | --- | --- | --- | --- | --- | --- | --- | --- | --- |
+{call_rows}
+"""
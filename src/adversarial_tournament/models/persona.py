@@ -29,8 +29,26 @@ class PersonaSet(BaseModel):
 
     contestant_1: Persona = Field(description="First content creator persona")
     contestant_2: Persona = Field(description="Second content creator persona")
+    extra_contestants: list[Persona] = Field(
+        default_factory=list,
+        description="Further content creator personas, when more than two are requested",
+    )
     judge: Persona = Field(description="Adversarial critic persona")
+    extra_judges: list[Persona] = Field(
+        default_factory=list,
+        description="Further adversarial critic personas, when more than one is requested",
+    )
     task_context: str = Field(description="The original task being addressed")
     reasoning: str = Field(
         description="Explanation of why these personas were chosen for this task"
     )
+
+    @property
+    def contestants(self) -> list[Persona]:
+        """Every contestant, in draft order."""
+        return [self.contestant_1, self.contestant_2, *self.extra_contestants]
+
+    @property
+    def judges(self) -> list[Persona]:
+        """Every judge."""
+        return [self.judge, *self.extra_judges]
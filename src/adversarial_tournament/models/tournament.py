@@ -1,9 +1,21 @@
 """Tournament state and result models."""
 
+from typing import Annotated, Literal
+
 from pydantic import BaseModel, Field
 import ujson
 
-from adversarial_tournament.models.persona import PersonaSet
+from adversarial_tournament.models.metrics import TournamentMetrics
+from adversarial_tournament.models.persona import Persona, PersonaSet
+
+
+# A judge's rating of one draft, from 0 (unusable) to 10 (ready to publish as-is)
+Score = Annotated[float, Field(ge=0, le=10)]
+
+# Why a tournament stopped before running every phase
+StopReason = Literal["deadline", "token_budget"]
+
+_PHASES = ["phase_zero", "round_one", "round_two", "round_three"]
 
 
 class RoundOneOutput(BaseModel):
@@ -11,6 +23,49 @@ class RoundOneOutput(BaseModel):
 
     contestant_1_draft: str = Field(description="Complete draft from Contestant 1")
     contestant_2_draft: str = Field(description="Complete draft from Contestant 2")
+    extra_drafts: list[str] = Field(
+        default_factory=list,
+        description="Drafts from contestants 3 and up, in order",
+    )
+
+    @property
+    def drafts(self) -> list[str]:
+        """Every draft, in contestant order."""
+        return [self.contestant_1_draft, self.contestant_2_draft, *self.extra_drafts]
+
+    @classmethod
+    def from_drafts(cls, drafts: list[str]) -> "RoundOneOutput":
+        """Build the output from one draft per contestant (at least two)."""
+        return cls(
+            contestant_1_draft=drafts[0],
+            contestant_2_draft=drafts[1],
+            extra_drafts=drafts[2:],
+        )
+
+
+class DraftCritique(BaseModel):
+    """Round 2 critique of a single draft, used when rounds are pipelined."""
+
+    critique: str = Field(description="Brutal critique of the draft")
+    key_issues: list[str] = Field(
+        description="List of the most critical issues identified in this draft"
+    )
+    score: Score | None = Field(
+        default=None,
+        description="Score for the draft from 0 (unusable) to 10 (ready to publish as-is)",
+    )
+
+
+def _unique_issues(issues: list[str]) -> list[str]:
+    """Drop key issues that repeat an earlier one, ignoring case and spacing."""
+    seen: set[str] = set()
+    unique = []
+    for issue in issues:
+        normalized = " ".join(issue.lower().split())
+        if normalized not in seen:
+            seen.add(normalized)
+            unique.append(issue)
+    return unique
 
 
 class RoundTwoCritique(BaseModel):
@@ -22,10 +77,94 @@ class RoundTwoCritique(BaseModel):
     critique_of_contestant_2: str = Field(
         description="Brutal critique of Contestant 2's draft"
     )
+    extra_critiques: list[str] = Field(
+        default_factory=list,
+        description="Brutal critiques of the drafts from contestants 3 and up, in order",
+    )
     key_issues: list[str] = Field(
-        description="List of the most critical issues identified across both drafts"
+        description="List of the most critical issues identified across all drafts"
+    )
+    scores: list[Score] = Field(
+        default_factory=list,
+        description="Score for each draft from 0 (unusable) to 10 (ready to publish as-is), in contestant order",
     )
 
+    @property
+    def critiques(self) -> list[str]:
+        """Every critique, in contestant order."""
+        return [
+            self.critique_of_contestant_1,
+            self.critique_of_contestant_2,
+            *self.extra_critiques,
+        ]
+
+    def best_draft(self) -> tuple[int, float] | None:
+        """Return the (1-based draft number, score) of the top-scored draft, if scored."""
+        if not self.scores:
+            return None
+        best = max(range(len(self.scores)), key=self.scores.__getitem__)
+        return best + 1, self.scores[best]
+
+    @classmethod
+    def from_critiques(
+        cls,
+        critiques: list[str],
+        key_issues: list[str],
+        scores: list[float] | None = None,
+    ) -> "RoundTwoCritique":
+        """Build the output from one critique (and optionally one score) per draft."""
+        return cls(
+            critique_of_contestant_1=critiques[0],
+            critique_of_contestant_2=critiques[1],
+            extra_critiques=critiques[2:],
+            key_issues=key_issues,
+            scores=scores or [],
+        )
+
+    @classmethod
+    def merge(cls, *critiques: DraftCritique) -> "RoundTwoCritique":
+        """Combine per-draft critiques (one per draft, in order), dropping duplicate key issues.
+
+        Scores are kept only if every draft was scored.
+        """
+        scores = [critique.score for critique in critiques]
+        return cls.from_critiques(
+            [critique.critique for critique in critiques],
+            _unique_issues([issue for critique in critiques for issue in critique.key_issues]),
+            scores if None not in scores else None,
+        )
+
+    @classmethod
+    def combine(
+        cls, critiques: list["RoundTwoCritique"], judge_names: list[str]
+    ) -> "RoundTwoCritique":
+        """Combine the critiques of several judges into one.
+
+        Each draft's critique lists every judge's view under the judge's name,
+        key issues are pooled without duplicates, and each draft's score is
+        the mean of the judges' scores (kept only if every judge scored every
+        draft). A single critique is returned unchanged.
+        """
+        if len(critiques) == 1:
+            return critiques[0]
+
+        drafts = len(critiques[0].critiques)
+        per_draft = zip(*(critique.critiques for critique in critiques))
+        scores = None
+        if all(len(critique.scores) == drafts for critique in critiques):
+            scores = [
+                sum(draft_scores) / len(draft_scores)
+                for draft_scores in zip(*(critique.scores for critique in critiques))
+            ]
+        return cls.from_critiques(
+            [
+                "\n\n".join(f"**{name}:** {text}" for name, text in zip(judge_names, texts))
+                for texts in per_draft
+            ],
+            _unique_issues([issue for critique in critiques for issue in critique.key_issues]),
+            scores,
+        )
+
 
 class RoundThreeOutput(BaseModel):
     """Output from Round 3: The Synthesis."""
@@ -38,14 +177,69 @@ class RoundThreeOutput(BaseModel):
     )
 
 
+class DraftEdit(BaseModel):
+    """One targeted change to the base draft in patch-based synthesis."""
+
+    operation: Literal["replace", "insert", "delete"] = Field(
+        description="replace the anchor with text, insert text right after the anchor, or delete the anchor"
+    )
+    anchor: str = Field(
+        description="Passage copied exactly from the base draft, long enough to occur only once"
+    )
+    text: str = Field(
+        default="", description="The replacement or inserted text (empty for delete)"
+    )
+
+
+class RoundThreePatch(BaseModel):
+    """Round 3 output in patch mode: edits that turn one draft into the final output."""
+
+    collaboration_discussion: str = Field(
+        description="Brief discussion between contestants about addressing feedback"
+    )
+    base_draft: int = Field(ge=1, description="Number of the draft the edits apply to")
+    edits: list[DraftEdit] = Field(
+        description="Edits applied to the base draft in order, each against the result of the previous ones"
+    )
+
+
 class TournamentResult(BaseModel):
     """Complete tournament result with all rounds and metadata."""
 
     task: str = Field(description="The original task description")
     personas: PersonaSet = Field(description="The personas used in this tournament")
-    round_one: RoundOneOutput = Field(description="Round 1 results")
-    round_two: RoundTwoCritique = Field(description="Round 2 results")
+    round_one: RoundOneOutput | None = Field(
+        default=None, description="Round 1 results (None if the tournament stopped before it completed)"
+    )
+    round_two: RoundTwoCritique | None = Field(
+        default=None, description="Round 2 results (None if the tournament stopped before it completed)"
+    )
     round_three: RoundThreeOutput = Field(description="Round 3 results")
+    promoted_draft: int | None = Field(
+        default=None,
+        description="Number of the draft promoted to the final output when Round 3 was skipped",
+    )
+    completed_phases: list[str] = Field(
+        default_factory=lambda: list(_PHASES),
+        description="Phases that ran to completion, in order (Round 3 is left out when skipped)",
+    )
+    stop_reason: StopReason | None = Field(
+        default=None,
+        description="Why the tournament stopped early and returned its best draft, if it did",
+    )
+
+    metrics: TournamentMetrics | None = Field(
+        default=None, description="Latency and token usage per phase and agent call"
+    )
+
+    @property
+    def partial(self) -> bool:
+        """Whether the tournament stopped at its deadline or token budget."""
+        return self.stop_reason is not None
+
+    @property
+    def _stop_label(self) -> str:
+        return (self.stop_reason or "").replace("_", " ")
 
     def to_json(self) -> str:
         """Machine-readable JSON output using ujson."""
@@ -53,81 +247,91 @@ class TournamentResult(BaseModel):
 
     def to_markdown(self) -> str:
         """Human-readable markdown transcript."""
-        issues_md = "\n".join(f"- {issue}" for issue in self.round_two.key_issues)
-
-        return f"""# Adversarial Tournament Results
-
-## Task
-{self.task}
-
----
-
-## Personas Generated
-
-### Contestant 1: {self.personas.contestant_1.name}
-- **Role**: {self.personas.contestant_1.role}
-- **Goal**: {self.personas.contestant_1.goal}
-- **Communication Style**: {self.personas.contestant_1.communication_style}
-- **Key Traits**: {", ".join(self.personas.contestant_1.key_traits)}
-
-**Backstory**: {self.personas.contestant_1.backstory}
-
-### Contestant 2: {self.personas.contestant_2.name}
-- **Role**: {self.personas.contestant_2.role}
-- **Goal**: {self.personas.contestant_2.goal}
-- **Communication Style**: {self.personas.contestant_2.communication_style}
-- **Key Traits**: {", ".join(self.personas.contestant_2.key_traits)}
-
-**Backstory**: {self.personas.contestant_2.backstory}
+        contestants = self.personas.contestants
+        judges = self.personas.judges
+        stopped = f"_Not completed: the tournament stopped at its {self._stop_label}._\n\n---\n\n"
+        metrics_md = (
+            f"\n---\n\n## Metrics\n\n{self.metrics.to_markdown()}" if self.metrics else ""
+        )
+
+        def persona_md(title: str, persona: Persona) -> str:
+            return f"""### {title}: {persona.name}
+- **Role**: {persona.role}
+- **Goal**: {persona.goal}
+- **Communication Style**: {persona.communication_style}
+- **Key Traits**: {", ".join(persona.key_traits)}
+
+**Backstory**: {persona.backstory}
 
-### Judge: {self.personas.judge.name}
-- **Role**: {self.personas.judge.role}
-- **Goal**: {self.personas.judge.goal}
-- **Communication Style**: {self.personas.judge.communication_style}
-- **Key Traits**: {", ".join(self.personas.judge.key_traits)}
-
-**Backstory**: {self.personas.judge.backstory}
-
-**Persona Selection Reasoning**: {self.personas.reasoning}
-
----
-
-## Round 1: Initial Drafts
+"""
 
-### {self.personas.contestant_1.name}'s Draft
+        personas_md = "".join(
+            persona_md(f"Contestant {number}", persona)
+            for number, persona in enumerate(contestants, start=1)
+        ) + "".join(
+            persona_md("Judge" if len(judges) == 1 else f"Judge {number}", persona)
+            for number, persona in enumerate(judges, start=1)
+        )
+        drafts_md = stopped
+        if self.round_one is not None:
+            drafts_md = "".join(
+                f"""### {persona.name}'s Draft
 
-{self.round_one.contestant_1_draft}
+{draft}
 
 ---
 
-### {self.personas.contestant_2.name}'s Draft
+"""
+                for persona, draft in zip(contestants, self.round_one.drafts)
+            )
+        critiques_md = stopped
+        if self.round_two is not None:
+            scores = self.round_two.scores or [None] * len(contestants)
+            issues_md = "\n".join(f"- {issue}" for issue in self.round_two.key_issues)
+            critiques_md = "".join(
+                f"""**Critique of {persona.name}:**{f" (score: {score:g}/10)" if score is not None else ""}
 
-{self.round_one.contestant_2_draft}
+{critique}
 
 ---
 
-## Round 2: The Roast
-
-### {self.personas.judge.name}'s Critique
+"""
+                for persona, critique, score in zip(contestants, self.round_two.critiques, scores)
+            ) + f"**Key Issues Identified:**\n{issues_md}\n\n---\n\n"
+        if self.stop_reason is not None:
+            round_three_title = (
+                f"## Round 3: Skipped (stopped at the {self._stop_label}, best draft promoted)"
+            )
+        elif self.promoted_draft is not None:
+            round_three_title = "## Round 3: Skipped (draft promoted)"
+        else:
+            round_three_title = "## Round 3: The Synthesis"
+        critics = (
+            f"{judges[0].name}'s Critique"
+            if len(judges) == 1
+            else "Critique from " + ", ".join(judge.name for judge in judges)
+        )
 
-**Critique of {self.personas.contestant_1.name}:**
+        return f"""# Adversarial Tournament Results
 
-{self.round_two.critique_of_contestant_1}
+## Task
+{self.task}
 
 ---
 
-**Critique of {self.personas.contestant_2.name}:**
+## Personas Generated
 
-{self.round_two.critique_of_contestant_2}
+{personas_md}**Persona Selection Reasoning**: {self.personas.reasoning}
 
 ---
 
-**Key Issues Identified:**
-{issues_md}
+## Round 1: Initial Drafts
 
----
+{drafts_md}## Round 2: The Roast
 
-## Round 3: The Synthesis
+### {critics}
+
+{critiques_md}{round_three_title}
 
 ### Collaboration Discussion
 
@@ -138,4 +342,4 @@ class TournamentResult(BaseModel):
 ## Final Output
 
 {self.round_three.final_output}
-"""
+{metrics_md}"""
@@ -0,0 +1,41 @@
+"""Local application of patch-based Round 3 edits."""
+
+from adversarial_tournament.exceptions import PatchError
+from adversarial_tournament.models.tournament import DraftEdit
+
+
+def apply_edits(base: str, edits: list[DraftEdit]) -> str:
+    """Apply edits to a draft, in order, each against the previous result.
+
+    Every anchor must occur exactly once in the text it is applied to, so an
+    edit can never land somewhere the model did not mean.
+
+    Args:
+        base: The draft being edited.
+        edits: The edits to apply.
+
+    Returns:
+        The edited text.
+
+    Raises:
+        PatchError: If an anchor is empty, missing or ambiguous.
+    """
+    text = base
+    for index, edit in enumerate(edits):
+        if not edit.anchor:
+            raise PatchError(f"edit {index + 1} has an empty anchor", index)
+
+        count = text.count(edit.anchor)
+        if count != 1:
+            problem = "not found" if count == 0 else f"found {count} times"
+            raise PatchError(f"edit {index + 1}: anchor {edit.anchor[:40]!r} {problem}", index)
+
+        start = text.index(edit.anchor)
+        end = start + len(edit.anchor)
+        if edit.operation == "replace":
+            text = text[:start] + edit.text + text[end:]
+        elif edit.operation == "insert":
+            text = text[:end] + edit.text + text[end:]
+        else:
+            text = text[:start] + text[end:]
+    return text
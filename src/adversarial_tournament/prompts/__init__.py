@@ -1,19 +1,29 @@
 """Prompt templates for tournament agents."""
 
 from adversarial_tournament.prompts.templates import (
+    PromptLayout,
+    SynthesisMode,
     build_persona_generator_prompt,
     build_contestant_prompt,
     build_judge_prompt,
+    build_synthesizer_prompt,
     build_round_one_prompt,
+    build_shared_context,
     build_round_two_prompt,
+    build_draft_critique_prompt,
     build_round_three_prompt,
 )
 
 __all__ = [
+    "PromptLayout",
+    "SynthesisMode",
     "build_persona_generator_prompt",
     "build_contestant_prompt",
     "build_judge_prompt",
+    "build_synthesizer_prompt",
     "build_round_one_prompt",
+    "build_shared_context",
     "build_round_two_prompt",
+    "build_draft_critique_prompt",
     "build_round_three_prompt",
 ]
@@ -1,10 +1,47 @@
 """System prompt templates for tournament agents."""
 
+from collections.abc import Sequence
+from typing import Literal
+
 from adversarial_tournament.models.persona import Persona, PersonaSet
 
+# How Round 2 and Round 3 prompts are laid out:
+# - "persona_first": each prompt opens with the role's persona header
+# - "shared_prefix": each prompt opens with the task and the drafts and ends
+#   with the role's instructions, so requests of one round (which send the
+#   same output tool) can be served from the provider's prompt cache
+PromptLayout = Literal["persona_first", "shared_prefix"]
+
+# How Round 3 produces the final output:
+# - "full": the synthesizer writes the whole final output
+# - "patch": the synthesizer picks a base draft and returns targeted edits,
+#   which are applied locally (far fewer output tokens for long documents)
+SynthesisMode = Literal["full", "patch"]
+
+
+def _join(names: Sequence[str]) -> str:
+    """Join names as 'A', 'A and B' or 'A, B and C'."""
+    if len(names) <= 1:
+        return "".join(names)
+    return f"{', '.join(names[:-1])} and {names[-1]}"
+
+
+def build_persona_generator_prompt(contestants: int = 2, judges: int = 1) -> str:
+    """System prompt for persona generation agent.
+
+    Args:
+        contestants: Number of contestant personas to create (at least 2).
+        judges: Number of judge personas to create (at least 1).
+    """
+    extra = ""
+    if contestants > 2 or judges > 1:
+        extra = f"""
+
+ADDITIONAL PERSONAS: This tournament has {contestants} contestants and {judges} judges.
+Put contestants 3 to {contestants} in extra_contestants and judges 2 to {judges} in extra_judges
+(leave a list empty if none are needed). Every additional persona must bring a distinct
+perspective that the others do not already cover."""
 
-def build_persona_generator_prompt() -> str:
-    """System prompt for persona generation agent."""
     return """You are a Persona Architect - an expert in organizational psychology and communication dynamics.
 
 You understand that the best outputs emerge from productive tension between different perspectives.
@@ -40,7 +77,7 @@ For each persona, provide:
 
 Also explain your reasoning for why these specific personas are ideal for this task.
 
-IMPORTANT: The personas must be specifically tailored to the task, not generic."""
+IMPORTANT: The personas must be specifically tailored to the task, not generic.""" + extra
 
 
 def build_contestant_prompt(persona: Persona) -> str:
@@ -83,6 +120,20 @@ You will call out every weakness because you know that harsh feedback now leads
 final product. Your criticism is constructive - you point out problems AND suggest what would be better."""
 
 
+def build_synthesizer_prompt(lead_persona: Persona, *partner_personas: Persona) -> str:
+    """Build the Round 3 synthesis system prompt."""
+    partners = _join([partner.name for partner in partner_personas])
+    drafts = "both drafts" if len(partner_personas) == 1 else "all drafts"
+
+    return f"""You are {lead_persona.name}, {lead_persona.role}.
+
+You are now collaborating with {partners} to synthesize the best
+final output incorporating all feedback from the judge.
+
+Your goal is to create a unified output that addresses every criticism and combines
+the best elements of {drafts}."""
+
+
 def build_round_one_prompt(persona: Persona, task: str) -> str:
     """Build the Round 1 draft prompt for a contestant."""
     traits_str = ", ".join(persona.key_traits)
@@ -108,15 +159,109 @@ INSTRUCTIONS:
 Produce your complete draft now."""
 
 
+def _drafts_block(contestants: Sequence[Persona], drafts: Sequence[str]) -> str:
+    return "\n\n".join(
+        f"""=== DRAFT {number} (from {persona.name}, {persona.role}) ===
+{draft}
+=== END DRAFT {number} ==="""
+        for number, (persona, draft) in enumerate(zip(contestants, drafts), start=1)
+    )
+
+
+def build_shared_context(
+    contestants: Sequence[Persona], task: str, drafts: Sequence[str]
+) -> str:
+    """Build the task-and-drafts block that opens Round 2 and Round 3 prompts.
+
+    Used by the "shared_prefix" layout; the output depends only on its
+    arguments, so every judge sends it byte for byte. Round 3 sends it too,
+    but behind a different output tool, so it does not hit Round 2's cache.
+    """
+    return f"""ORIGINAL TASK: {task}
+
+{_drafts_block(contestants, drafts)}"""
+
+
+def _round_two_mission(judge_persona: Persona, drafts: int) -> str:
+    every = "BOTH" if drafts == 2 else f"ALL {drafts}"
+    return f"""YOUR MISSION: Provide BRUTAL, HONEST critique of {every} drafts.
+
+For EACH draft, identify and call out:
+1. Every excuse, hedge, or weasel word
+2. Any vague or evasive language that avoids taking responsibility
+3. Any tone-deaf or insincere moments
+4. What's missing or inadequate from YOUR perspective as {judge_persona.role}
+5. Specific passages that fail (quote them directly)
+
+BE SPECIFIC. Quote the problematic text. Explain WHY it fails.
+
+Your critique should be harsh but constructive - the goal is to force a genuinely good final output.
+
+After critiquing {every.lower()} drafts, provide a list of KEY ISSUES that MUST be fixed.
+These are the critical problems that would make the output fail if left unaddressed.
+
+Finally, score each draft from 0 to 10 in scores (one per draft, in draft order), where 10 means
+it is ready to publish exactly as written. Reserve 9 and above for drafts with no real problems left.
+
+Remember: You are {judge_persona.name}. You have real stakes in this. Don't hold back."""
+
+
 def build_round_two_prompt(
     judge_persona: Persona,
-    contestant_1_persona: Persona,
-    contestant_2_persona: Persona,
+    contestants: Sequence[Persona],
     task: str,
-    draft_1: str,
-    draft_2: str,
+    drafts: Sequence[str],
+    layout: PromptLayout = "persona_first",
 ) -> str:
-    """Build the Round 2 critique prompt for the judge."""
+    """Build the Round 2 critique prompt for a judge.
+
+    Drafts beyond the first two are critiqued into ``extra_critiques``. With
+    the "shared_prefix" layout the judge's system prompt is included at the
+    end, after the shared context; the judge agent is then built without
+    instructions.
+    """
+    traits_str = ", ".join(judge_persona.key_traits)
+    count = "two" if len(drafts) == 2 else str(len(drafts))
+    perspective = f"""YOUR PERSPECTIVE:
+- Goal: {judge_persona.goal}
+- Key Traits: {traits_str}
+- Communication Style: {judge_persona.communication_style}"""
+
+    if layout == "shared_prefix":
+        return f"""{build_shared_context(contestants, task, drafts)}
+
+=== YOUR ROLE ===
+{build_judge_prompt(judge_persona)}
+
+{perspective}
+
+You have been asked to review the {count} drafts above.
+
+{_round_two_mission(judge_persona, len(drafts))}"""
+
+    return f"""You are {judge_persona.name}, a {judge_persona.role}.
+
+{perspective}
+
+BACKGROUND: {judge_persona.backstory}
+
+You have been asked to review {count} drafts responding to:
+
+ORIGINAL TASK: {task}
+
+{_drafts_block(contestants, drafts)}
+
+{_round_two_mission(judge_persona, len(drafts))}"""
+
+
+def build_draft_critique_prompt(
+    judge_persona: Persona,
+    contestant_persona: Persona,
+    task: str,
+    draft: str,
+    draft_number: int,
+) -> str:
+    """Build the Round 2 critique prompt for a single draft (pipelined rounds)."""
     traits_str = ", ".join(judge_persona.key_traits)
 
     return f"""You are {judge_persona.name}, a {judge_persona.role}.
@@ -128,21 +273,17 @@ YOUR PERSPECTIVE:
 
 BACKGROUND: {judge_persona.backstory}
 
-You have been asked to review two drafts responding to:
+You have been asked to review a draft responding to:
 
 ORIGINAL TASK: {task}
 
-=== DRAFT 1 (from {contestant_1_persona.name}, {contestant_1_persona.role}) ===
-{draft_1}
-=== END DRAFT 1 ===
+=== DRAFT {draft_number} (from {contestant_persona.name}, {contestant_persona.role}) ===
+{draft}
+=== END DRAFT {draft_number} ===
 
-=== DRAFT 2 (from {contestant_2_persona.name}, {contestant_2_persona.role}) ===
-{draft_2}
-=== END DRAFT 2 ===
+YOUR MISSION: Provide BRUTAL, HONEST critique of this draft.
 
-YOUR MISSION: Provide BRUTAL, HONEST critique of BOTH drafts.
-
-For EACH draft, identify and call out:
+Identify and call out:
 1. Every excuse, hedge, or weasel word
 2. Any vague or evasive language that avoids taking responsibility
 3. Any tone-deaf or insincere moments
@@ -153,58 +294,51 @@ BE SPECIFIC. Quote the problematic text. Explain WHY it fails.
 
 Your critique should be harsh but constructive - the goal is to force a genuinely good final output.
 
-After critiquing both drafts, provide a list of KEY ISSUES that MUST be fixed.
+After critiquing the draft, provide a list of KEY ISSUES that MUST be fixed.
 These are the critical problems that would make the output fail if left unaddressed.
 
+Finally, score the draft from 0 to 10, where 10 means it is ready to publish exactly as written.
+Reserve 9 and above for drafts with no real problems left.
+
 Remember: You are {judge_persona.name}. You have real stakes in this. Don't hold back."""
 
 
-def build_round_three_prompt(
-    contestant_1_persona: Persona,
-    contestant_2_persona: Persona,
-    judge_persona: Persona,
-    task: str,
-    draft_1: str,
-    draft_2: str,
-    critique_1: str,
-    critique_2: str,
-    key_issues: list[str],
+def _round_three_mission(
+    partners: Sequence[Persona], judges: Sequence[Persona], synthesis: SynthesisMode
 ) -> str:
-    """Build the Round 3 synthesis prompt."""
-    issues_str = "\n".join(f"- {issue}" for issue in key_issues)
-
-    return f"""You are {contestant_1_persona.name}, {contestant_1_persona.role}.
-
-You have just received harsh but valuable feedback from {judge_persona.name} ({judge_persona.role}).
-You are now collaborating with {contestant_2_persona.name} ({contestant_2_persona.role}) to create
-a unified final output that addresses ALL criticisms.
+    drafts = "both drafts" if len(partners) == 1 else "all drafts"
+    if synthesis == "patch":
+        return f"""YOUR MISSION:
 
-ORIGINAL TASK: {task}
-
-=== YOUR ORIGINAL DRAFT ===
-{draft_1}
-=== END YOUR DRAFT ===
-
-=== {contestant_2_persona.name.upper()}'S ORIGINAL DRAFT ===
-{draft_2}
-=== END THEIR DRAFT ===
-
-=== {judge_persona.name.upper()}'S CRITIQUE OF YOUR DRAFT ===
-{critique_1}
-=== END CRITIQUE ===
+STEP 1 - COLLABORATION DISCUSSION
+First, briefly discuss with {_join([p.name for p in partners])} how to address each critique:
+- Acknowledge what each of you got wrong
+- Identify the best elements from each draft to keep
+- Agree on how to address each key issue
+- Pick the draft that needs the least work as the base
+
+STEP 2 - EDITS
+Do NOT rewrite the output. Set base_draft to the number of the draft you build on (1 is your
+draft, then the others in the order shown) and list the edits that turn it into ONE unified
+final output that:
+- Addresses EVERY criticism raised by {_join([j.name for j in judges])}
+- Brings in the best elements of {drafts}
+- Leaves NO room for further criticism
+- Is complete, professional, and ready to use
 
-=== {judge_persona.name.upper()}'S CRITIQUE OF {contestant_2_persona.name.upper()}'S DRAFT ===
-{critique_2}
-=== END CRITIQUE ===
+Each edit quotes an anchor copied EXACTLY from the base draft, just long enough to occur only once:
+- replace: the anchor is replaced by text
+- insert: text is inserted right after the anchor
+- delete: the anchor is removed
+Edits apply in order, each to the result of the previous ones. Keep anchors short and leave
+everything that does not need to change untouched.
 
-=== KEY ISSUES THAT MUST BE ADDRESSED ===
-{issues_str}
-=== END KEY ISSUES ===
+Be humble about the feedback. The judge's perspective matters. Create something genuinely good."""
 
-YOUR MISSION:
+    return f"""YOUR MISSION:
 
 STEP 1 - COLLABORATION DISCUSSION
-First, briefly discuss with {contestant_2_persona.name} how to address each critique:
+First, briefly discuss with {_join([p.name for p in partners])} how to address each critique:
 - Acknowledge what each of you got wrong
 - Identify the best elements from each draft to keep
 - Agree on how to address each key issue
@@ -212,9 +346,99 @@ First, briefly discuss with {contestant_2_persona.name} how to address each crit
 
 STEP 2 - FINAL OUTPUT
 Then, produce ONE unified final output that:
-- Addresses EVERY criticism raised by {judge_persona.name}
-- Combines the best elements of both drafts
+- Addresses EVERY criticism raised by {_join([j.name for j in judges])}
+- Combines the best elements of {drafts}
 - Leaves NO room for further criticism
 - Is complete, professional, and ready to use
 
 Be humble about the feedback. The judge's perspective matters. Create something genuinely good."""
+
+
+def build_round_three_prompt(
+    contestants: Sequence[Persona],
+    judges: Sequence[Persona],
+    task: str,
+    drafts: Sequence[str],
+    critiques: Sequence[str],
+    key_issues: list[str],
+    layout: PromptLayout = "persona_first",
+    synthesis: SynthesisMode = "full",
+) -> str:
+    """Build the Round 3 synthesis prompt.
+
+    The first contestant leads the synthesis with every other contestant.
+    With ``synthesis="patch"`` the synthesizer is asked for edits against a
+    base draft (``RoundThreePatch``) instead of the full final output.
+    With the "shared_prefix" layout the synthesizer's system prompt is
+    included after the shared context; the synthesizer agent is then built
+    without instructions.
+    """
+    lead, *partners = contestants
+    issues_str = "\n".join(f"- {issue}" for issue in key_issues)
+    critics = f"{judges[0].name.upper()}'S" if len(judges) == 1 else "THE JUDGES'"
+    feedback_from = _join([f"{j.name} ({j.role})" for j in judges])
+    issues_block = f"""=== KEY ISSUES THAT MUST BE ADDRESSED ===
+{issues_str}
+=== END KEY ISSUES ==="""
+
+    if layout == "shared_prefix":
+        authors = "; ".join(
+            f"{p.name} ({p.role}) wrote DRAFT {number}"
+            for number, p in enumerate(partners, start=2)
+        )
+        critiques_block = "\n\n".join(
+            f"""=== {critics} CRITIQUE OF DRAFT {number} ===
+{critique}
+=== END CRITIQUE ==="""
+            for number, critique in enumerate(critiques, start=1)
+        )
+        return f"""{build_shared_context(contestants, task, drafts)}
+
+=== YOUR ROLE ===
+{build_synthesizer_prompt(lead, *partners)}
+
+You wrote DRAFT 1; {authors}.
+You have just received harsh but valuable feedback from {feedback_from}.
+
+{critiques_block}
+
+{issues_block}
+
+{_round_three_mission(partners, judges, synthesis)}"""
+
+    partner_drafts = "\n\n".join(
+        f"""=== {p.name.upper()}'S ORIGINAL DRAFT ===
+{draft}
+=== END THEIR DRAFT ==="""
+        for p, draft in zip(partners, drafts[1:])
+    )
+    partner_critiques = "\n\n".join(
+        f"""=== {critics} CRITIQUE OF {p.name.upper()}'S DRAFT ===
+{critique}
+=== END CRITIQUE ==="""
+        for p, critique in zip(partners, critiques[1:])
+    )
+
+    return f"""You are {lead.name}, {lead.role}.
+
+You have just received harsh but valuable feedback from {feedback_from}.
+You are now collaborating with {_join([f"{p.name} ({p.role})" for p in partners])} to create
+a unified final output that addresses ALL criticisms.
+
+ORIGINAL TASK: {task}
+
+=== YOUR ORIGINAL DRAFT ===
+{drafts[0]}
+=== END YOUR DRAFT ===
+
+{partner_drafts}
+
+=== {critics} CRITIQUE OF YOUR DRAFT ===
+{critiques[0]}
+=== END CRITIQUE ===
+
+{partner_critiques}
+
+{issues_block}
+
+{_round_three_mission(partners, judges, synthesis)}"""
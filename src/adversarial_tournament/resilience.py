@@ -0,0 +1,127 @@
+"""Resilience policy for agent calls: timeouts, retries, hedging and fallbacks.
+
+Every agent call of a tournament runs under a ``ResiliencePolicy``. A call
+that times out or fails with a transient error (rate limit, server error,
+dropped connection) is retried with jittered exponential backoff, then moved
+to the next fallback model. Hedging fires a duplicate request once a call has
+run longer than the recent p95 latency of its role and keeps whichever
+response arrives first, cutting the straggler tail.
+"""
+
+import random
+import re
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+import httpx
+from pydantic_ai.exceptions import ModelAPIError, ModelHTTPError
+from pydantic_ai.models import Model
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits and server errors
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 425, 429})
+
+# Recent call durations kept per role for the hedging quantile
+_LATENCY_WINDOW = 200
+
+
+def role_kind(role: str) -> str:
+    """Strip the contestant/judge number from a role ('judge_2' -> 'judge')."""
+    return re.sub(r"_\d+$", "", role)
+
+
+def setting_role(role: str) -> str:
+    """Return the role kind per-role settings are keyed by.
+
+    Like ``role_kind``, but the patch synthesizer shares the settings of the
+    synthesizer ('patch_synthesizer' -> 'synthesizer').
+    """
+    return role_kind(role).removeprefix("patch_")
+
+
+def is_transient(error: BaseException) -> bool:
+    """Return True if retrying the call that raised ``error`` may succeed."""
+    seen: BaseException | None = error
+    while seen is not None:
+        if isinstance(seen, ModelHTTPError):
+            return seen.status_code in RETRYABLE_STATUS_CODES or seen.status_code >= 500
+        if isinstance(seen, (ModelAPIError, TimeoutError, ConnectionError, httpx.TransportError)):
+            return True
+        seen = seen.__cause__
+    return False
+
+
+@dataclass(frozen=True)
+class ResiliencePolicy:
+    """How agent calls cope with slow and failing requests.
+
+    Attributes:
+        timeout_s: Timeout per attempt for every role, or None for no limit.
+        role_timeouts: Timeouts overriding ``timeout_s`` for specific roles,
+            keyed by role ('contestant_2', 'patch_synthesizer') or role kind
+            ('contestant' covers every contestant, 'synthesizer' both the full
+            and the patch synthesis).
+        max_attempts: Attempts per model before moving to the next fallback
+            model (1 disables retries).
+        backoff_base_s: Upper bound of the first retry delay; it doubles with
+            every further attempt (full jitter).
+        backoff_max_s: Cap on the retry delay.
+        hedge_quantile: Latency quantile after which a duplicate request is
+            fired (e.g. 0.95), or None to disable hedging.
+        hedge_min_samples: Completed calls of a role needed before its calls
+            are hedged.
+        fallback_models: Models tried, in order, once every attempt on the
+            tournament model failed.
+    """
+
+    timeout_s: float | None = None
+    role_timeouts: Mapping[str, float] = field(default_factory=dict)
+    max_attempts: int = 3
+    backoff_base_s: float = 0.5
+    backoff_max_s: float = 8.0
+    hedge_quantile: float | None = None
+    hedge_min_samples: int = 10
+    fallback_models: tuple[Model | str, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        timeouts = [self.timeout_s, *self.role_timeouts.values()]
+        if any(t is not None and t <= 0 for t in timeouts):
+            raise ValueError("timeouts must be positive")
+        if self.hedge_quantile is not None and not 0 < self.hedge_quantile < 1:
+            raise ValueError("hedge_quantile must be between 0 and 1")
+
+    def timeout_for(self, role: str) -> float | None:
+        """Return the per-attempt timeout for a role (most specific key first)."""
+        for key in (role, role_kind(role), setting_role(role)):
+            if key in self.role_timeouts:
+                return self.role_timeouts[key]
+        return self.timeout_s
+
+    def backoff(self, attempt: int, rng: random.Random | None = None) -> float:
+        """Return the delay before retrying after failed attempt number ``attempt`` (from 0)."""
+        ceiling = min(self.backoff_max_s, self.backoff_base_s * 2**attempt)
+        return (rng or random).uniform(0, ceiling)
+
+
+class LatencyTracker:
+    """Recent successful call durations per role kind, for hedging delays."""
+
+    def __init__(self, window: int = _LATENCY_WINDOW):
+        self._window = window
+        self._durations: dict[str, deque[float]] = {}
+
+    def record(self, role: str, duration_s: float) -> None:
+        """Record the duration of one successful call."""
+        kind = role_kind(role)
+        if kind not in self._durations:
+            self._durations[kind] = deque(maxlen=self._window)
+        self._durations[kind].append(duration_s)
+
+    def quantile(self, role: str, q: float, min_samples: int = 1) -> float | None:
+        """Return the ``q`` quantile of recent durations, or None with too few samples."""
+        durations = sorted(self._durations.get(role_kind(role), ()))
+        if not durations or len(durations) < min_samples:
+            return None
+        return durations[min(int(q * len(durations)), len(durations) - 1)]
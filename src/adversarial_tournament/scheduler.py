@@ -0,0 +1,253 @@
+"""Rate Limit Scheduler - Shared per-model request and token budgets.
+
+Tournaments that share a ``RateLimitScheduler`` draw every model request
+from the same per-model token buckets (requests per minute and tokens per
+minute), so concurrent tournaments stay inside the provider's quota instead
+of bursting into 429s. Waiting requests are admitted by priority: later
+phases first, and within a phase the tournament that started first, so
+tournaments in Round 3 finish before new ones start Phase 0.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from adversarial_tournament.events import Phase
+
+# Lower runs first: finishing tournaments beats starting new ones
+PHASE_PRIORITY: dict[Phase, int] = {
+    "round_three": 0,
+    "round_two": 1,
+    "round_one": 2,
+    "phase_zero": 3,
+}
+
+# Characters per token for prompt cost estimates
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the tokens in a prompt (about 4 characters per token)."""
+    return math.ceil(len(text) / _CHARS_PER_TOKEN)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Quota of one model.
+
+    Attributes:
+        requests_per_minute: Requests allowed per minute, or None for no limit.
+        tokens_per_minute: Tokens (prompt plus completion) allowed per minute,
+            or None for no limit.
+        burst_s: Seconds' worth of quota that may be spent at once; lower
+            values spread requests more evenly across the minute.
+    """
+
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+    burst_s: float = 10.0
+
+    def __post_init__(self) -> None:
+        for value in (self.requests_per_minute, self.tokens_per_minute, self.burst_s):
+            if value is not None and value <= 0:
+                raise ValueError("rate limits must be positive")
+
+
+class _Bucket:
+    """Token bucket refilled continuously at ``per_minute / 60`` per second."""
+
+    def __init__(self, per_minute: float, burst_s: float):
+        self.rate = per_minute / 60
+        self.capacity = max(self.rate * burst_s, 1.0)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_for(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` can be taken (amounts above capacity need a full bucket)."""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.level
+        return max(missing / self.rate, 0.0)
+
+    def take(self, amount: float) -> None:
+        # May go negative: an oversized request is paid back by later refills
+        self.level -= amount
+
+    def give(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+@dataclass
+class _ModelState:
+    requests: _Bucket | None
+    tokens: _Bucket | None
+    waiters: list[tuple[tuple[float, ...], int, asyncio.Future[None], int]] = field(
+        default_factory=list
+    )
+    paused_until: float = 0.0
+    timer: asyncio.TimerHandle | None = None
+
+    def wait_for(self, tokens: int, now: float) -> float:
+        wait = self.paused_until - now
+        if self.requests is not None:
+            wait = max(wait, self.requests.wait_for(1, now))
+        if self.tokens is not None:
+            wait = max(wait, self.tokens.wait_for(tokens, now))
+        return max(wait, 0.0)
+
+    def take(self, tokens: int) -> None:
+        if self.requests is not None:
+            self.requests.take(1)
+        if self.tokens is not None:
+            self.tokens.take(tokens)
+
+
+class Reservation:
+    """Quota reserved for one request; report actual usage with ``used``."""
+
+    def __init__(self, model: str, tokens: int):
+        self.model = model
+        self.tokens = tokens
+        self.actual_tokens: int | None = None
+
+    def used(self, tokens: int) -> None:
+        """Record the tokens the request actually consumed."""
+        self.actual_tokens = tokens
+
+
+class RateLimitScheduler:
+    """Admits model requests within per-model rate limits, by priority.
+
+    Share one scheduler between tournaments (``AdversarialTournament(scheduler=...)``)
+    to coordinate all of their requests. Each request reserves one request
+    and its estimated tokens (prompt plus ``expected_output_tokens``); the
+    estimate is corrected once the actual usage is known.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, RateLimit] | None = None,
+        default: RateLimit | None = None,
+        expected_output_tokens: int = 1024,
+    ):
+        """Create a scheduler.
+
+        Args:
+            limits: Rate limits keyed by model identifier (e.g. 'openai:gpt-4o-mini').
+            default: Rate limit for models not in ``limits``, or None to leave
+                them unlimited.
+            expected_output_tokens: Completion tokens reserved per request
+                until its actual usage is known.
+        """
+        self.limits = dict(limits or {})
+        self.default = default
+        self.expected_output_tokens = expected_output_tokens
+        self._models: dict[str, _ModelState] = {}
+        self._sequence = itertools.count()
+
+    def _state(self, model: str) -> _ModelState:
+        if model not in self._models:
+            limit = self.limits.get(model, self.default) or RateLimit()
+            self._models[model] = _ModelState(
+                requests=(
+                    _Bucket(limit.requests_per_minute, limit.burst_s)
+                    if limit.requests_per_minute
+                    else None
+                ),
+                tokens=(
+                    _Bucket(limit.tokens_per_minute, limit.burst_s)
+                    if limit.tokens_per_minute
+                    else None
+                ),
+            )
+        return self._models[model]
+
+    def waiting(self, model: str) -> int:
+        """Number of requests for ``model`` waiting to be admitted."""
+        state = self._models.get(model)
+        return 0 if state is None else sum(not w[2].done() for w in state.waiters)
+
+    @asynccontextmanager
+    async def reserve(
+        self, model: str, prompt: str, priority: tuple[float, ...] = ()
+    ) -> AsyncIterator[Reservation]:
+        """Wait until a request may be sent, holding its quota while it runs.
+
+        Args:
+            model: Identifier of the model the request goes to.
+            prompt: The prompt being sent, used to estimate its token cost.
+            priority: Sort key among waiting requests; lower goes first.
+
+        Yields:
+            The reservation; call ``used`` with the actual token count.
+        """
+        state = self._state(model)
+        reservation = Reservation(model, estimate_tokens(prompt) + self.expected_output_tokens)
+
+        if not state.waiters and state.wait_for(reservation.tokens, time.monotonic()) == 0:
+            state.take(reservation.tokens)
+        else:
+            admitted: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(
+                state.waiters, (priority, next(self._sequence), admitted, reservation.tokens)
+            )
+            self._pump(model)
+            try:
+                await admitted
+            except asyncio.CancelledError:
+                if admitted.done() and not admitted.cancelled():
+                    # Admitted just as we were cancelled: hand the quota back
+                    self._refund(state, reservation.tokens)
+                self._pump(model)
+                raise
+
+        try:
+            yield reservation
+        finally:
+            if reservation.actual_tokens is not None and state.tokens is not None:
+                extra = reservation.actual_tokens - reservation.tokens
+                if extra > 0:
+                    state.tokens.take(extra)
+                else:
+                    state.tokens.give(-extra)
+            self._pump(model)
+
+    def pause(self, model: str, seconds: float) -> None:
+        """Admit no requests for ``model`` for a while (e.g. after a 429)."""
+        state = self._state(model)
+        state.paused_until = max(state.paused_until, time.monotonic() + seconds)
+
+    @staticmethod
+    def _refund(state: _ModelState, tokens: int) -> None:
+        if state.requests is not None:
+            state.requests.give(1)
+        if state.tokens is not None:
+            state.tokens.give(tokens)
+
+    def _pump(self, model: str) -> None:
+        """Admit waiting requests in priority order while quota allows."""
+        state = self._models[model]
+        if state.timer is not None:
+            state.timer.cancel()
+            state.timer = None
+
+        while state.waiters:
+            _, _, admitted, tokens = state.waiters[0]
+            if admitted.done():
+                heapq.heappop(state.waiters)
+                continue
+            wait = state.wait_for(tokens, time.monotonic())
+            if wait > 0:
+                state.timer = asyncio.get_running_loop().call_later(wait, self._pump, model)
+                return
+            heapq.heappop(state.waiters)
+            state.take(tokens)
+            admitted.set_result(None)
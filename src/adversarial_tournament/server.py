@@ -0,0 +1,374 @@
+"""Tournament Service - Long-running HTTP service running tournaments on one event loop.
+
+A minimal asyncio HTTP/1.1 server (standard library only) that accepts
+tournament jobs and runs them on one shared event loop with a single warm
+``AdversarialTournament``, so agents, prompt caches and HTTP connection pools
+are built once and reused by every job. Progress is streamed per phase as
+Server-Sent Events.
+
+Endpoints:
+    POST   /tournaments              Submit ``{"task": "..."}``; returns the job (202)
+    GET    /tournaments/{id}         Job status, with the result once completed
+    GET    /tournaments/{id}/events  Server-Sent Events: every phase start and
+                                     completion, then ``completed`` or ``failed``
+    DELETE /tournaments/{id}         Cancel a queued or running job
+    GET    /health                   Queue and running counts
+"""
+
+import asyncio
+import contextlib
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Literal
+
+import ujson
+from pydantic import BaseModel, Field
+
+from adversarial_tournament.config import DEFAULT_MAX_CONCURRENCY
+from adversarial_tournament.events import PhaseCompleted, PhaseStarted, TournamentCompleted
+from adversarial_tournament.models.tournament import TournamentResult
+from adversarial_tournament.tournament import AdversarialTournament
+
+JobState = Literal["queued", "running", "completed", "failed", "cancelled"]
+
+# Largest request body accepted (a task description)
+MAX_BODY_BYTES = 1 << 20
+
+# Idle seconds between SSE keep-alive comments
+SSE_KEEPALIVE_S = 15.0
+
+_REASONS = {
+    200: "OK",
+    202: "Accepted",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+}
+
+
+class JobStatus(BaseModel):
+    """State of one tournament job, as returned by the service."""
+
+    id: str = Field(description="Job id")
+    task: str = Field(description="The task description")
+    state: JobState = Field(description="Where the job is in its lifecycle")
+    completed_phases: list[str] = Field(
+        default_factory=list, description="Phases finished so far, in order"
+    )
+    error: str | None = Field(default=None, description="Why the job failed")
+    result: TournamentResult | None = Field(default=None, description="The completed result")
+
+
+@dataclass
+class Job:
+    """One submitted tournament and the progress events it has published."""
+
+    id: str
+    task: str
+    state: JobState = "queued"
+    completed_phases: list[str] = field(default_factory=list)
+    events: list[tuple[str, str]] = field(default_factory=list)
+    result: TournamentResult | None = None
+    error: str | None = None
+    _changed: asyncio.Condition = field(default_factory=asyncio.Condition, repr=False)
+    _runner: asyncio.Task[None] | None = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has reached a final state."""
+        return self.state in ("completed", "failed", "cancelled")
+
+    def status(self) -> JobStatus:
+        """Snapshot the job for the status endpoint."""
+        return JobStatus(
+            id=self.id,
+            task=self.task,
+            state=self.state,
+            completed_phases=list(self.completed_phases),
+            error=self.error,
+            result=self.result,
+        )
+
+    async def publish(self, event: str, data: str, state: JobState | None = None) -> None:
+        """Record a progress event (and state change) and wake every listener."""
+        async with self._changed:
+            if state is not None:
+                self.state = state
+            self.events.append((event, data))
+            self._changed.notify_all()
+
+    async def follow(
+        self, keepalive_s: float = SSE_KEEPALIVE_S
+    ) -> AsyncIterator[tuple[str, str] | None]:
+        """Yield every event, past and future, until the job finishes.
+
+        Yields None after ``keepalive_s`` without news, so callers can keep
+        idle connections alive.
+        """
+        seen = 0
+        while True:
+            async with self._changed:
+                if seen == len(self.events) and not self.finished:
+                    with contextlib.suppress(TimeoutError):
+                        async with asyncio.timeout(keepalive_s):
+                            await self._changed.wait()
+                pending = self.events[seen:]
+                done = self.finished
+            if not pending and not done:
+                yield None
+            for event in pending:
+                yield event
+            seen += len(pending)
+            if done and seen == len(self.events):
+                return
+
+
+class _HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class TournamentService:
+    """Runs tournament jobs submitted over HTTP on one shared event loop.
+
+    All jobs share ``tournament``, so its agents, caches, latency statistics
+    and connection pools stay warm between jobs. At most ``max_concurrency``
+    jobs run at once; the rest wait in submission order.
+    """
+
+    def __init__(
+        self,
+        tournament: AdversarialTournament,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_finished_jobs: int = 1000,
+    ):
+        """Create a service.
+
+        Args:
+            tournament: The tournament every job runs on.
+            max_concurrency: Maximum number of jobs running at once.
+            max_finished_jobs: Finished jobs kept for status queries; the
+                oldest are forgotten first.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.tournament = tournament
+        self.max_concurrency = max_concurrency
+        self.max_finished_jobs = max_finished_jobs
+        self.jobs: OrderedDict[str, Job] = OrderedDict()
+        self._slots = asyncio.Semaphore(max_concurrency)
+
+    def submit(self, task: str) -> Job:
+        """Queue a tournament for ``task`` and return its job."""
+        job = Job(id=uuid.uuid4().hex, task=task)
+        self.jobs[job.id] = job
+        job._runner = asyncio.create_task(self._run_job(job))
+        self._forget_finished()
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job; False if it had already finished."""
+        job = self.jobs[job_id]
+        if job.finished or job._runner is None:
+            return False
+        job._runner.cancel()
+        return True
+
+    async def close(self) -> None:
+        """Cancel every unfinished job and wait for them to stop."""
+        runners = [job._runner for job in self.jobs.values() if job._runner is not None]
+        for runner in runners:
+            runner.cancel()
+        await asyncio.gather(*runners, return_exceptions=True)
+
+    async def _run_job(self, job: Job) -> None:
+        started = time.perf_counter()
+        try:
+            async with self._slots:
+                await job.publish("running", ujson.dumps({"id": job.id}), state="running")
+                async for event in self.tournament.stream(job.task, deltas=False):
+                    elapsed = round(time.perf_counter() - started, 3)
+                    if isinstance(event, PhaseStarted):
+                        data = {"phase": event.phase, "elapsed_s": elapsed}
+                        await job.publish("phase_started", ujson.dumps(data))
+                    elif isinstance(event, PhaseCompleted):
+                        job.completed_phases.append(event.phase)
+                        data = {"phase": event.phase, "elapsed_s": elapsed}
+                        await job.publish("phase_completed", ujson.dumps(data))
+                    elif isinstance(event, TournamentCompleted):
+                        job.result = event.result
+        except asyncio.CancelledError:
+            await job.publish("cancelled", ujson.dumps({"id": job.id}), state="cancelled")
+            raise
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            await job.publish("failed", ujson.dumps({"error": job.error}), state="failed")
+        else:
+            assert job.result is not None
+            await job.publish("completed", job.result.model_dump_json(), state="completed")
+        finally:
+            self._forget_finished()
+
+    def _forget_finished(self) -> None:
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[: max(len(finished) - self.max_finished_jobs, 0)]:
+            del self.jobs[job_id]
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8000) -> asyncio.Server:
+        """Start listening; the returned server is already serving.
+
+        Use ``server.sockets[0].getsockname()`` to find the port when ``port`` is 0.
+        """
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except _HttpError as e:
+                    await _respond(writer, e.status, {"error": str(e)}, keep_alive=False)
+                    return
+                if request is None:
+                    return
+                method, path, body, keep_alive = request
+                try:
+                    keep_alive = await self._route(writer, method, path, body, keep_alive)
+                except _HttpError as e:
+                    await _respond(writer, e.status, {"error": str(e)}, keep_alive)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _route(
+        self, writer: asyncio.StreamWriter, method: str, path: str, body: bytes, keep_alive: bool
+    ) -> bool:
+        """Answer one request; returns whether the connection stays open."""
+        parts = path.split("?", 1)[0].strip("/").split("/")
+
+        if parts == ["health"]:
+            _require(method, "GET")
+            running = sum(job.state == "running" for job in self.jobs.values())
+            queued = sum(job.state == "queued" for job in self.jobs.values())
+            await _respond(writer, 200, {"status": "ok", "running": running, "queued": queued}, keep_alive)
+            return keep_alive
+
+        if parts == ["tournaments"]:
+            _require(method, "POST")
+            try:
+                payload = ujson.loads(body)
+            except ValueError as e:
+                raise _HttpError(400, f"invalid JSON: {e}") from e
+            task = payload.get("task") if isinstance(payload, dict) else None
+            if not isinstance(task, str) or not task.strip():
+                raise _HttpError(400, "expected a JSON object with a non-empty 'task'")
+            job = self.submit(task)
+            await _respond(writer, 202, job.status(), keep_alive)
+            return keep_alive
+
+        if len(parts) in (2, 3) and parts[0] == "tournaments":
+            job = self.jobs.get(parts[1])
+            if job is None:
+                raise _HttpError(404, f"no job {parts[1]!r}")
+            if len(parts) == 3:
+                if parts[2] != "events":
+                    raise _HttpError(404, f"no such resource {path!r}")
+                _require(method, "GET")
+                await _stream_events(writer, job)
+                return False
+            if method == "DELETE":
+                if not self.cancel(job.id):
+                    raise _HttpError(409, f"job {job.id} already {job.state}")
+                await _respond(writer, 202, job.status(), keep_alive)
+                return keep_alive
+            _require(method, "GET")
+            await _respond(writer, 200, job.status(), keep_alive)
+            return keep_alive
+
+        raise _HttpError(404, f"no such resource {path!r}")
+
+
+def _require(method: str, allowed: str) -> None:
+    if method != allowed:
+        raise _HttpError(405, f"use {allowed}")
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> tuple[str, str, bytes, bool] | None:
+    """Read one HTTP/1.1 request: (method, path, body, keep_alive), or None at EOF."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, path, version = request_line.decode("latin-1").split()
+    except ValueError as e:
+        raise _HttpError(400, "malformed request line") from e
+
+    headers: dict[str, str] = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError as e:
+        raise _HttpError(400, "invalid Content-Length") from e
+    if length > MAX_BODY_BYTES:
+        raise _HttpError(413, f"request body over {MAX_BODY_BYTES} bytes")
+    body = await reader.readexactly(length) if length else b""
+
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+    return method.upper(), path, body, keep_alive
+
+
+async def _respond(
+    writer: asyncio.StreamWriter, status: int, payload: BaseModel | dict, keep_alive: bool
+) -> None:
+    body = (
+        payload.model_dump_json().encode()
+        if isinstance(payload, BaseModel)
+        else ujson.dumps(payload).encode()
+    )
+    writer.write(
+        (
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode()
+        + body
+    )
+    await writer.drain()
+
+
+async def _stream_events(writer: asyncio.StreamWriter, job: Job) -> None:
+    """Send a job's progress as Server-Sent Events until it finishes."""
+    writer.write(
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: text/event-stream\r\n"
+        b"Cache-Control: no-cache\r\n"
+        b"Connection: close\r\n\r\n"
+    )
+    await writer.drain()
+    async for item in job.follow():
+        if item is None:
+            writer.write(b": keep-alive\n\n")
+        else:
+            event, data = item
+            writer.write(f"event: {event}\ndata: {data}\n\n".encode())
+        await writer.drain()
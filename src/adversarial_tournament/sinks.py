@@ -0,0 +1,86 @@
+"""Result sinks - Append-only JSON Lines output for tournament results.
+
+``JsonlSink`` writes each result as one line of JSON the moment it is
+handed over, serialized directly by pydantic-core (no intermediate dict), so
+a batch never holds more than one result's JSON in memory and a crash loses
+at most the results still running.
+"""
+
+import gzip
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+
+from pydantic import BaseModel
+
+from adversarial_tournament.models.tournament import TournamentResult
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+class JsonlSink:
+    """Append-only JSON Lines file of tournament results.
+
+    Use as a context manager, or call ``close`` when done. Files ending in
+    ``.gz`` are gzip-compressed unless ``compress`` says otherwise. Flushing
+    a compressed file also syncs the compressor, so every line written so
+    far can be recovered even if the process dies before ``close``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        flush: bool = True,
+        fsync: bool = False,
+        compress: bool | None = None,
+    ):
+        """Open (or create) the sink, appending to any existing file.
+
+        Args:
+            path: The JSONL file to append to.
+            flush: Flush every line to the operating system as it is written.
+            fsync: Also force every line to disk (implies ``flush``); slower,
+                but survives power loss.
+            compress: Gzip the output; defaults to whether ``path`` ends in ``.gz``.
+        """
+        self.path = Path(path)
+        self.flush = flush or fsync
+        self.fsync = fsync
+        self.compress = self.path.suffix == ".gz" if compress is None else compress
+        self.written = 0
+
+        self._file: IO[bytes] = (
+            gzip.open(self.path, "ab") if self.compress else open(self.path, "ab")
+        )
+
+    def write(self, result: BaseModel) -> None:
+        """Append one result (any pydantic model) as a line of JSON."""
+        self._file.write(result.model_dump_json().encode() + b"\n")
+        self.written += 1
+        if self.flush:
+            self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+    def __enter__(self) -> "JsonlSink":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @staticmethod
+    def read(path: str | Path) -> Iterator[TournamentResult]:
+        """Read back the results of a (possibly gzipped) JSONL file."""
+        with open(path, "rb") as raw:
+            compressed = raw.read(2) == _GZIP_MAGIC
+        opener = gzip.open if compressed else open
+        with opener(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield TournamentResult.model_validate_json(line)
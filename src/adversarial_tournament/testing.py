@@ -0,0 +1,423 @@
+"""Simulated models for offline tests, benchmarks and local runs.
+
+``create_simulated_model`` returns a pydantic-ai ``FunctionModel`` that can
+play every tournament role: it answers each agent with canned, schema-valid
+output and (optionally) sleeps according to a seeded latency profile, so the
+orchestrator can be exercised and timed without network access.
+
+``FakeOpenAIServer`` gives the same answers over a local OpenAI-compatible
+HTTP endpoint, to exercise (and time) the real HTTP client stack: connection
+pooling, keep-alive and request overhead.
+"""
+
+import asyncio
+import hashlib
+import math
+import random
+import re
+from collections.abc import AsyncIterator, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import pydantic_core
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    ToolCallPart,
+    UserPromptPart,
+)
+from pydantic_ai.models.function import (
+    AgentInfo,
+    DeltaToolCall,
+    DeltaToolCalls,
+    FunctionModel,
+)
+
+_WORDS = (
+    "we own this outage and the customers who trusted us deserve a clear "
+    "account of what failed why it failed and what changes we are making now"
+).split()
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Seeded latency distribution for simulated model calls.
+
+    Each call waits a log-normally distributed time to first token (median
+    ``first_token_s``, spread ``sigma``) and then ``per_token_s`` for every
+    output token, approximating a real completion endpoint.
+    """
+
+    first_token_s: float = 0.4
+    sigma: float = 0.35
+    per_token_s: float = 0.004
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw a time-to-first-token in seconds."""
+        if self.first_token_s <= 0:
+            return 0.0
+        return self.first_token_s * math.exp(rng.gauss(0.0, self.sigma))
+
+
+def _persona(name: str, persona_type: str) -> dict[str, Any]:
+    return {
+        "name": name,
+        "role": f"{name} Role",
+        "goal": f"{name} goal",
+        "backstory": f"{name} backstory.",
+        "persona_type": persona_type,
+        "key_traits": ["focused", "candid", "thorough"],
+        "communication_style": "Direct",
+    }
+
+
+def _text(words: int) -> str:
+    # Seeded shuffle rather than a repeating cycle, so short passages are
+    # unique (patch-mode anchors must be)
+    rng = random.Random(words)
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _unique_tail(text: str) -> str:
+    """Return the shortest run of trailing words that occurs only once in ``text``."""
+    words = text.split(" ")
+    for size in range(1, len(words) + 1):
+        tail = " ".join(words[-size:])
+        if text.count(tail) == 1:
+            return tail
+    return text
+
+
+def last_user_prompt(messages: list[ModelMessage]) -> str:
+    """Return the most recent user prompt sent to the model."""
+    for message in reversed(messages):
+        for part in getattr(message, "parts", []):
+            if isinstance(part, UserPromptPart) and isinstance(part.content, str):
+                return part.content
+    return ""
+
+
+_PERSONA_COUNTS = re.compile(r"has (\d+) contestants and (\d+) judges")
+
+
+def requested_persona_counts(messages: list[ModelMessage]) -> tuple[int, int]:
+    """Return the (contestants, judges) the persona generator was asked for."""
+    for message in messages:
+        if isinstance(message, ModelRequest) and message.instructions:
+            match = _PERSONA_COUNTS.search(message.instructions)
+            if match:
+                return int(match[1]), int(match[2])
+    return 2, 1
+
+
+def simulated_output_args(
+    properties: dict[str, Any],
+    prompt: str,
+    words: int = 40,
+    contestants: int = 2,
+    judges: int = 1,
+    texts: Mapping[str, str] | None = None,
+) -> dict[str, Any]:
+    """Build schema-valid output tool arguments for a tournament output type.
+
+    The output type is recognized from the properties of its JSON schema; a
+    critique covers every draft found in the prompt. Text fields hold about
+    ``words`` words of filler, unless ``texts`` fixes their text by field
+    name (e.g. 'extra_critiques') or kind: 'critique', 'collaboration_discussion',
+    'final_output' or 'edit' (the text a patch edit inserts).
+    """
+
+    def text(*keys: str, length: int = words) -> str:
+        for key in keys:
+            if texts and key in texts:
+                return texts[key]
+        return _text(length)
+
+    if "contestant_1" in properties:
+        return {
+            "contestant_1": _persona("The Engineer", "contestant"),
+            "contestant_2": _persona("The Communicator", "contestant"),
+            "extra_contestants": [
+                _persona(f"The Specialist {n}", "contestant") for n in range(3, contestants + 1)
+            ],
+            "judge": _persona("The Critic", "judge"),
+            "extra_judges": [_persona(f"The Skeptic {n}", "judge") for n in range(2, judges + 1)],
+            "task_context": prompt,
+            "reasoning": "Complementary perspectives.",
+        }
+    if "critique_of_contestant_1" in properties:
+        drafts = max(prompt.count("=== END DRAFT"), 2)
+        return {
+            "critique_of_contestant_1": text("critique_of_contestant_1", "critique"),
+            "critique_of_contestant_2": text("critique_of_contestant_2", "critique"),
+            "extra_critiques": [text("extra_critiques", "critique")] * (drafts - 2),
+            "key_issues": ["Be specific", "Take responsibility"],
+            "scores": [6.0] * drafts,
+        }
+    if "critique" in properties:
+        return {
+            "critique": text("critique"),
+            "key_issues": ["Be specific", "Take responsibility"],
+            "score": 6.0,
+        }
+    if "edits" in properties:
+        # Draft 1 is the synthesizer's own, in either prompt layout
+        match = re.search(
+            r"=== (?:YOUR ORIGINAL DRAFT|DRAFT 1 \(.*?\)) ===\n(.*?)\n=== END", prompt, re.DOTALL
+        )
+        base = match[1] if match else ""
+        return {
+            "collaboration_discussion": text("collaboration_discussion", length=words // 4 or 1),
+            "base_draft": 1,
+            "edits": [
+                {
+                    "operation": "insert",
+                    "anchor": _unique_tail(base) if base else "",
+                    "text": " " + text("edit", length=words // 4 or 1),
+                }
+            ],
+        }
+    return {
+        "collaboration_discussion": text("collaboration_discussion", length=words // 4 or 1),
+        "final_output": text("final_output"),
+    }
+
+
+def simulated_response(
+    messages: list[ModelMessage],
+    info: AgentInfo,
+    words: int = 40,
+    texts: Mapping[str, str] | None = None,
+) -> ModelResponse:
+    """Answer any tournament agent with a canned, schema-valid response.
+
+    ``texts`` fixes the text of a kind of field, as in
+    ``simulated_output_args``; its 'draft' entry is the Round 1 draft.
+    """
+    prompt = last_user_prompt(messages)
+    if info.output_tools:
+        tool = info.output_tools[0]
+        properties = tool.parameters_json_schema.get("properties", {})
+        args = simulated_output_args(
+            properties, prompt, words, *requested_persona_counts(messages), texts=texts
+        )
+        return ModelResponse(parts=[ToolCallPart(tool.name, args)])
+    draft = texts["draft"] if texts and "draft" in texts else _text(words)
+    return ModelResponse(parts=[TextPart(draft)])
+
+
+def _serialized(response: ModelResponse) -> str:
+    """The text a real model would have generated for ``response``."""
+    part = response.parts[0]
+    if isinstance(part, TextPart):
+        return part.content
+    assert isinstance(part, ToolCallPart)
+    return pydantic_core.to_json(part.args).decode()
+
+
+# Characters per simulated token, and per streamed chunk
+_CHARS_PER_TOKEN = 4
+_CHUNK_CHARS = 16
+
+
+def simulated_chunks(response: ModelResponse) -> Iterator[str | DeltaToolCalls]:
+    """Split a response into the chunks a streaming model would send."""
+    part = response.parts[0]
+    text = _serialized(response)
+    if isinstance(part, ToolCallPart):
+        yield {0: DeltaToolCall(name=part.tool_name)}
+    for start in range(0, len(text), _CHUNK_CHARS):
+        chunk = text[start : start + _CHUNK_CHARS]
+        yield chunk if isinstance(part, TextPart) else {0: DeltaToolCall(json_args=chunk)}
+
+
+def create_simulated_model(
+    latency: LatencyProfile | None = None,
+    seed: int = 0,
+    words: int = 40,
+    model_name: str = "simulated",
+) -> FunctionModel:
+    """Create a local model that plays every tournament role.
+
+    Latency samples are derived from ``seed`` and the prompt, so a given call
+    waits the same time on every run regardless of how concurrent calls
+    interleave.
+
+    Args:
+        latency: Latency profile to simulate, or None to answer immediately.
+        seed: Seed for the latency distribution.
+        words: Approximate length of every generated text field, in words.
+        model_name: Name reported by the model (appears in metrics).
+
+    Returns:
+        A FunctionModel supporting both regular and streamed requests.
+    """
+
+    def rng_for(messages: list[ModelMessage]) -> random.Random:
+        digest = hashlib.sha256(f"{seed}\0{last_user_prompt(messages)}".encode()).digest()
+        return random.Random(digest)
+
+    async def respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        response = simulated_response(messages, info, words)
+        if latency is not None:
+            tokens = len(_serialized(response)) / _CHARS_PER_TOKEN
+            await asyncio.sleep(latency.sample(rng_for(messages)) + tokens * latency.per_token_s)
+        return response
+
+    async def respond_stream(
+        messages: list[ModelMessage], info: AgentInfo
+    ) -> AsyncIterator[str | DeltaToolCalls]:
+        response = simulated_response(messages, info, words)
+        if latency is not None:
+            await asyncio.sleep(latency.sample(rng_for(messages)))
+        per_chunk = (
+            latency.per_token_s * _CHUNK_CHARS / _CHARS_PER_TOKEN if latency is not None else 0.0
+        )
+
+        for chunk in simulated_chunks(response):
+            # The tool name arrives with the first token
+            if per_chunk and not (isinstance(chunk, dict) and chunk[0].name):
+                await asyncio.sleep(per_chunk)
+            yield chunk
+
+    return FunctionModel(respond, stream_function=respond_stream, model_name=model_name)
+
+
+class FakeOpenAIServer:
+    """Local OpenAI-compatible chat completions endpoint playing every tournament role.
+
+    Answers ``POST /v1/chat/completions`` with the same schema-valid output as
+    ``create_simulated_model`` (no streaming), over HTTP/1.1 with keep-alive.
+    It counts the TCP connections clients open, and can charge each new
+    connection a simulated handshake delay (TCP + TLS on a real endpoint), so
+    connection reuse shows up in both counts and timings.
+
+    Use as an async context manager; point clients at ``base_url``.
+    """
+
+    def __init__(self, words: int = 40, handshake_s: float = 0.0, latency_s: float = 0.0):
+        """Create the server.
+
+        Args:
+            words: Approximate length of every generated text field, in words.
+            handshake_s: Delay before the first request of every new connection.
+            latency_s: Delay before every response.
+        """
+        self.words = words
+        self.handshake_s = handshake_s
+        self.latency_s = latency_s
+        self.connections = 0
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    @property
+    def base_url(self) -> str:
+        """The OpenAI base URL of the running server."""
+        assert self._server is not None, "server is not running"
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/v1"
+
+    async def __aenter__(self) -> "FakeOpenAIServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        assert self._server is not None
+        self._server.close()
+        # Drop kept-alive client connections, or wait_closed would wait for them
+        for writer in self._writers:
+            writer.close()
+        await self._server.wait_closed()
+
+    def completion(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Build the chat completion answering one request."""
+        system, prompt = "", ""
+        for message in request.get("messages", []):
+            content = message.get("content")
+            if isinstance(content, list):
+                content = "".join(part.get("text", "") for part in content)
+            if message.get("role") == "system":
+                system += content or ""
+            elif message.get("role") == "user":
+                prompt = content or ""
+
+        tools = request.get("tools") or []
+        if tools:
+            function = tools[0]["function"]
+            match = _PERSONA_COUNTS.search(system)
+            counts = (int(match[1]), int(match[2])) if match else (2, 1)
+            args = simulated_output_args(
+                function["parameters"].get("properties", {}), prompt, self.words, *counts
+            )
+            message = {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": f"call_{self.requests}",
+                        "type": "function",
+                        "function": {
+                            "name": function["name"],
+                            "arguments": pydantic_core.to_json(args).decode(),
+                        },
+                    }
+                ],
+            }
+            finish_reason, output = "tool_calls", message["tool_calls"][0]["function"]["arguments"]
+        else:
+            output = _text(self.words)
+            message = {"role": "assistant", "content": output}
+            finish_reason = "stop"
+
+        prompt_tokens = math.ceil((len(system) + len(prompt)) / _CHARS_PER_TOKEN)
+        completion_tokens = math.ceil(len(output) / _CHARS_PER_TOKEN)
+        return {
+            "id": f"chatcmpl-{self.requests}",
+            "object": "chat.completion",
+            "created": 0,
+            "model": request.get("model", "fake"),
+            "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+        if self.handshake_s:
+            await asyncio.sleep(self.handshake_s)
+        try:
+            while request_line := await reader.readline():
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+
+                self.requests += 1
+                if self.latency_s:
+                    await asyncio.sleep(self.latency_s)
+                if b"/chat/completions" in request_line:
+                    status, payload = "200 OK", self.completion(pydantic_core.from_json(body))
+                else:
+                    status, payload = "404 Not Found", {"error": {"message": "not found"}}
+                data = pydantic_core.to_json(payload)
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode()
+                    + data
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
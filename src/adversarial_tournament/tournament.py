@@ -1,27 +1,260 @@
 """Main tournament orchestrator using Pydantic AI."""
 
 import asyncio
+import contextlib
+import hashlib
+import time
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from contextvars import ContextVar
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
 
+import pydantic_core
+from pydantic import BaseModel, ValidationError
 from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models import Model
+from pydantic_ai.usage import RunUsage
 
-from adversarial_tournament.config import DEFAULT_MODEL
-from adversarial_tournament.models.persona import PersonaSet
+from adversarial_tournament.cache.persona_cache import PersonaCache
+from adversarial_tournament.cache.persona_index import PersonaIndex
+from adversarial_tournament.cache.response_cache import CachingModel, ResponseCache
+from adversarial_tournament.clients import ModelClients
+from adversarial_tournament.config import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MODEL,
+    MODEL_PRESETS,
+    MODEL_ROLES,
+)
+from adversarial_tournament.events import (
+    CallCompleted,
+    CallFailed,
+    CallStarted,
+    Phase,
+    PhaseCompleted,
+    PhaseStarted,
+    PartialOutput,
+    StreamRestarted,
+    TextDelta,
+    TournamentCompleted,
+    TournamentEvent,
+)
+from adversarial_tournament.exceptions import BudgetExceeded, PatchError, TournamentError
+from adversarial_tournament.models.metrics import (
+    CallMetrics,
+    PhaseMetrics,
+    TournamentMetrics,
+)
+from adversarial_tournament.models.checkpoint import TournamentCheckpoint
+from adversarial_tournament.models.persona import Persona, PersonaSet
 from adversarial_tournament.models.tournament import (
     TournamentResult,
     RoundOneOutput,
+    DraftCritique,
     RoundTwoCritique,
     RoundThreeOutput,
+    RoundThreePatch,
+    StopReason,
 )
 from adversarial_tournament.agents.persona_generator import create_persona_generator
 from adversarial_tournament.agents.contestant import create_contestant_agent
-from adversarial_tournament.agents.judge import create_judge_agent
+from adversarial_tournament.agents.judge import create_judge_agent, create_draft_judge_agent
+from adversarial_tournament.agents.synthesizer import (
+    create_synthesizer_agent,
+    create_patch_synthesizer_agent,
+)
+from adversarial_tournament.agents.registry import AgentRegistry
+from adversarial_tournament.patching import apply_edits
+from adversarial_tournament.resilience import (
+    LatencyTracker,
+    ResiliencePolicy,
+    is_transient,
+    setting_role,
+)
+from adversarial_tournament.scheduler import PHASE_PRIORITY, RateLimitScheduler, Reservation
+from adversarial_tournament.utils import model_id, normalize_task
 from adversarial_tournament.prompts.templates import (
+    PromptLayout,
+    SynthesisMode,
+    build_persona_generator_prompt,
     build_round_one_prompt,
     build_round_two_prompt,
+    build_draft_critique_prompt,
     build_round_three_prompt,
 )
 
+OutputT = TypeVar("OutputT")
+
+
+@dataclass
+class _RunContext:
+    """Per-run state shared by every phase and agent call of one tournament."""
+
+    emit: Callable[[TournamentEvent], None] | None = None
+    stream_calls: bool = True
+    call_events: bool = False
+    call_slots: asyncio.Semaphore | None = None
+    started_at: float = field(default_factory=time.perf_counter)
+    phase_starts: dict[Phase, float] = field(default_factory=dict)
+    phases: list[PhaseMetrics] = field(default_factory=list)
+    calls: list[CallMetrics] = field(default_factory=list)
+    drafts: dict[int, str] = field(default_factory=dict)
+    token_budget: int | None = None
+    tokens_used: int = 0
+    over_budget: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def start_phase(self, phase: Phase) -> bool:
+        """Record a phase start; False if it had already started."""
+        if phase in self.phase_starts:
+            return False
+        self.phase_starts[phase] = time.perf_counter()
+        return True
+
+    def complete_phase(self, phase: Phase) -> PhaseMetrics:
+        """Record a phase completion."""
+        started = self.phase_starts.get(phase, self.started_at)
+        metrics = PhaseMetrics(
+            phase=phase,
+            started_at_s=started - self.started_at,
+            duration_s=time.perf_counter() - started,
+        )
+        self.phases.append(metrics)
+        return metrics
+
+    def record_call(
+        self,
+        phase: Phase,
+        role: str,
+        model: str,
+        started: float,
+        usage: RunUsage,
+        attempts: int = 1,
+        hedged: bool = False,
+    ) -> CallMetrics:
+        """Record the timing and usage of one finished agent call."""
+        # A hedged call paid for (up to) two requests
+        self.tokens_used += usage.total_tokens * (2 if hedged else 1)
+        if self.token_budget is not None and self.tokens_used >= self.token_budget:
+            self.over_budget.set()
+        metrics = CallMetrics(
+            phase=phase,
+            role=role,
+            model=model,
+            started_at_s=started - self.started_at,
+            duration_s=time.perf_counter() - started,
+            input_tokens=usage.input_tokens,
+            cache_read_tokens=usage.cache_read_tokens,
+            output_tokens=usage.output_tokens,
+            requests=usage.requests,
+            retries=max(usage.requests - 1, 0) + attempts - 1,
+            attempts=attempts,
+            hedged=hedged,
+        )
+        self.calls.append(metrics)
+        return metrics
+
+    def metrics(self, model: str | None = None) -> TournamentMetrics:
+        """Snapshot everything recorded so far for a tournament on ``model``."""
+        return TournamentMetrics(
+            total_duration_s=time.perf_counter() - self.started_at,
+            model=model,
+            phases=list(self.phases),
+            calls=list(self.calls),
+        )
+
+
+async def _gather(*aws: Awaitable[OutputT]) -> list[OutputT]:
+    """Await concurrently with TaskGroup semantics.
+
+    Unlike ``asyncio.gather``, the first failure cancels the siblings still
+    running (so they stop spending tokens) before it is raised, unwrapped.
+    """
+
+    async def wait(aw: Awaitable[OutputT]) -> OutputT:
+        return await aw
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(wait(aw)) for aw in aws]
+    except BaseExceptionGroup as e:
+        raise e.exceptions[0]
+    return [task.result() for task in tasks]
+
+
+# The hook (AdversarialTournament field) each event is passed to
+_HOOKS: dict[type, str] = {
+    PhaseStarted: "on_phase_start",
+    PhaseCompleted: "on_phase_end",
+    CallStarted: "on_call_start",
+    CallCompleted: "on_call_end",
+    CallFailed: "on_call_end",
+}
+
+# Events only listeners that asked for call events (``run_events``) receive
+_CALL_EVENTS = (CallStarted, CallCompleted, CallFailed)
+
+
+# The run a coroutine belongs to; tasks spawned within a run inherit it.
+_current_run: ContextVar[_RunContext | None] = ContextVar(
+    "adversarial_tournament_run", default=None
+)
+
+
+def _partial_tool_args(response: ModelResponse) -> dict[str, Any] | None:
+    """Parse the (possibly incomplete) output tool arguments of a streamed response."""
+    for part in reversed(response.parts):
+        if isinstance(part, ToolCallPart):
+            if isinstance(part.args, dict):
+                return part.args
+            if part.args:
+                # Keep the string still being generated, so it streams as it grows
+                parsed = pydantic_core.from_json(part.args, allow_partial="trailing-strings")
+                return parsed if isinstance(parsed, dict) else None
+    return None
+
+
+def _complete_contestants(fields: dict[str, Any]) -> Iterator[tuple[int, Any]]:
+    """Yield (number, data) for every contestant persona the model has finished.
+
+    A persona is finished once the model has moved past it: to a later field,
+    or to the next item of ``extra_contestants``.
+    """
+    last_field = next(reversed(fields))
+    for number in (1, 2):
+        name = f"contestant_{number}"
+        if name in fields and name != last_field:
+            yield number, fields[name]
+
+    extras = fields.get("extra_contestants")
+    if isinstance(extras, list):
+        finished = extras if last_field != "extra_contestants" else extras[:-1]
+        for number, value in enumerate(finished, start=3):
+            yield number, value
+
+
+def _text_deltas(
+    previous: dict[str, Any], fields: dict[str, Any]
+) -> Iterator[tuple[str, str]]:
+    """Yield (field, new text) for every string field that grew since ``previous``."""
+    for name, value in fields.items():
+        if not isinstance(value, str):
+            continue
+        seen = previous.get(name)
+        if not isinstance(seen, str) or not value.startswith(seen):
+            seen = ""
+        if len(value) > len(seen):
+            yield name, value[len(seen):]
+
 
 @dataclass
 class AdversarialTournament:
@@ -29,12 +262,167 @@ class AdversarialTournament:
 
     The tournament follows this flow:
     1. Phase 0: Generate personas based on the task
-    2. Round 1: Both contestants create drafts (parallel execution)
-    3. Round 2: Judge critiques both drafts
-    4. Round 3: Contestants synthesize feedback into final output
+    2. Round 1: Every contestant creates a draft (parallel execution)
+    3. Round 2: Every judge critiques all drafts (parallel execution)
+    4. Round 3: Contestants synthesize the merged feedback into final output
+
+    There are two contestants and one judge by default; raise ``contestants``
+    and ``judges`` for more viewpoints. Their calls fan out concurrently, so
+    latency stays roughly flat; ``max_concurrent_calls`` caps how many agent
+    calls of one tournament are in flight at once.
+
+    Use ``stream`` instead of ``run`` to receive token deltas and partial
+    outputs from every round as they are generated.
+
+    With ``overlap_persona_generation`` Phase 0 is streamed and each
+    contestant starts its Round 1 draft as soon as its persona is complete,
+    while the rest of the persona set is still being generated.
+
+    With ``pipeline_rounds`` the judge critiques each draft in its own call as
+    soon as that draft is written, so Round 2 overlaps Round 1.
+
+    Judges score every draft from 0 to 10. With ``acceptance_threshold`` set,
+    a draft whose score reaches it is promoted to the final output and Round 3
+    (the largest call) is skipped.
+
+    With ``prompt_layout="shared_prefix"`` the Round 2 and Round 3 prompts
+    open with the task and drafts (no system prompt) and put the role
+    instructions last. Providers key their prompt cache on the output tool
+    definitions ahead of the messages, so the cache is shared within a round:
+    the judges of Round 2 (and retried or hedged requests) process the long
+    task-and-drafts part once. Cached tokens are reported in the metrics.
+
+    With ``synthesis_mode="patch"`` Round 3 returns edits against the best
+    draft instead of rewriting it, cutting the output tokens of the slowest
+    call. Edits are applied locally; if any fails to apply cleanly the round
+    falls back to a full synthesis.
+
+    Every agent call runs under ``resilience``: by default transient errors
+    (rate limits, server errors, dropped connections) are retried up to three
+    times with jittered backoff. It also sets per-role timeouts, hedging
+    (duplicate a call that outlives the role's p95 latency, keep the first
+    answer) and a chain of fallback models.
+
+    Share a ``scheduler`` between tournaments to keep all of their requests
+    within per-model requests/tokens-per-minute quotas; queued requests of
+    later phases and older tournaments go first.
+
+    With ``checkpoint_dir`` set, the output of every phase is saved there as
+    it completes (one JSON file per run of a task, see ``checkpoint_path``);
+    ``resume`` continues a tournament from its last completed phase.
+
+    ``role_models`` runs a role on a model other than ``model``: keys are
+    the role kinds in ``MODEL_ROLES`` ('judge' covers every judge,
+    'synthesizer' the full and patch syntheses). ``from_preset`` builds one
+    from a named routing in ``MODEL_PRESETS``, e.g. ``"fast-review"`` puts
+    Phase 0 and Round 2 on a small fast model.
+
+    ``deadline_s`` and ``token_budget`` bound a whole run (every phase, in
+    seconds and in input plus output tokens). When either runs out, every
+    call still in flight is cancelled and the run returns a partial result:
+    the best draft so far is the final output, ``completed_phases`` lists
+    what finished and ``stop_reason`` says why. If no draft was written yet,
+    ``BudgetExceeded`` is raised instead. Within a round, a failing call
+    cancels its sibling calls instead of letting them run on.
+
+    The ``on_phase_start``, ``on_phase_end``, ``on_call_start`` and
+    ``on_call_end`` hooks are called with the matching events (see
+    ``adversarial_tournament.events``) of every run, carrying phase and call
+    timings, token usage and prompt sizes, so tracing, logging and progress
+    bars plug in without changing the pipeline. Hooks run inline in the
+    event loop and must return quickly; an exception raised by one fails the
+    run. Without hooks or a listener no call events are built at all.
+    ``run_events`` yields the same events as an async iterator.
+
+    Models given by name are resolved through ``clients``, so every agent
+    and every tournament sharing it (by default, every tournament in the
+    process) send their requests over one pooled, kept-alive HTTP client.
+
+    Set ``persona_cache`` to reuse Phase 0 results for repeated tasks,
+    ``persona_index`` to reuse them for near-duplicate tasks too, and
+    ``response_cache`` to record (or replay) every model response. Built
+    agents are kept in ``agent_registry`` and reused by later runs; pass one
+    registry to several tournaments to share it.
     """
 
-    model: str = field(default=DEFAULT_MODEL)
+    model: Model | str = field(default=DEFAULT_MODEL)
+    role_models: Mapping[str, Model | str] = field(default_factory=dict)
+    contestants: int = field(default=2)
+    judges: int = field(default=1)
+    max_concurrent_calls: int | None = field(default=None)
+    acceptance_threshold: float | None = field(default=None)
+    overlap_persona_generation: bool = field(default=False)
+    pipeline_rounds: bool = field(default=False)
+    prompt_layout: PromptLayout = field(default="persona_first")
+    synthesis_mode: SynthesisMode = field(default="full")
+    persona_cache: PersonaCache | None = field(default=None)
+    persona_index: PersonaIndex | None = field(default=None)
+    response_cache: ResponseCache | None = field(default=None)
+    resilience: ResiliencePolicy = field(default_factory=ResiliencePolicy)
+    scheduler: RateLimitScheduler | None = field(default=None)
+    checkpoint_dir: Path | None = field(default=None)
+    deadline_s: float | None = field(default=None)
+    token_budget: int | None = field(default=None)
+    on_phase_start: Callable[[PhaseStarted], None] | None = field(default=None, repr=False)
+    on_phase_end: Callable[[PhaseCompleted], None] | None = field(default=None, repr=False)
+    on_call_start: Callable[[CallStarted], None] | None = field(default=None, repr=False)
+    on_call_end: Callable[[CallCompleted | CallFailed], None] | None = field(
+        default=None, repr=False
+    )
+    clients: ModelClients = field(default_factory=ModelClients.shared, repr=False)
+    agent_registry: AgentRegistry = field(default_factory=AgentRegistry, repr=False)
+    _caching_models: dict[int, tuple[Model, CachingModel]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _latencies: LatencyTracker = field(
+        default_factory=LatencyTracker, init=False, repr=False, compare=False
+    )
+    _checkpoints_in_use: set[Path] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.contestants < 2:
+            raise ValueError("contestants must be at least 2")
+        if self.judges < 1:
+            raise ValueError("judges must be at least 1")
+        if self.max_concurrent_calls is not None and self.max_concurrent_calls < 1:
+            raise ValueError("max_concurrent_calls must be at least 1")
+        if self.acceptance_threshold is not None and not 0 <= self.acceptance_threshold <= 10:
+            raise ValueError("acceptance_threshold must be between 0 and 10")
+        if self.deadline_s is not None and self.deadline_s <= 0:
+            raise ValueError("deadline_s must be positive")
+        if self.token_budget is not None and self.token_budget < 1:
+            raise ValueError("token_budget must be at least 1")
+        unknown = set(self.role_models) - set(MODEL_ROLES)
+        if unknown:
+            raise ValueError(
+                f"unknown role in role_models: {', '.join(sorted(unknown))} "
+                f"(expected one of: {', '.join(MODEL_ROLES)})"
+            )
+
+    @classmethod
+    def from_preset(cls, preset: str, **kwargs: Any) -> "AdversarialTournament":
+        """Create a tournament routing roles to models as named in ``MODEL_PRESETS``.
+
+        Args:
+            preset: Name of the preset, e.g. ``"fast-review"``.
+            **kwargs: Other tournament fields; models in ``role_models``
+                override the preset's.
+
+        Raises:
+            ValueError: If the preset is unknown.
+        """
+        if preset not in MODEL_PRESETS:
+            raise ValueError(
+                f"unknown model preset {preset!r} (expected one of: {', '.join(MODEL_PRESETS)})"
+            )
+        role_models = {**MODEL_PRESETS[preset], **kwargs.pop("role_models", {})}
+        return cls(role_models=role_models, **kwargs)
+
+    def model_for(self, role: str) -> Model | str:
+        """Return the model configured for a role ('judge_2' and 'judge' alike)."""
+        return self.role_models.get(setting_role(role), self.model)
 
     async def run(self, task: str) -> TournamentResult:
         """Run the full tournament asynchronously.
@@ -45,26 +433,332 @@ class AdversarialTournament:
         Returns:
             TournamentResult containing all rounds and the final output.
         """
-        # Phase 0: Generate personas
-        personas = await self._generate_personas(task)
+        with self._claim_checkpoint(task) as path:
+            return await self._run(task, _RunContext(), checkpoint_path=path)
+
+    async def resume(self, checkpoint: TournamentCheckpoint | str | Path) -> TournamentResult:
+        """Continue a tournament from its last completed phase.
+
+        Phases stored in the checkpoint are not run again; their outputs feed
+        the remaining phases, whose progress is saved back to the checkpoint
+        file (or, for a checkpoint object, to ``checkpoint_path``).
+
+        Args:
+            checkpoint: A checkpoint, or the path of a saved checkpoint file.
+
+        Returns:
+            TournamentResult containing all rounds and the final output.
+
+        Raises:
+            ValueError: If the checkpoint was made with a different number of
+                contestants or judges.
+        """
+        path = None
+        if not isinstance(checkpoint, TournamentCheckpoint):
+            path = Path(checkpoint)
+            checkpoint = TournamentCheckpoint.load(path)
 
-        # Round 1: Parallel drafts
-        round_one = await self._run_round_one(task, personas)
+        if (checkpoint.contestants, checkpoint.judges) != (self.contestants, self.judges):
+            raise ValueError(
+                f"checkpoint has {checkpoint.contestants} contestants and {checkpoint.judges} "
+                f"judges, the tournament {self.contestants} and {self.judges}"
+            )
+        with self._claim_checkpoint(checkpoint.task, path=path) as path:
+            return await self._run(checkpoint.task, _RunContext(), checkpoint, path)
 
-        # Round 2: Judge critique
-        round_two = await self._run_round_two(task, personas, round_one)
+    def checkpoint_path(self, task: str, run: int = 0) -> Path | None:
+        """Return the checkpoint file for a task, or None without ``checkpoint_dir``.
 
-        # Round 3: Synthesis
-        round_three = await self._run_round_three(
-            task, personas, round_one, round_two
+        Files are keyed on the task, the model and the number of contestants
+        and judges, so differently configured tournaments sharing a directory
+        keep separate checkpoints. ``run`` numbers the runs of one task that
+        are in flight at the same time (the first is 0).
+        """
+        if self.checkpoint_dir is None:
+            return None
+        key = "\0".join(
+            [normalize_task(task), model_id(self.model), str(self.contestants), str(self.judges)]
         )
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return Path(self.checkpoint_dir) / (f"{digest}-{run}.json" if run else f"{digest}.json")
+
+    @contextlib.contextmanager
+    def _claim_checkpoint(
+        self, task: str, run: int = 0, path: Path | None = None
+    ) -> Iterator[Path | None]:
+        """Reserve a checkpoint file no other run in flight is writing.
+
+        ``path`` is reserved as given; otherwise the first free file of
+        ``task`` from ``run`` on is.
+        """
+        if path is None:
+            path = self.checkpoint_path(task, run)
+            while path is not None and path in self._checkpoints_in_use:
+                run += 1
+                path = self.checkpoint_path(task, run)
+        claimed = path is not None and path not in self._checkpoints_in_use
+        if claimed:
+            self._checkpoints_in_use.add(path)
+        try:
+            yield path
+        finally:
+            if claimed:
+                self._checkpoints_in_use.discard(path)
+
+    async def stream(self, task: str, deltas: bool = True) -> AsyncIterator[TournamentEvent]:
+        """Run the tournament, streaming its progress as it is generated.
+
+        Every agent call is streamed: Round 1 drafts and the Round 3 output
+        arrive as ``TextDelta`` events, structured outputs (personas, the
+        Round 2 critique) additionally as ``PartialOutput`` snapshots. The
+        final event is always ``TournamentCompleted``.
+
+        Args:
+            task: The task description for the tournament.
+            deltas: Stream agent calls; with False only phase events and the
+                result are yielded and agent calls run as in ``run``.
+
+        Yields:
+            TournamentEvent instances in the order they occur.
+        """
+        async for event in self._events(task, stream_calls=deltas, call_events=False):
+            yield event
+
+    async def run_events(self, task: str) -> AsyncIterator[TournamentEvent]:
+        """Run the tournament, yielding its phase and call events as they happen.
+
+        Agent calls run as in ``run`` (not streamed). Yields ``PhaseStarted``
+        and ``PhaseCompleted`` (with the phase timing), ``CallStarted``,
+        ``CallCompleted`` (with the call's timing and token usage) or
+        ``CallFailed`` for every agent call, and finally ``TournamentCompleted``.
+
+        Args:
+            task: The task description for the tournament.
+
+        Yields:
+            TournamentEvent instances in the order they occur.
+        """
+        async for event in self._events(task, stream_calls=False, call_events=True):
+            yield event
+
+    async def _events(
+        self, task: str, stream_calls: bool, call_events: bool
+    ) -> AsyncIterator[TournamentEvent]:
+        """Run the tournament in a task, yielding the events it publishes."""
+        queue: asyncio.Queue[TournamentEvent | None] = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                with self._claim_checkpoint(task) as path:
+                    result = await self._run(
+                        task,
+                        _RunContext(
+                            emit=queue.put_nowait,
+                            stream_calls=stream_calls,
+                            call_events=call_events,
+                        ),
+                        checkpoint_path=path,
+                    )
+                queue.put_nowait(TournamentCompleted(result))
+            finally:
+                queue.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (event := await queue.get()) is not None:
+                yield event
+            # Surface any failure from the pipeline
+            await producer
+        finally:
+            producer.cancel()
+
+    async def _run(
+        self,
+        task: str,
+        context: _RunContext,
+        checkpoint: TournamentCheckpoint | None = None,
+        checkpoint_path: Path | None = None,
+    ) -> TournamentResult:
+        """Run every phase of the tournament within ``context``.
+
+        Phases already stored in ``checkpoint`` are skipped; every phase that
+        completes is stored in it and, with ``checkpoint_path``, saved. With a
+        deadline or token budget, a run that stops early returns a partial
+        result (its Round 3 is not saved, so ``resume`` can still finish it).
+        """
+        if self.max_concurrent_calls is not None and context.call_slots is None:
+            context.call_slots = asyncio.Semaphore(self.max_concurrent_calls)
+        if checkpoint is None:
+            checkpoint = TournamentCheckpoint(
+                task=task, contestants=self.contestants, judges=self.judges
+            )
+
+        def save(**outputs: Any) -> None:
+            for name, value in outputs.items():
+                setattr(checkpoint, name, value)
+            if checkpoint_path is not None:
+                checkpoint.save(checkpoint_path)
+
+        token = _current_run.set(context)
+        stop_reason: StopReason | None = None
+        try:
+            work = self._run_phases(task, checkpoint, save)
+            if self.deadline_s is None and self.token_budget is None:
+                await work
+            else:
+                context.token_budget = self.token_budget
+                stop_reason = await self._run_within_budget(work, context)
+        finally:
+            _current_run.reset(token)
 
+        if checkpoint.round_three is None:
+            assert stop_reason is not None
+            return self._partial_result(checkpoint, context, stop_reason)
+        assert checkpoint.personas is not None
+        completed = checkpoint.completed_phases
+        if checkpoint.promoted_draft is not None:
+            completed.remove("round_three")
         return TournamentResult(
             task=task,
+            personas=checkpoint.personas,
+            round_one=checkpoint.round_one,
+            round_two=checkpoint.round_two,
+            round_three=checkpoint.round_three,
+            promoted_draft=checkpoint.promoted_draft,
+            completed_phases=completed,
+            metrics=context.metrics(model_id(self.model)),
+        )
+
+    async def _run_phases(
+        self,
+        task: str,
+        checkpoint: TournamentCheckpoint,
+        save: Callable[..., None],
+    ) -> None:
+        """Run every phase not yet in ``checkpoint``, saving each output as it completes."""
+        # Phase 0: Generate personas (optionally starting drafts early)
+        early_drafts: dict[int, asyncio.Task[str]] = {}
+        personas = checkpoint.personas
+        if personas is None and self.overlap_persona_generation:
+            personas = await self._phase(
+                "phase_zero",
+                self._generate_personas_overlapped(task, early_drafts),
+            )
+            save(personas=personas)
+        elif personas is None:
+            personas = await self._phase(
+                "phase_zero", self._generate_personas(task)
+            )
+            save(personas=personas)
+
+        round_one, round_two = checkpoint.round_one, checkpoint.round_two
+        if round_one is None and self.pipeline_rounds:
+            # Rounds 1 + 2: each draft is critiqued as soon as it is written
+            round_one, round_two = await self._run_pipelined_rounds(
+                task, personas, early_drafts
+            )
+            save(round_one=round_one, round_two=round_two)
+        else:
+            # Round 1: Parallel drafts
+            if round_one is None:
+                round_one = await self._phase(
+                    "round_one", self._run_round_one(task, personas, early_drafts)
+                )
+                save(round_one=round_one)
+
+            # Round 2: Judge critique
+            if round_two is None:
+                round_two = await self._phase(
+                    "round_two", self._run_round_two(task, personas, round_one)
+                )
+                save(round_two=round_two)
+
+        # Early exit: promote a draft the judges already accept
+        round_three, promoted = checkpoint.round_three, checkpoint.promoted_draft
+        if round_three is None:
+            promoted = self._accepted_draft(round_two)
+            if promoted is not None:
+                round_three = self._promote_draft(personas, round_one, round_two, promoted)
+            else:
+                # Round 3: Synthesis
+                round_three = await self._phase(
+                    "round_three",
+                    self._run_round_three(task, personas, round_one, round_two),
+                )
+            save(round_three=round_three, promoted_draft=promoted)
+
+    async def _run_within_budget(
+        self, work: Coroutine[Any, Any, None], context: _RunContext
+    ) -> StopReason | None:
+        """Run the phases until they finish, the deadline passes or the token budget runs out.
+
+        The phases run as one task; on a stop it is cancelled, which cancels
+        every agent call still in flight, and awaited so they have all
+        unwound before the partial result is built.
+
+        Returns:
+            None if every phase finished, otherwise why the run stopped.
+        """
+        phases = asyncio.create_task(work)
+        over_budget = asyncio.create_task(context.over_budget.wait())
+        timeout = None
+        if self.deadline_s is not None:
+            timeout = max(self.deadline_s - (time.perf_counter() - context.started_at), 0)
+        stopped = False
+        try:
+            await asyncio.wait(
+                {phases, over_budget}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            over_budget.cancel()
+            if not phases.done():
+                stopped = True
+                phases.cancel()
+                await asyncio.wait({phases})
+
+        if not stopped:
+            phases.result()
+            return None
+        return "token_budget" if context.over_budget.is_set() else "deadline"
+
+    def _partial_result(
+        self, checkpoint: TournamentCheckpoint, context: _RunContext, reason: StopReason
+    ) -> TournamentResult:
+        """Build the result of a stopped run around its best draft.
+
+        The draft the judges scored highest is promoted if Round 2 completed,
+        otherwise the first finished draft.
+
+        Raises:
+            BudgetExceeded: If no draft was finished.
+        """
+        personas = checkpoint.personas
+        round_one, round_two = checkpoint.round_one, checkpoint.round_two
+        completed = checkpoint.completed_phases
+        drafts = dict(enumerate(round_one.drafts, start=1)) if round_one else context.drafts
+        if personas is None or not drafts:
+            raise BudgetExceeded(reason, completed)
+
+        best = round_two.best_draft() if round_two is not None else None
+        number = best[0] if best is not None and best[0] in drafts else min(drafts)
+        score = f" (scored {best[1]:g}/10)" if best is not None and best[0] == number else ""
+        return TournamentResult(
+            task=checkpoint.task,
             personas=personas,
             round_one=round_one,
             round_two=round_two,
-            round_three=round_three,
+            round_three=RoundThreeOutput(
+                collaboration_discussion=(
+                    f"Round 3 not run: the tournament stopped at its "
+                    f"{reason.replace('_', ' ')} after {', '.join(completed)}; "
+                    f"{personas.contestants[number - 1].name}'s draft{score} is the final output."
+                ),
+                final_output=drafts[number],
+            ),
+            promoted_draft=number,
+            completed_phases=completed,
+            stop_reason=reason,
+            metrics=context.metrics(model_id(self.model)),
         )
 
     def run_sync(self, task: str) -> TournamentResult:
@@ -78,50 +772,625 @@ class AdversarialTournament:
         """
         return asyncio.run(self.run(task))
 
-    async def _generate_personas(self, task: str) -> PersonaSet:
-        """Phase 0: Generate personas based on the task."""
-        agent = create_persona_generator(self.model)
-        result = await agent.run(f"Create personas for this task: {task}")
-        return result.output
+    async def run_many(
+        self,
+        tasks: Iterable[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        resume: bool = False,
+    ) -> AsyncIterator[TournamentResult | TournamentError]:
+        """Run many tournaments concurrently, yielding each as it finishes.
+
+        At most ``max_concurrency`` tournaments are in flight at once. Tasks
+        are pulled lazily from ``tasks``, so large (or generated) task lists
+        are never materialized up front. Results are yielded in completion
+        order, not input order.
+
+        A failing tournament does not stop the batch: a ``TournamentError``
+        carrying the task and the original exception is yielded in place of
+        its result.
+
+        Args:
+            tasks: The task descriptions to run.
+            max_concurrency: Maximum number of tournaments running at once.
+            resume: Resume every task that has a checkpoint in
+                ``checkpoint_dir`` instead of starting it over. Repeats of a
+                task in ``tasks`` each keep their own checkpoint, numbered
+                by occurrence.
+
+        Yields:
+            A TournamentResult, or a TournamentError for each failed task.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        async def run_one(task: str, run: int) -> TournamentResult | TournamentError:
+            try:
+                with self._claim_checkpoint(task, run) as path:
+                    if resume and path is not None and path.exists():
+                        return await self.resume(path)
+                    return await self._run(task, _RunContext(), checkpoint_path=path)
+            except Exception as e:
+                return TournamentError(task, e)
+
+        # Occurrences so far of each task, by its first checkpoint file
+        runs: dict[Path, int] = {}
+        pending: set[asyncio.Task[TournamentResult | TournamentError]] = set()
+        try:
+            for task in tasks:
+                run = 0
+                if (first := self.checkpoint_path(task)) is not None:
+                    run = runs.get(first, 0)
+                    runs[first] = run + 1
+                # Bounded window: only start a new tournament once a slot frees up
+                while len(pending) >= max_concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for finished in done:
+                        yield finished.result()
+                pending.add(asyncio.create_task(run_one(task, run)))
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for finished in done:
+                    yield finished.result()
+        finally:
+            for unfinished in pending:
+                unfinished.cancel()
+
+    def _emit(self, event: TournamentEvent) -> None:
+        """Publish an event to its hook and to the current run's listener, if any."""
+        hook = getattr(self, _HOOKS[type(event)])
+        if hook is not None:
+            hook(event)
+        context = _current_run.get()
+        if (
+            context is not None
+            and context.emit is not None
+            and (context.call_events or type(event) not in _CALL_EVENTS)
+        ):
+            context.emit(event)
+
+    def _watching_calls(self, context: _RunContext | None) -> bool:
+        """Whether anyone receives the call events of a run."""
+        return (
+            self.on_call_start is not None
+            or self.on_call_end is not None
+            or (context is not None and context.call_events)
+        )
+
+    def _start_phase(self, phase: Phase) -> None:
+        """Record and publish the start of a phase, once per run even if phases overlap."""
+        context = _current_run.get()
+        if context is not None and context.start_phase(phase):
+            self._emit(PhaseStarted(phase))
+
+    def _complete_phase(self, phase: Phase, output: BaseModel) -> None:
+        """Record and publish the completion of a phase."""
+        context = _current_run.get()
+        metrics = context.complete_phase(phase) if context is not None else None
+        self._emit(PhaseCompleted(phase, output, metrics))
+
+    async def _phase(self, phase: Phase, work: Awaitable[OutputT]) -> OutputT:
+        """Run one phase, publishing its start and completion."""
+        self._start_phase(phase)
+        output = await work
+        self._complete_phase(phase, output)
+        return output
+
+    def _agent_model(self, role: str) -> Model:
+        """Return the model a role's agents are built with.
+
+        Models given by name are shared via ``clients``, and every model is
+        routed through ``response_cache`` when one is set.
+        """
+        model = self.clients.model(self.model_for(role))
+        if self.response_cache is None:
+            return model
+        cached = self._caching_models.get(id(model))
+        if cached is None or cached[0] is not model or cached[1].cache is not self.response_cache:
+            cached = self._caching_models[id(model)] = (model, self.response_cache.wrap(model))
+        return cached[1]
+
+    async def _call(
+        self,
+        agent: Agent[None, OutputT],
+        prompt: str,
+        *,
+        phase: Phase,
+        role: str,
+        on_partial: Callable[[dict[str, Any]], None] | None = None,
+    ) -> OutputT:
+        """Run one agent call; every agent in the tournament goes through here.
+
+        Waits for a free slot first when ``max_concurrent_calls`` is set (the
+        call is timed from when it gets one).
+
+        The call is streamed when the run has a listener (its deltas are
+        published as they arrive) or when ``on_partial`` wants to see the
+        partially parsed structured output; otherwise the agent runs normally.
+
+        Each attempt is bounded by the role's timeout; timeouts and transient
+        errors are retried with backoff (releasing the slot while waiting) and
+        then moved to the fallback models, as set by ``resilience``. Before a
+        streamed call that already published deltas is retried,
+        ``StreamRestarted`` tells listeners to discard them.
+        """
+        context = _current_run.get()
+        emit = context.emit if context is not None and context.stream_calls else None
+        slots = context.call_slots if context is not None else None
+        watched = self._watching_calls(context)
+        policy = self.resilience
+        timeout = policy.timeout_for(role)
+
+        started: float | None = None
+        finished = False
+        # Whether the latest attempt published deltas a retry would repeat
+        streamed = False
+        attempts = 0
+        error: BaseException | None = None
+        model: Model | str | None = None
+        try:
+            for model in self._call_models(agent):
+                for attempt in range(policy.max_attempts):
+                    if error is not None and attempt > 0:
+                        await asyncio.sleep(policy.backoff(attempt - 1))
+                    if streamed:
+                        assert emit is not None
+                        emit(StreamRestarted(phase, role))
+                        streamed = False
+                    attempts += 1
+                    try:
+                        async with (
+                            slots or contextlib.nullcontext(),
+                            self._reserve(model, prompt, phase, context) as reservation,
+                        ):
+                            attempt_started = time.perf_counter()
+                            if started is None:
+                                started = attempt_started
+                                if watched:
+                                    self._emit(
+                                        CallStarted(phase, role, model_id(model), len(prompt))
+                                    )
+                            async with asyncio.timeout(timeout):
+                                if emit is None and on_partial is None:
+                                    output, usage, hedged = await self._run_hedged(
+                                        agent, prompt, model, role
+                                    )
+                                else:
+                                    hedged = False
+
+                                    def publish(event: TournamentEvent) -> None:
+                                        nonlocal streamed
+                                        streamed = True
+                                        emit(event)
+
+                                    output, usage = await self._call_streamed(
+                                        agent,
+                                        prompt,
+                                        model,
+                                        phase,
+                                        role,
+                                        publish if emit is not None else None,
+                                        on_partial,
+                                    )
+                            if reservation is not None:
+                                # A hedged call paid for (up to) two requests
+                                reservation.used(usage.total_tokens * (2 if hedged else 1))
+                    except Exception as e:
+                        if not is_transient(e):
+                            raise
+                        if (
+                            self.scheduler is not None
+                            and isinstance(e, ModelHTTPError)
+                            and e.status_code == 429
+                        ):
+                            # Hold back every tournament sharing the quota, not just this call
+                            self.scheduler.pause(model_id(model), policy.backoff(attempt))
+                        error = e
+                        continue
+
+                    self._latencies.record(role, time.perf_counter() - attempt_started)
+                    finished = True
+                    if context is not None:
+                        metrics = context.record_call(
+                            phase, role, model_id(model), started, usage, attempts, hedged
+                        )
+                        if watched:
+                            self._emit(CallCompleted(phase, role, len(prompt), metrics))
+                    return output
+
+            assert error is not None
+            raise error
+        except BaseException as e:
+            if watched and started is not None and not finished:
+                assert model is not None
+                self._emit(
+                    CallFailed(
+                        phase,
+                        role,
+                        model_id(model),
+                        len(prompt),
+                        time.perf_counter() - started,
+                        e,
+                    )
+                )
+            raise
+
+    def _reserve(
+        self, model: Model | str, prompt: str, phase: Phase, context: _RunContext | None
+    ) -> contextlib.AbstractAsyncContextManager[Reservation | None]:
+        """Wait for rate-limit quota when a scheduler is set (older runs and later phases first)."""
+        if self.scheduler is None:
+            return contextlib.nullcontext()
+        started_at = context.started_at if context is not None else time.perf_counter()
+        return self.scheduler.reserve(
+            model_id(model), prompt, (PHASE_PRIORITY[phase], started_at)
+        )
+
+    def _call_models(self, agent: Agent[None, Any]) -> Iterator[Model | str]:
+        """Yield the agent's model, then each fallback model (response-cached if enabled)."""
+        assert agent.model is not None
+        yield agent.model
+        for fallback in self.resilience.fallback_models:
+            model = self.clients.model(fallback)
+            yield model if self.response_cache is None else self.response_cache.wrap(model)
+
+    async def _run_hedged(
+        self, agent: Agent[None, OutputT], prompt: str, model: Model | str, role: str
+    ) -> tuple[OutputT, RunUsage, bool]:
+        """Run an agent call, firing a duplicate if it outlives the role's hedge delay.
+
+        Returns the output and usage of whichever request finished first, and
+        whether a duplicate was fired. Only non-streamed calls are hedged, so
+        listeners never see two copies of the same deltas.
+        """
+
+        async def attempt() -> tuple[OutputT, RunUsage]:
+            result = await agent.run(prompt, model=model)
+            return result.output, result.usage()
+
+        policy = self.resilience
+        delay = None
+        if policy.hedge_quantile is not None:
+            delay = self._latencies.quantile(
+                role, policy.hedge_quantile, policy.hedge_min_samples
+            )
+        if delay is None:
+            return *(await attempt()), False
+
+        primary = asyncio.ensure_future(attempt())
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return *primary.result(), False
+
+            tasks.add(asyncio.ensure_future(attempt()))
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return *task.result(), True
+            # Both requests failed: surface the original one's error
+            return *primary.result(), True
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    async def _call_streamed(
+        agent: Agent[None, OutputT],
+        prompt: str,
+        model: Model | str,
+        phase: Phase,
+        role: str,
+        emit: Callable[[TournamentEvent], None] | None,
+        on_partial: Callable[[dict[str, Any]], None] | None,
+    ) -> tuple[OutputT, RunUsage]:
+        """Stream one agent call, publishing deltas and partial outputs."""
+        async with agent.run_stream(prompt, model=model) as stream:
+            if agent.output_type is str:
+                async for delta in stream.stream_text(delta=True):
+                    if emit is not None:
+                        emit(TextDelta(phase, role, delta))
+            else:
+                previous: dict[str, Any] = {}
+                # Partial consumers act on field boundaries, so don't batch chunks for them
+                debounce_by = None if on_partial is not None else 0.1
+                async for response, _ in stream.stream_responses(debounce_by=debounce_by):
+                    fields = _partial_tool_args(response)
+                    if not fields or fields == previous:
+                        continue
+                    if on_partial is not None:
+                        on_partial(fields)
+                    if emit is not None:
+                        emit(PartialOutput(phase, role, fields))
+                        for name, delta in _text_deltas(previous, fields):
+                            emit(TextDelta(phase, role, delta, field=name))
+                    previous = fields
+            output = await stream.get_output()
+            return output, stream.usage()
+
+    async def _generate_personas(
+        self,
+        task: str,
+        on_partial: Callable[[dict[str, Any]], None] | None = None,
+    ) -> PersonaSet:
+        """Phase 0: Generate personas based on the task (or reuse cached or similar ones)."""
+        instructions = build_persona_generator_prompt(self.contestants, self.judges)
+        generator_model = self.model_for("persona_generator")
+        for cache in (self.persona_cache, self.persona_index):
+            if cache is not None:
+                cached = cache.get(task, generator_model, instructions)
+                if cached is not None:
+                    return cached
+
+        model = self._agent_model("persona_generator")
+        agent = self.agent_registry.get(
+            f"persona_generator:{self.contestants}x{self.judges}",
+            model,
+            (),
+            lambda: create_persona_generator(model, self.contestants, self.judges),
+        )
+        personas = await self._call(
+            agent,
+            f"Create personas for this task: {task}",
+            phase="phase_zero",
+            role="persona_generator",
+            on_partial=on_partial,
+        )
+
+        for cache in (self.persona_cache, self.persona_index):
+            if cache is not None:
+                cache.put(task, generator_model, personas, instructions)
+        return personas
+
+    async def _generate_personas_overlapped(
+        self, task: str, early_drafts: dict[int, asyncio.Task[str]]
+    ) -> PersonaSet:
+        """Phase 0 overlapped with Round 1.
+
+        The persona set is streamed, and each contestant's draft is started
+        (into ``early_drafts``) as soon as its persona validates, i.e. once the
+        model has moved on to the next field or list item. A draft whose
+        persona does not survive into the final persona set (e.g. after an
+        output retry) is cancelled and left for Round 1 to redo.
+        """
+        started: dict[int, tuple[Persona, asyncio.Task[str]]] = {}
+
+        def start_ready_drafts(fields: dict[str, Any]) -> None:
+            for number, value in _complete_contestants(fields):
+                if number in started or number > self.contestants:
+                    continue
+                try:
+                    persona = Persona.model_validate(value)
+                except ValidationError:
+                    continue
+                draft = asyncio.create_task(self._write_draft(task, persona, number))
+                started[number] = (persona, draft)
+
+        try:
+            personas = await self._generate_personas(task, on_partial=start_ready_drafts)
+        except BaseException:
+            for _, draft in started.values():
+                draft.cancel()
+            raise
+
+        contestants = personas.contestants
+        for number, (persona, draft) in started.items():
+            if number <= len(contestants) and persona == contestants[number - 1]:
+                early_drafts[number] = draft
+            else:
+                draft.cancel()
+        return personas
+
+    def _contestant_agent(self, persona: Persona) -> Agent[None, str]:
+        """Return the (possibly reused) contestant agent for a persona."""
+        model = self._agent_model("contestant")
+        return self.agent_registry.get(
+            "contestant",
+            model,
+            (persona,),
+            lambda: create_contestant_agent(persona, model),
+        )
+
+    @staticmethod
+    def _judge_role(number: int, judges: list[Persona]) -> str:
+        """Name a judge in metrics and events ('judge', or 'judge_2' when there are several)."""
+        return "judge" if len(judges) == 1 else f"judge_{number}"
+
+    async def _write_draft(self, task: str, persona: Persona, number: int) -> str:
+        """Round 1: Have one contestant write its draft."""
+        self._start_phase("round_one")
+        draft = await self._call(
+            self._contestant_agent(persona),
+            build_round_one_prompt(persona, task),
+            phase="round_one",
+            role=f"contestant_{number}",
+        )
+        context = _current_run.get()
+        if context is not None:
+            # Kept for a partial result should the run stop before Round 1 completes
+            context.drafts[number] = draft
+        return draft
 
     async def _run_round_one(
-        self, task: str, personas: PersonaSet
+        self,
+        task: str,
+        personas: PersonaSet,
+        early_drafts: dict[int, asyncio.Task[str]] | None = None,
     ) -> RoundOneOutput:
-        """Round 1: Run both contestants in parallel with asyncio.gather()."""
-        agent_1 = create_contestant_agent(personas.contestant_1, self.model)
-        agent_2 = create_contestant_agent(personas.contestant_2, self.model)
+        """Round 1: Run every contestant in parallel; one failing cancels the others.
 
-        prompt_1 = build_round_one_prompt(personas.contestant_1, task)
-        prompt_2 = build_round_one_prompt(personas.contestant_2, task)
+        Drafts already started during an overlapped Phase 0 are awaited
+        instead of being written again.
+        """
+        early_drafts = early_drafts or {}
 
-        # Parallel execution using asyncio.gather()
-        result_1, result_2 = await asyncio.gather(
-            agent_1.run(prompt_1),
-            agent_2.run(prompt_2),
+        drafts = await _gather(
+            *(
+                early_drafts.get(number) or self._write_draft(task, persona, number)
+                for number, persona in enumerate(personas.contestants, start=1)
+            )
         )
 
-        return RoundOneOutput(
-            contestant_1_draft=result_1.output,
-            contestant_2_draft=result_2.output,
-        )
+        return RoundOneOutput.from_drafts(list(drafts))
 
     async def _run_round_two(
         self, task: str, personas: PersonaSet, round_one: RoundOneOutput
     ) -> RoundTwoCritique:
-        """Round 2: Judge critiques both drafts."""
-        agent = create_judge_agent(personas.judge, self.model)
+        """Round 2: Every judge critiques all drafts, in parallel."""
+        model = self._agent_model("judge")
+        shared_prefix = self.prompt_layout == "shared_prefix"
+        require_scores = self._requires_scores
+        contestants = personas.contestants
+        judges = personas.judges
+        kind = (
+            f"{'judge_shared_prefix' if shared_prefix else 'judge'}:{len(contestants)}"
+            f"{':scored' if require_scores else ''}"
+        )
 
-        prompt = build_round_two_prompt(
-            judge_persona=personas.judge,
-            contestant_1_persona=personas.contestant_1,
-            contestant_2_persona=personas.contestant_2,
-            task=task,
-            draft_1=round_one.contestant_1_draft,
-            draft_2=round_one.contestant_2_draft,
+        async def critique(number: int, judge: Persona) -> RoundTwoCritique:
+            agent = self.agent_registry.get(
+                kind,
+                model,
+                (judge,),
+                lambda: create_judge_agent(
+                    judge, model, shared_prefix, len(contestants), require_scores
+                ),
+            )
+            prompt = build_round_two_prompt(
+                judge_persona=judge,
+                contestants=contestants,
+                task=task,
+                drafts=round_one.drafts,
+                layout=self.prompt_layout,
+            )
+            return await self._call(
+                agent, prompt, phase="round_two", role=self._judge_role(number, judges)
+            )
+
+        critiques = await _gather(
+            *(critique(number, judge) for number, judge in enumerate(judges, start=1))
+        )
+        return RoundTwoCritique.combine(list(critiques), [judge.name for judge in judges])
+
+    async def _run_pipelined_rounds(
+        self,
+        task: str,
+        personas: PersonaSet,
+        early_drafts: dict[int, asyncio.Task[str]] | None = None,
+    ) -> tuple[RoundOneOutput, RoundTwoCritique]:
+        """Rounds 1 + 2 pipelined: critique each draft the moment it completes.
+
+        A slow contestant no longer delays the critique of the faster ones:
+        every judge critiques each draft in its own call, in parallel, and the
+        per-draft critiques are merged afterwards.
+        """
+        model = self._agent_model("judge")
+        contestants = personas.contestants
+        judges = personas.judges
+        early_drafts = early_drafts or {}
+        drafts: dict[int, str] = {}
+        round_one: RoundOneOutput | None = None
+
+        require_scores = self._requires_scores
+
+        def judge_agent(judge: Persona) -> Agent[None, DraftCritique]:
+            return self.agent_registry.get(
+                "draft_judge:scored" if require_scores else "draft_judge",
+                model,
+                (judge,),
+                lambda: create_draft_judge_agent(judge, model, require_scores),
+            )
+
+        async def draft_then_critique(number: int) -> list[DraftCritique]:
+            nonlocal round_one
+            contestant = contestants[number - 1]
+            drafts[number] = await (
+                early_drafts.get(number) or self._write_draft(task, contestant, number)
+            )
+
+            self._start_phase("round_two")
+            if len(drafts) == len(contestants):
+                round_one = RoundOneOutput.from_drafts(
+                    [drafts[n] for n in range(1, len(contestants) + 1)]
+                )
+                self._complete_phase("round_one", round_one)
+
+            prompts = [
+                build_draft_critique_prompt(
+                    judge_persona=judge,
+                    contestant_persona=contestant,
+                    task=task,
+                    draft=drafts[number],
+                    draft_number=number,
+                )
+                for judge in judges
+            ]
+            return await _gather(
+                *(
+                    self._call(
+                        judge_agent(judge),
+                        prompt,
+                        phase="round_two",
+                        role=self._judge_role(judge_number, judges),
+                    )
+                    for judge_number, (judge, prompt) in enumerate(
+                        zip(judges, prompts), start=1
+                    )
+                )
+            )
+
+        self._start_phase("round_one")
+        per_draft = await _gather(
+            *(draft_then_critique(number) for number in range(1, len(contestants) + 1))
+        )
+        assert round_one is not None
+
+        # per_draft[draft][judge] -> one merged critique per judge, then combined
+        round_two = RoundTwoCritique.combine(
+            [RoundTwoCritique.merge(*by_judge) for by_judge in zip(*per_draft)],
+            [judge.name for judge in judges],
         )
+        self._complete_phase("round_two", round_two)
+        return round_one, round_two
+
+    @property
+    def _requires_scores(self) -> bool:
+        """Whether judges must score every draft (the acceptance threshold acts on the scores)."""
+        return self.acceptance_threshold is not None
 
-        result = await agent.run(prompt)
-        return result.output
+    def _accepted_draft(self, round_two: RoundTwoCritique) -> int | None:
+        """Return the number of the top-scored draft if it meets the acceptance threshold."""
+        if self.acceptance_threshold is None:
+            return None
+        best = round_two.best_draft()
+        if best is None or best[1] < self.acceptance_threshold:
+            return None
+        return best[0]
+
+    def _promote_draft(
+        self,
+        personas: PersonaSet,
+        round_one: RoundOneOutput,
+        round_two: RoundTwoCritique,
+        number: int,
+    ) -> RoundThreeOutput:
+        """Use an accepted Round 1 draft as the final output instead of running Round 3."""
+        author = personas.contestants[number - 1]
+        return RoundThreeOutput(
+            collaboration_discussion=(
+                f"Round 3 skipped: {author.name}'s draft scored "
+                f"{round_two.scores[number - 1]:g}/10, meeting the acceptance "
+                f"threshold of {self.acceptance_threshold:g}."
+            ),
+            final_output=round_one.drafts[number - 1],
+        )
 
     async def _run_round_three(
         self,
@@ -130,31 +1399,80 @@ class AdversarialTournament:
         round_one: RoundOneOutput,
         round_two: RoundTwoCritique,
     ) -> RoundThreeOutput:
-        """Round 3: Synthesis - contestant 1 leads collaboration."""
-        # Create synthesis agent with contestant 1's persona but synthesis instructions
-        agent: Agent[None, RoundThreeOutput] = Agent(
-            self.model,
-            output_type=RoundThreeOutput,
-            instructions=f"""You are {personas.contestant_1.name}, {personas.contestant_1.role}.
+        """Round 3: Synthesis - contestant 1 leads the collaboration."""
+        if self.synthesis_mode == "patch":
+            patched = await self._run_patch_synthesis(task, personas, round_one, round_two)
+            if patched is not None:
+                return patched
+
+        model = self._agent_model("synthesizer")
+        shared_prefix = self.prompt_layout == "shared_prefix"
+        lead, partner, *extra_partners = personas.contestants
+        agent = self.agent_registry.get(
+            "synthesizer_shared_prefix" if shared_prefix else "synthesizer",
+            model,
+            tuple(personas.contestants),
+            lambda: create_synthesizer_agent(
+                lead, partner, model, shared_prefix, extra_partners
+            ),
+        )
+
+        prompt = build_round_three_prompt(
+            contestants=personas.contestants,
+            judges=personas.judges,
+            task=task,
+            drafts=round_one.drafts,
+            critiques=round_two.critiques,
+            key_issues=round_two.key_issues,
+            layout=self.prompt_layout,
+        )
 
-You are now collaborating with {personas.contestant_2.name} to synthesize the best
-final output incorporating all feedback from the judge.
+        return await self._call(agent, prompt, phase="round_three", role="synthesizer")
+
+    async def _run_patch_synthesis(
+        self,
+        task: str,
+        personas: PersonaSet,
+        round_one: RoundOneOutput,
+        round_two: RoundTwoCritique,
+    ) -> RoundThreeOutput | None:
+        """Round 3 in patch mode: edit the best draft instead of rewriting it.
 
-Your goal is to create a unified output that addresses every criticism and combines
-the best elements of both drafts.""",
+        Returns None when the edits do not apply cleanly, so the caller can
+        fall back to a full synthesis.
+        """
+        model = self._agent_model("patch_synthesizer")
+        shared_prefix = self.prompt_layout == "shared_prefix"
+        lead, partner, *extra_partners = personas.contestants
+        agent = self.agent_registry.get(
+            "patch_synthesizer_shared_prefix" if shared_prefix else "patch_synthesizer",
+            model,
+            tuple(personas.contestants),
+            lambda: create_patch_synthesizer_agent(
+                lead, partner, model, shared_prefix, extra_partners
+            ),
         )
 
         prompt = build_round_three_prompt(
-            contestant_1_persona=personas.contestant_1,
-            contestant_2_persona=personas.contestant_2,
-            judge_persona=personas.judge,
+            contestants=personas.contestants,
+            judges=personas.judges,
             task=task,
-            draft_1=round_one.contestant_1_draft,
-            draft_2=round_one.contestant_2_draft,
-            critique_1=round_two.critique_of_contestant_1,
-            critique_2=round_two.critique_of_contestant_2,
+            drafts=round_one.drafts,
+            critiques=round_two.critiques,
             key_issues=round_two.key_issues,
+            layout=self.prompt_layout,
+            synthesis="patch",
         )
 
-        result = await agent.run(prompt)
-        return result.output
+        patch: RoundThreePatch = await self._call(
+            agent, prompt, phase="round_three", role="patch_synthesizer"
+        )
+        try:
+            final_output = apply_edits(round_one.drafts[patch.base_draft - 1], patch.edits)
+        except PatchError:
+            return None
+
+        return RoundThreeOutput(
+            collaboration_discussion=patch.collaboration_discussion,
+            final_output=final_output,
+        )
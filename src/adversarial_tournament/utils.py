@@ -0,0 +1,19 @@
+"""Small helpers shared across the tournament package."""
+
+from pydantic_ai.models import Model
+
+
+def model_id(model: Model | str) -> str:
+    """Return a stable identifier for a model name or Model instance.
+
+    Strings are returned unchanged; Model instances are identified as
+    ``"<system>:<model_name>"`` (e.g. ``"openai:gpt-4o-mini"``).
+    """
+    if isinstance(model, str):
+        return model
+    return f"{model.system}:{model.model_name}"
+
+
+def normalize_task(task: str) -> str:
+    """Collapse whitespace so trivially reformatted tasks compare equal."""
+    return " ".join(task.split())
@@ -0,0 +1,55 @@
+"""Shared fixtures for tournament tests.
+
+The fake model answers every phase of the tournament locally so the
+orchestrator can be exercised without an API key. It is the simulated model
+of ``adversarial_tournament.testing`` without latency and with short, fixed
+texts tests can assert on; a prompt containing "FAIL" makes it raise.
+"""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from pydantic_ai.messages import ModelMessage, ModelResponse
+from pydantic_ai.models.function import AgentInfo, DeltaToolCalls, FunctionModel
+
+from adversarial_tournament.testing import (
+    last_user_prompt,
+    simulated_chunks,
+    simulated_response,
+)
+
+# Fixed text of every generated field, by field name or kind
+FAKE_TEXTS = {
+    "draft": "A complete draft.",
+    "critique": "Too vague.",
+    "critique_of_contestant_2": "Too soft.",
+    "extra_critiques": "Too long.",
+    "collaboration_discussion": "We merged both drafts.",
+    "final_output": "Final output for the task.",
+    "edit": "Now polished.",
+}
+
+
+def fake_tournament_model(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+    """Answer any tournament agent with a canned, schema-valid response."""
+    if "FAIL" in last_user_prompt(messages):
+        raise RuntimeError("simulated model failure")
+    return simulated_response(messages, info, texts=FAKE_TEXTS)
+
+
+async def fake_tournament_stream(
+    messages: list[ModelMessage], info: AgentInfo
+) -> AsyncIterator[str | DeltaToolCalls]:
+    """Stream the same canned responses in small chunks."""
+    for chunk in simulated_chunks(fake_tournament_model(messages, info)):
+        yield chunk
+
+
+@pytest.fixture
+def fake_model() -> FunctionModel:
+    """A local model that can play every tournament role."""
+    return FunctionModel(
+        fake_tournament_model,
+        stream_function=fake_tournament_stream,
+        model_name="fake",
+    )
@@ -1,11 +1,15 @@
 """Unit tests for agent factories."""
 
 import pytest
+from pydantic_ai.models.test import TestModel
 
+from adversarial_tournament import AdversarialTournament
 from adversarial_tournament.agents import (
+    AgentRegistry,
     create_persona_generator,
     create_contestant_agent,
     create_judge_agent,
+    create_synthesizer_agent,
 )
 from adversarial_tournament.models.persona import Persona, PersonaSet
 from adversarial_tournament.models.tournament import RoundTwoCritique
@@ -79,3 +83,82 @@ class TestAgentFactories:
             model="openai:gpt-4o",
         )
         assert agent is not None
+
+    def test_create_synthesizer_agent(self, sample_contestant_persona):
+        """Test synthesis agent creation from the two contestant personas."""
+        partner = sample_contestant_persona.model_copy(
+            update={
+                "name": "The Storyteller",
+                "role": "Brand Copywriter",
+                "goal": "Make the message warm and human",
+            }
+        )
+        agent = create_synthesizer_agent(sample_contestant_persona, partner)
+        assert agent is not None
+
+
+class TestAgentRegistry:
+    """Tests for agent reuse across runs."""
+
+    @pytest.fixture
+    def persona(self) -> Persona:
+        """Create a sample persona for testing."""
+        return Persona(
+            name="The Engineer",
+            role="Senior Technical Writer",
+            goal="Ensure technical accuracy and completeness",
+            backstory="10 years of experience in technical documentation.",
+            persona_type="contestant",
+            key_traits=["analytical", "precise", "thorough"],
+            communication_style="Technical and detailed",
+        )
+
+    def test_reuses_agent_for_same_key(self, persona):
+        """Test that the factory only runs on the first request."""
+        registry = AgentRegistry()
+        build = lambda: create_contestant_agent(persona, "test")  # noqa: E731
+
+        first = registry.get("contestant", "test", (persona,), build)
+        second = registry.get("contestant", "test", (persona,), build)
+
+        assert first is second
+        assert (registry.hits, registry.misses) == (1, 1)
+
+    def test_key_includes_role_persona_and_model(self, persona):
+        """Test that changing any key component builds a new agent."""
+        registry = AgentRegistry()
+        other = persona.model_copy(update={"goal": "Something else"})
+        test_model = TestModel()
+
+        agents = {
+            id(registry.get(role, model, (p,), lambda: create_contestant_agent(p, model)))
+            for role, model, p in [
+                ("contestant", "test", persona),
+                ("judge", "test", persona),
+                ("contestant", "test", other),
+                ("contestant", test_model, persona),
+            ]
+        }
+
+        assert len(agents) == 4
+
+    def test_lru_eviction(self, persona):
+        """Test that the least recently used agent is evicted."""
+        registry = AgentRegistry(max_size=1)
+        build = lambda: create_contestant_agent(persona, "test")  # noqa: E731
+
+        first = registry.get("contestant", "test", (persona,), build)
+        registry.get("judge", "test", (persona,), build)
+
+        assert len(registry) == 1
+        assert registry.get("contestant", "test", (persona,), build) is not first
+
+    async def test_tournament_reuses_agents_across_runs(self, fake_model):
+        """Test that a repeated tournament builds no new agents."""
+        tournament = AdversarialTournament(model=fake_model)
+
+        await tournament.run("Write an email")
+        built = tournament.agent_registry.misses
+        await tournament.run("Write an email")
+
+        assert tournament.agent_registry.misses == built
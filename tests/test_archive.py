@@ -0,0 +1,159 @@
+"""Unit tests for the SQLite result archive."""
+
+import pytest
+
+from adversarial_tournament import AdversarialTournament
+from adversarial_tournament.archive import ResultArchive
+from adversarial_tournament.main import archive_main
+from adversarial_tournament.sinks import JsonlSink
+
+TASKS = [
+    "Write an apology email after a major outage",
+    "Draft a press release for a product launch",
+    "Write a postmortem of the database outage",
+]
+
+
+@pytest.fixture
+async def results(fake_model):
+    tournament = AdversarialTournament(model=fake_model)
+    return [await tournament.run(task) for task in TASKS]
+
+
+@pytest.fixture
+def archive(results):
+    archive = ResultArchive(":memory:")
+    archive.add_many(results)
+    yield archive
+    archive.close()
+
+
+class TestResultArchive:
+    """Tests for ResultArchive."""
+
+    def test_round_trip(self, archive, results):
+        """Test that archived results read back equal, by id."""
+        assert len(archive) == 3
+        assert archive.get(1) == results[0]
+        assert list(archive.export([3, 99, 2])) == [results[2], results[1]]
+        assert archive.get(99) is None
+
+    def test_personas_are_deduplicated(self, archive, results):
+        """Test that personas shared by every tournament are stored once."""
+        assert archive.persona_count() == 3
+
+        archive.add(results[0])
+
+        assert len(archive) == 4
+        assert archive.persona_count() == 3
+
+    def test_search_ranks_and_highlights(self, archive):
+        """Test full-text search over tasks with match snippets."""
+        entries = archive.search("outage")
+
+        assert {entry.task for entry in entries} == {TASKS[0], TASKS[2]}
+        assert all("[outage]" in entry.snippet for entry in entries)
+        assert [entry.task for entry in archive.search("outage database")] == [TASKS[2]]
+
+    def test_search_covers_output_and_key_issues(self, archive):
+        """Test that the final output and key issues are searchable too."""
+        assert len(archive.search('"final output"')) == 3
+        assert len(archive.search("responsibility", limit=2)) == 2
+
+    def test_invalid_query(self, archive):
+        """Test that malformed FTS5 syntax raises ValueError."""
+        with pytest.raises(ValueError, match="invalid search query"):
+            archive.search('"unbalanced')
+
+    def test_find(self, archive, results):
+        """Test lookups by exact task and persona, newest first."""
+        assert [e.id for e in archive.find(task=f"  {TASKS[1]} ")] == [2]
+        assert [e.id for e in archive.find(persona="the critic")] == [3, 2, 1]
+        assert [e.id for e in archive.find(persona="The Critic", limit=None)] == [3, 2, 1]
+        assert [e.id for e in archive.find(task=TASKS[2], persona="The Engineer")] == [3]
+        assert archive.find(task=TASKS[2], persona="Nobody") == []
+        assert archive.find(persona="Nobody") == []
+        assert [e.id for e in archive.find(limit=2)] == [3, 2]
+        assert archive.find(task=TASKS[0])[0].model == "function:fake"
+
+    async def test_records_tournament_model(self, fake_model):
+        """Test that the tournament's model is recorded, not the persona generator's."""
+        tournament = AdversarialTournament(
+            model=fake_model, role_models={"persona_generator": "test"}
+        )
+        result = await tournament.run(TASKS[0])
+        with ResultArchive(":memory:") as archive:
+            archive.add(result)
+
+            assert result.metrics.calls[0].model == "test:test"
+            assert archive.find(task=TASKS[0])[0].model == result.metrics.model
+
+    def test_find_merges_persona_variants(self, archive, results):
+        """Test that differing personas sharing a name are all found."""
+        personas = results[0].personas
+        judge = personas.judge.model_copy(update={"backstory": "A different past."})
+        archive.add(
+            results[0].model_copy(update={"personas": personas.model_copy(update={"judge": judge})})
+        )
+
+        assert archive.persona_count() == 4
+        assert [e.id for e in archive.find(persona="The Critic", limit=3)] == [4, 3, 2]
+
+    def test_slowest(self, archive, results):
+        """Test that phase timings rank tournaments slowest first."""
+        durations = {
+            i: next(p.duration_s for p in r.metrics.phases if p.phase == "round_one")
+            for i, r in enumerate(results, start=1)
+        }
+
+        entries = archive.slowest("round_one")
+
+        assert [e.id for e in entries] == sorted(durations, key=durations.get, reverse=True)
+        assert archive.slowest("no_such_phase") == []
+
+    def test_persists_across_connections(self, results, tmp_path):
+        """Test that an archive file reopens with its contents and indexes."""
+        path = tmp_path / "archive.db"
+        with ResultArchive(path) as archive:
+            archive.add(results[0])
+
+        with ResultArchive(path) as archive:
+            assert archive.get(1) == results[0]
+            assert len(archive.search("apology")) == 1
+
+
+class TestArchiveCommand:
+    """Tests for the archive CLI command."""
+
+    def test_import_search_export(self, results, tmp_path, capsys):
+        """Test importing JSONL output, searching it and exporting a match."""
+        db = tmp_path / "archive.db"
+        source = tmp_path / "results.jsonl"
+        with JsonlSink(source) as sink:
+            for result in results:
+                sink.write(result)
+
+        assert archive_main([str(db), "import", str(source)]) == 0
+        assert archive_main([str(db), "search", "press"]) == 0
+        assert "#2" in capsys.readouterr().out
+
+        exported = tmp_path / "export.jsonl"
+        assert archive_main([str(db), "export", str(exported), "--query", "outage"]) == 0
+        assert {r.task for r in JsonlSink.read(exported)} == {TASKS[0], TASKS[2]}
+
+    def test_export_ignores_rank_window(self, results, tmp_path, monkeypatch):
+        """Test that exporting a query returns every match, not just the ranked window."""
+        monkeypatch.setattr(ResultArchive, "RANK_WINDOW", 2)
+        db = tmp_path / "archive.db"
+        with ResultArchive(db) as archive:
+            archive.add_many(results * 3)
+            assert len(archive.search("outage")) == 2
+
+        exported = tmp_path / "export.jsonl"
+        assert archive_main([str(db), "export", str(exported), "--query", "outage"]) == 0
+        assert len(list(JsonlSink.read(exported))) == 6
+
+    def test_show_missing(self, tmp_path, capsys):
+        """Test that showing an unknown id fails cleanly."""
+        assert archive_main([str(tmp_path / "archive.db"), "show", "7"]) == 1
+        assert "no archived result #7" in capsys.readouterr().err
@@ -0,0 +1,295 @@
+"""Unit tests for the on-disk caches."""
+
+import pytest
+from pydantic_ai.models.function import FunctionModel
+
+from adversarial_tournament import AdversarialTournament
+from adversarial_tournament.cache import PersonaCache, PersonaIndex, ResponseCache
+from adversarial_tournament.events import TextDelta, TournamentCompleted
+from adversarial_tournament.exceptions import ResponseCacheMiss
+from adversarial_tournament.models.persona import PersonaSet
+from adversarial_tournament.testing import simulated_output_args
+from tests.conftest import fake_tournament_model, fake_tournament_stream
+
+
+@pytest.fixture
+def persona_set() -> PersonaSet:
+    """A valid persona set for cache round-trips."""
+    return PersonaSet.model_validate(simulated_output_args({"contestant_1": {}}, "Task"))
+
+
+class TestPersonaCache:
+    """Tests for the SQLite persona cache."""
+
+    def test_round_trip(self, tmp_path, persona_set):
+        """Test that stored personas survive reopening the cache."""
+        path = tmp_path / "personas.sqlite"
+        PersonaCache(path).put("Write an email", "openai:gpt-4o-mini", persona_set)
+
+        cache = PersonaCache(path)
+        assert cache.get("Write an email", "openai:gpt-4o-mini") == persona_set
+        assert cache.hits == 1
+
+    def test_key_normalizes_whitespace(self, persona_set):
+        """Test that reformatted task text still hits."""
+        cache = PersonaCache(":memory:")
+        cache.put("Write  an\nemail ", "openai:gpt-4o-mini", persona_set)
+
+        assert cache.get("Write an email", "openai:gpt-4o-mini") == persona_set
+
+    def test_key_includes_model_and_instructions(self, persona_set):
+        """Test that a different model or generator prompt misses."""
+        cache = PersonaCache(":memory:")
+        cache.put("Write an email", "openai:gpt-4o-mini", persona_set)
+
+        assert cache.get("Write an email", "openai:gpt-4o") is None
+        assert cache.get("Write an email", "openai:gpt-4o-mini", "Other prompt") is None
+        assert cache.misses == 2
+
+    def test_lru_eviction(self, persona_set):
+        """Test that the least recently used entry is evicted first."""
+        cache = PersonaCache(":memory:", max_entries=2)
+        cache.put("a", "m", persona_set)
+        cache.put("b", "m", persona_set)
+        cache.get("a", "m")
+        cache.put("c", "m", persona_set)
+
+        assert len(cache) == 2
+        assert cache.get("b", "m") is None
+        assert cache.get("a", "m") is not None
+
+    def test_ttl_expiry(self, persona_set):
+        """Test that expired entries are misses and get removed."""
+        cache = PersonaCache(":memory:", ttl=-1)
+        cache.put("a", "m", persona_set)
+
+        assert cache.get("a", "m") is None
+        assert len(cache) == 0
+
+    async def test_tournament_skips_generator_on_hit(self):
+        """Test that a cached task does not call the persona generator again."""
+        generator_calls = 0
+
+        def counting_model(messages, info):
+            nonlocal generator_calls
+            if info.output_tools and "contestant_1" in info.output_tools[0].parameters_json_schema["properties"]:
+                generator_calls += 1
+            return fake_tournament_model(messages, info)
+
+        tournament = AdversarialTournament(
+            model=FunctionModel(counting_model, model_name="counting"),
+            persona_cache=PersonaCache(":memory:"),
+        )
+
+        first = await tournament.run("Write an email")
+        second = await tournament.run("Write an email")
+
+        assert generator_calls == 1
+        assert second.personas == first.personas
+
+
+APOLOGY = (
+    "Write an apology email to the customers of {} after yesterday's outage of our "
+    "payment service, explaining the root cause and the compensation we offer"
+)
+
+
+class TestPersonaIndex:
+    """Tests for the near-duplicate persona index."""
+
+    def test_near_duplicate_hits(self, persona_set):
+        """Test that a templated task with another company name reuses the personas."""
+        index = PersonaIndex(":memory:")
+        index.put(APOLOGY.format("Acme Corp"), "m", persona_set)
+
+        reused = index.get(APOLOGY.format("Globex"), "m")
+
+        assert reused is not None
+        assert reused.task_context == APOLOGY.format("Globex")
+        assert reused.judges == persona_set.judges
+        assert index.get("Draft a launch plan for a gardening app", "m") is None
+        stats = index.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+        assert stats.p95_lookup_ms > 0
+
+    def test_short_template_hits(self, persona_set):
+        """Test that a one-word company swap in a short task still reuses the personas."""
+        index = PersonaIndex(":memory:")
+        index.put("Write an apology email to the customers of Acme", "m", persona_set)
+
+        assert index.get("Write an apology email to the customers of Globex", "m") is not None
+        assert index.get("Write a launch plan for the customers of Globex", "m") is None
+
+    def test_repeated_task_replaces_entry(self, persona_set):
+        """Test that storing the same task again updates its entry instead of adding one."""
+        index = PersonaIndex(":memory:", max_entries=2)
+        updated = persona_set.model_copy(update={"reasoning": "Updated reasoning"})
+        index.put("Draft a launch plan for a gardening app", "m", persona_set)
+        index.put_many(
+            [(APOLOGY.format("Acme"), persona_set), (APOLOGY.format("Acme"), persona_set)], "m"
+        )
+        index.put("Draft a launch plan  for a gardening app", "m", updated)
+
+        assert len(index) == 2
+        reused = index.get("Draft a launch plan for a gardening app", "m")
+        assert reused is not None and reused.reasoning == "Updated reasoning"
+        assert index.get(APOLOGY.format("Acme"), "m") is not None
+
+    def test_scoped_to_model_and_instructions(self, persona_set):
+        """Test that a different model or generator prompt misses."""
+        index = PersonaIndex(":memory:")
+        index.put(APOLOGY.format("Acme"), "m", persona_set)
+
+        assert index.get(APOLOGY.format("Acme"), "other") is None
+        assert index.get(APOLOGY.format("Acme"), "m", "Other prompt") is None
+
+    def test_threshold(self, persona_set):
+        """Test that a stricter threshold turns a near-duplicate into a miss."""
+        index = PersonaIndex(":memory:", threshold=1.0)
+        index.put(APOLOGY.format("Acme Corp"), "m", persona_set)
+
+        assert index.get(APOLOGY.format("Globex"), "m") is None
+        assert index.get(APOLOGY.format("Acme  Corp"), "m") is not None
+
+    def test_evicts_oldest(self, persona_set):
+        """Test that the oldest tasks are dropped once max_entries is exceeded."""
+        index = PersonaIndex(":memory:", max_entries=2)
+        index.put_many([(APOLOGY.format(name), persona_set) for name in ("A", "B")], "m")
+        index.put("Draft a launch plan for a gardening app", "m", persona_set)
+
+        assert len(index) == 2
+        assert index.get("Draft a launch plan for a gardening app", "m") is not None
+
+    def test_reopen_checks_settings(self, tmp_path, persona_set):
+        """Test that an index file keeps its entries and refuses other MinHash settings."""
+        path = tmp_path / "index.sqlite"
+        index = PersonaIndex(path)
+        index.put(APOLOGY.format("Acme"), "m", persona_set)
+        index.close()
+
+        assert PersonaIndex(path).get(APOLOGY.format("Initech"), "m") is not None
+        with pytest.raises(ValueError, match="num_perm:bands:seed:shingles"):
+            PersonaIndex(path, bands=8)
+
+    async def test_tournament_skips_generator_on_similar_task(self):
+        """Test that Phase 0 is skipped for a near-duplicate task."""
+        generator_calls = 0
+
+        def counting_model(messages, info):
+            nonlocal generator_calls
+            if info.output_tools and "contestant_1" in info.output_tools[0].parameters_json_schema["properties"]:
+                generator_calls += 1
+            return fake_tournament_model(messages, info)
+
+        tournament = AdversarialTournament(
+            model=FunctionModel(counting_model, model_name="counting"),
+            persona_index=PersonaIndex(":memory:"),
+        )
+
+        await tournament.run(APOLOGY.format("Acme Corp"))
+        second = await tournament.run(APOLOGY.format("Globex"))
+
+        assert generator_calls == 1
+        assert second.personas.task_context == APOLOGY.format("Globex")
+        assert [c.phase for c in second.metrics.calls].count("phase_zero") == 0
+
+
+@pytest.fixture
+def counting_model():
+    """A fake tournament model that counts the requests it answers."""
+    calls = {"count": 0}
+
+    def respond(messages, info):
+        calls["count"] += 1
+        return fake_tournament_model(messages, info)
+
+    async def respond_stream(messages, info):
+        calls["count"] += 1
+        async for chunk in fake_tournament_stream(messages, info):
+            yield chunk
+
+    model = FunctionModel(respond, stream_function=respond_stream, model_name="counting")
+    return model, calls
+
+
+class TestResponseCache:
+    """Tests for the record/replay response cache."""
+
+    @pytest.mark.parametrize("filename", ["responses", "responses.sqlite"])
+    async def test_read_through_replays_identical_tournament(
+        self, tmp_path, counting_model, filename
+    ):
+        """Test that a second run is served from the cache, in both storage formats."""
+        model, calls = counting_model
+        path = tmp_path / filename
+
+        first = await AdversarialTournament(
+            model=model, response_cache=ResponseCache(path)
+        ).run("Write an email")
+        assert calls["count"] == 5
+
+        cache = ResponseCache(path, mode="replay")
+        second = await AdversarialTournament(model=model, response_cache=cache).run(
+            "Write an email"
+        )
+
+        assert calls["count"] == 5
+        assert cache.hits == 5
+        assert second.model_dump(exclude={"metrics"}) == first.model_dump(exclude={"metrics"})
+
+    async def test_replay_miss_raises(self, counting_model):
+        """Test that replay mode never calls the model."""
+        model, calls = counting_model
+        tournament = AdversarialTournament(
+            model=model, response_cache=ResponseCache(":memory:", mode="replay")
+        )
+
+        with pytest.raises(ResponseCacheMiss):
+            await tournament.run("Write an email")
+        assert calls["count"] == 0
+
+    async def test_record_always_calls_model(self, counting_model):
+        """Test that record mode refreshes entries instead of reading them."""
+        model, calls = counting_model
+        cache = ResponseCache(":memory:", mode="record")
+        tournament = AdversarialTournament(model=model, response_cache=cache)
+
+        await tournament.run("Write an email")
+        await tournament.run("Write an email")
+
+        assert calls["count"] == 10
+        assert len(cache) == 5
+
+    async def test_key_includes_prompt_and_model(self, counting_model):
+        """Test that a different task or model misses."""
+        model, calls = counting_model
+        cache = ResponseCache(":memory:")
+
+        await AdversarialTournament(model=model, response_cache=cache).run("Task A")
+        await AdversarialTournament(model=model, response_cache=cache).run("Task B")
+        other = FunctionModel(fake_tournament_model, model_name="other")
+        await AdversarialTournament(model=other, response_cache=cache).run("Task A")
+
+        assert calls["count"] == 10
+        assert len(cache) == 15
+
+    async def test_stream_replays_recorded_run(self, counting_model):
+        """Test that streamed runs can be recorded and replayed."""
+        model, calls = counting_model
+        cache = ResponseCache(":memory:")
+        tournament = AdversarialTournament(model=model, response_cache=cache)
+
+        recorded = [event async for event in tournament.stream("Write an email")]
+        replayed = [event async for event in tournament.stream("Write an email")]
+
+        assert calls["count"] == 5
+        assert cache.hits == 5
+        assert isinstance(replayed[-1], TournamentCompleted)
+        assert replayed[-1].result.round_three == recorded[-1].result.round_three
+        assert any(isinstance(event, TextDelta) for event in replayed)
+
+    def test_rejects_unknown_mode(self, tmp_path):
+        """Test that a misspelled mode fails fast."""
+        with pytest.raises(ValueError):
+            ResponseCache(tmp_path / "responses", mode="replay-only")
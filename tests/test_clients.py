@@ -0,0 +1,78 @@
+"""Tests for the shared pooled HTTP client behind model calls."""
+
+import asyncio
+import importlib.util
+
+import pytest
+
+from adversarial_tournament import AdversarialTournament
+from adversarial_tournament.clients import HttpConfig, ModelClients
+from adversarial_tournament.testing import FakeOpenAIServer
+
+
+@pytest.fixture
+async def server(monkeypatch):
+    async with FakeOpenAIServer(words=10) as server:
+        monkeypatch.setenv("OPENAI_BASE_URL", server.base_url)
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-fake")
+        yield server
+
+
+class TestHttpConfig:
+    """Tests for HttpConfig."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_connections": 0},
+            {"max_keepalive_connections": -1},
+            {"pool_shards": 0},
+            {"max_connections": 2, "pool_shards": 3},
+        ],
+    )
+    def test_rejects_invalid_limits(self, kwargs):
+        """Test that impossible pool limits raise ValueError."""
+        with pytest.raises(ValueError):
+            HttpConfig(**kwargs)
+
+    @pytest.mark.skipif(importlib.util.find_spec("h2") is not None, reason="h2 is installed")
+    def test_http2_needs_h2(self):
+        """Test that HTTP/2 without the h2 package fails with an install hint."""
+        with pytest.raises(ImportError, match="h2"):
+            HttpConfig(http2=True).build_client()
+
+
+class TestModelClients:
+    """Tests for ModelClients."""
+
+    async def test_models_share_one_client(self, server):
+        """Test that model names resolve once, onto the one HTTP client."""
+        clients = ModelClients()
+
+        model = clients.model("openai:gpt-4o-mini")
+
+        assert clients.model("openai:gpt-4o-mini") is model
+        assert clients.model("openai:gpt-4o") is not model
+        assert model.client._client is clients.client
+        assert clients.model(model) is model
+        await clients.aclose()
+
+    def test_shared_is_process_wide(self):
+        """Test that tournaments default to the process-wide clients."""
+        assert ModelClients.shared() is ModelClients.shared()
+        assert AdversarialTournament().clients is ModelClients.shared()
+
+    async def test_tournaments_reuse_connections(self, server):
+        """Test that concurrent tournaments reuse kept-alive connections."""
+        clients = ModelClients(HttpConfig(max_connections=8, pool_shards=2))
+        tournament = AdversarialTournament(model="openai:gpt-4o-mini", clients=clients)
+
+        for batch in range(3):
+            results = await asyncio.gather(
+                *(tournament.run(f"Task {batch}.{i}") for i in range(4))
+            )
+
+        assert results[0].round_three.final_output
+        assert server.requests == 3 * 4 * 5
+        assert server.connections <= 8
+        await clients.aclose()
@@ -0,0 +1,174 @@
+"""Unit tests for the command line interface."""
+
+import argparse
+import subprocess
+import sys
+
+import pytest
+
+import adversarial_tournament
+
+from adversarial_tournament.main import (
+    _add_tournament_arguments,
+    _build_tournament,
+    main,
+    parse_role_timeout,
+    read_tasks_file,
+)
+
+
+class TestReadTasksFile:
+    """Tests for --tasks-file parsing."""
+
+    def test_plain_lines(self, tmp_path):
+        """Test that each non-blank line is a task."""
+        path = tmp_path / "tasks.txt"
+        path.write_text("Write an email\n\n  Write a press release  \n")
+
+        assert read_tasks_file(path) == ["Write an email", "Write a press release"]
+
+    def test_jsonl_lines(self, tmp_path):
+        """Test that JSON objects contribute their 'task' key."""
+        path = tmp_path / "tasks.jsonl"
+        path.write_text('{"task": "Write an email", "id": 1}\nPlain task\n')
+
+        assert read_tasks_file(path) == ["Write an email", "Plain task"]
+
+    def test_jsonl_without_task_key(self, tmp_path):
+        """Test that a JSON line without a task is reported with its line number."""
+        path = tmp_path / "tasks.jsonl"
+        path.write_text('{"prompt": "Write an email"}\n')
+
+        with pytest.raises(ValueError, match="tasks.jsonl:1"):
+            read_tasks_file(path)
+
+
+class TestParseRoleTimeout:
+    """Tests for --role-timeout parsing."""
+
+    def test_role_and_seconds(self):
+        """Test that ROLE=SECONDS is split into a role and a float."""
+        assert parse_role_timeout("synthesizer=120") == ("synthesizer", 120.0)
+
+    @pytest.mark.parametrize("value", ["synthesizer", "=5", "judge=soon", "judge=0"])
+    def test_rejects_malformed(self, value):
+        """Test that values without a role or a positive timeout are rejected."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_role_timeout(value)
+
+
+class TestArguments:
+    """Tests for combinations of command line options."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [["--stream", "--quiet", "task"], ["--stream", "--tasks-file", "tasks.txt"]],
+    )
+    def test_rejects_conflicting_options(self, monkeypatch, capsys, argv):
+        """Test that --stream is refused with options it contradicts."""
+        monkeypatch.setattr(sys, "argv", ["adversarial-tournament", *argv])
+
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+
+        assert excinfo.value.code == 2
+        assert "--stream cannot be combined with" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("task", ["archive", "serve"])
+    def test_task_named_like_a_command(self, monkeypatch, task):
+        """Test that a task after "--" runs a tournament instead of the command."""
+        tasks = []
+
+        def build_tournament(args):
+            tasks.append(args.task)
+            raise SystemExit(0)
+
+        monkeypatch.setattr("adversarial_tournament.main._build_tournament", build_tournament)
+        monkeypatch.setattr(sys, "argv", ["adversarial-tournament", "--", task])
+
+        with pytest.raises(SystemExit):
+            main()
+
+        assert tasks == [task]
+
+
+class TestModelRouting:
+    """Tests for the per-role model options."""
+
+    def test_preset_with_override(self, monkeypatch):
+        """Test that --model-<role> overrides the roles of --model-preset."""
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        parser = argparse.ArgumentParser()
+        _add_tournament_arguments(parser)
+
+        args = parser.parse_args(
+            [
+                "--model-preset",
+                "fast-review",
+                "--model-judge",
+                "openai:gpt-4o",
+                "--model-synthesizer",
+                "openai:o3",
+            ]
+        )
+        tournament = _build_tournament(args)
+
+        assert tournament.role_models == {
+            "persona_generator": "openai:gpt-4.1-nano",
+            "judge": "openai:gpt-4o",
+            "synthesizer": "openai:o3",
+        }
+
+
+# Modules the CLI must not load before a tournament actually runs
+HEAVY_MODULES = ("pydantic", "pydantic_ai", "httpx", "ujson", "dotenv")
+
+# Cumulative import time allowed for the CLI module, in microseconds
+IMPORT_BUDGET_US = 100_000
+
+
+def _python(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+class TestStartup:
+    """Tests that the package and CLI import lazily."""
+
+    @pytest.mark.parametrize("argv", [[], ["--help"], ["--concurrency", "0", "task"]])
+    def test_cli_defers_heavy_imports(self, argv):
+        """Test that importing the CLI, --help and argument errors skip pydantic-ai."""
+        code = f"""
+import sys
+import adversarial_tournament.main as cli
+sys.argv = ["adversarial-tournament", *{argv!r}]
+if sys.argv[1:]:
+    try:
+        cli.main()
+    except SystemExit:
+        pass
+loaded = {{name.split(".")[0] for name in sys.modules}}
+print("loaded:", *sorted(loaded & set({HEAVY_MODULES!r})))
+"""
+        result = _python(code)
+
+        assert result.stdout.splitlines()[-1] == "loaded:"
+
+    def test_import_time_budget(self):
+        """Test that the CLI module imports within its -X importtime budget."""
+        result = _python("import adversarial_tournament.main", "-X", "importtime")
+
+        cumulative = {
+            line.split("|")[2].strip(): int(line.split("|")[1])
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:") and line.count("|") == 2 and "cumulative" not in line
+        }
+        assert cumulative["adversarial_tournament.main"] < IMPORT_BUDGET_US
+
+    def test_lazy_package_attributes(self):
+        """Test that public names resolve on first access and unknown ones fail."""
+        assert adversarial_tournament.AdversarialTournament.__name__ == "AdversarialTournament"
+        assert "ResiliencePolicy" in dir(adversarial_tournament)
+        with pytest.raises(AttributeError):
+            adversarial_tournament.NoSuchThing
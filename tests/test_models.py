@@ -2,9 +2,11 @@
 
 import pytest
 
+from adversarial_tournament.models.checkpoint import TournamentCheckpoint
 from adversarial_tournament.models.persona import Persona, PersonaSet
 from adversarial_tournament.models.tournament import (
     RoundOneOutput,
+    DraftCritique,
     RoundTwoCritique,
     RoundThreeOutput,
     TournamentResult,
@@ -107,6 +109,57 @@ class TestTournamentModels:
 
         assert len(critique.key_issues) == 2
 
+    def test_round_two_critique_merge(self):
+        """Test merging per-draft critiques de-duplicates key issues."""
+        critique = RoundTwoCritique.merge(
+            DraftCritique(critique="Critique 1", key_issues=["Be specific", "Apologize"]),
+            DraftCritique(critique="Critique 2", key_issues=["be  specific", "Add dates"]),
+        )
+
+        assert critique.critique_of_contestant_1 == "Critique 1"
+        assert critique.critique_of_contestant_2 == "Critique 2"
+        assert critique.key_issues == ["Be specific", "Apologize", "Add dates"]
+
+    def test_round_two_critique_merge_many_drafts(self):
+        """Test that merging keeps one critique per draft, in order."""
+        critique = RoundTwoCritique.merge(
+            *(DraftCritique(critique=f"Critique {n}", key_issues=[]) for n in range(1, 5))
+        )
+
+        assert critique.critiques == ["Critique 1", "Critique 2", "Critique 3", "Critique 4"]
+        assert critique.extra_critiques == ["Critique 3", "Critique 4"]
+
+    def test_round_two_critique_combine_judges(self):
+        """Test that several judges' critiques are attributed and their issues pooled."""
+        critique = RoundTwoCritique.combine(
+            [
+                RoundTwoCritique.from_critiques(["A1", "A2"], ["Be specific"]),
+                RoundTwoCritique.from_critiques(["B1", "B2"], ["Be Specific", "Add dates"]),
+            ],
+            ["The Critic", "The Skeptic"],
+        )
+
+        assert critique.critique_of_contestant_1 == "**The Critic:** A1\n\n**The Skeptic:** B1"
+        assert critique.key_issues == ["Be specific", "Add dates"]
+
+    def test_round_two_critique_scores(self):
+        """Test that merged and combined critiques keep per-draft scores."""
+        merged = RoundTwoCritique.merge(
+            DraftCritique(critique="1", key_issues=[], score=4),
+            DraftCritique(critique="2", key_issues=[], score=8),
+        )
+        combined = RoundTwoCritique.combine(
+            [merged, RoundTwoCritique.from_critiques(["1", "2"], [], [6, 9])],
+            ["A", "B"],
+        )
+
+        assert merged.best_draft() == (2, 8)
+        assert combined.scores == [5, 8.5]
+        assert RoundTwoCritique.merge(
+            DraftCritique(critique="1", key_issues=[], score=4),
+            DraftCritique(critique="2", key_issues=[]),
+        ).best_draft() is None
+
     def test_round_three_output(self):
         """Test Round 3 synthesis model."""
         output = RoundThreeOutput(
@@ -213,3 +266,92 @@ class TestTournamentModels:
         md_output = result.to_markdown()
         assert "# Adversarial Tournament Results" in md_output
         assert "## Task" in md_output
+
+    def test_metrics_optional(self):
+        """Test that metrics are omitted from markdown when absent."""
+        persona = Persona(
+            name="Test",
+            role="Test",
+            goal="Test",
+            backstory="Test",
+            persona_type="contestant",
+            key_traits=["a", "b", "c"],
+            communication_style="Test",
+        )
+
+        result = TournamentResult(
+            task="Test task",
+            personas=PersonaSet(
+                contestant_1=persona,
+                contestant_2=persona,
+                judge=persona,
+                task_context="Test",
+                reasoning="Test",
+            ),
+            round_one=RoundOneOutput(contestant_1_draft="1", contestant_2_draft="2"),
+            round_two=RoundTwoCritique(
+                critique_of_contestant_1="1",
+                critique_of_contestant_2="2",
+                key_issues=[],
+            ),
+            round_three=RoundThreeOutput(collaboration_discussion="D", final_output="F"),
+        )
+
+        assert result.metrics is None
+        assert "## Metrics" not in result.to_markdown()
+
+    def test_markdown_lists_every_contestant_and_judge(self):
+        """Test that extra contestants, drafts and judges are rendered."""
+
+        def persona(name: str, persona_type: str) -> Persona:
+            return Persona(
+                name=name,
+                role="Role",
+                goal="Goal",
+                backstory="Backstory",
+                persona_type=persona_type,
+                key_traits=["a", "b", "c"],
+                communication_style="Style",
+            )
+
+        result = TournamentResult(
+            task="Test task",
+            personas=PersonaSet(
+                contestant_1=persona("One", "contestant"),
+                contestant_2=persona("Two", "contestant"),
+                extra_contestants=[persona("Three", "contestant")],
+                judge=persona("Critic", "judge"),
+                extra_judges=[persona("Skeptic", "judge")],
+                task_context="Test",
+                reasoning="Test",
+            ),
+            round_one=RoundOneOutput.from_drafts(["D1", "D2", "D3"]),
+            round_two=RoundTwoCritique.from_critiques(["C1", "C2", "C3"], []),
+            round_three=RoundThreeOutput(collaboration_discussion="D", final_output="F"),
+        )
+
+        md_output = result.to_markdown()
+        assert "### Contestant 3: Three" in md_output
+        assert "### Judge 2: Skeptic" in md_output
+        assert "### Three's Draft\n\nD3" in md_output
+        assert "**Critique of Three:**\n\nC3" in md_output
+        assert "### Critique from Critic, Skeptic" in md_output
+
+
+class TestCheckpointModel:
+    """Tests for tournament checkpoints."""
+
+    def test_save_and_load(self, tmp_path):
+        """Test that a partial checkpoint round-trips through its JSON file."""
+        checkpoint = TournamentCheckpoint(
+            task="Write an email",
+            round_one=RoundOneOutput.from_drafts(["Draft 1", "Draft 2"]),
+        )
+        path = tmp_path / "nested" / "checkpoint.json"
+
+        checkpoint.save(path)
+        loaded = TournamentCheckpoint.load(path)
+
+        assert loaded == checkpoint
+        assert loaded.completed_phases == ["round_one"]
+        assert list(path.parent.iterdir()) == [path]
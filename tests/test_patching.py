@@ -0,0 +1,44 @@
+"""Unit tests for applying patch-based Round 3 edits."""
+
+import pytest
+
+from adversarial_tournament.exceptions import PatchError
+from adversarial_tournament.models.tournament import DraftEdit
+from adversarial_tournament.patching import apply_edits
+
+
+class TestApplyEdits:
+    """Tests for apply_edits."""
+
+    def test_applies_every_operation_in_order(self):
+        """Test replace, insert and delete, each against the previous result."""
+        base = "We are sorry. The outage lasted two hours. Thanks for waiting."
+        edits = [
+            DraftEdit(operation="replace", anchor="two hours", text="three hours"),
+            DraftEdit(operation="insert", anchor="three hours.", text=" It was our fault."),
+            DraftEdit(operation="delete", anchor=" Thanks for waiting."),
+        ]
+
+        result = apply_edits(base, edits)
+
+        assert result == "We are sorry. The outage lasted three hours. It was our fault."
+
+    def test_no_edits_keeps_draft(self):
+        """Test that an empty edit list returns the base draft unchanged."""
+        assert apply_edits("A complete draft.", []) == "A complete draft."
+
+    @pytest.mark.parametrize(
+        "anchor, problem",
+        [("missing", "not found"), ("the", "found 3 times"), ("", "empty anchor")],
+    )
+    def test_rejects_bad_anchor(self, anchor, problem):
+        """Test that missing, ambiguous and empty anchors fail loudly."""
+        edits = [
+            DraftEdit(operation="replace", anchor="the draft", text="this draft"),
+            DraftEdit(operation="delete", anchor=anchor),
+        ]
+
+        with pytest.raises(PatchError, match=problem) as excinfo:
+            apply_edits("Fix the draft before the deadline, then ship the fix.", edits)
+
+        assert excinfo.value.edit_index == 1
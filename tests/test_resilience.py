@@ -0,0 +1,112 @@
+"""Unit tests for the agent call resilience policy."""
+
+import random
+
+import httpx
+import pytest
+from pydantic_ai.exceptions import ModelAPIError, ModelHTTPError, UnexpectedModelBehavior
+
+from adversarial_tournament.resilience import (
+    LatencyTracker,
+    ResiliencePolicy,
+    is_transient,
+    role_kind,
+)
+
+
+class TestIsTransient:
+    """Tests for classifying errors as worth retrying."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ModelHTTPError(429, "gpt"),
+            ModelHTTPError(503, "gpt"),
+            ModelAPIError("gpt", "connection reset"),
+            TimeoutError(),
+            httpx.ConnectError("refused"),
+        ],
+    )
+    def test_transient(self, error):
+        """Test that rate limits, server and connection errors are retried."""
+        assert is_transient(error)
+
+    @pytest.mark.parametrize(
+        "error",
+        [ModelHTTPError(400, "gpt"), UnexpectedModelBehavior("bad output"), ValueError("bug")],
+    )
+    def test_permanent(self, error):
+        """Test that client errors and bugs are not retried."""
+        assert not is_transient(error)
+
+    def test_follows_cause(self):
+        """Test that a wrapped transient error is still recognized."""
+        try:
+            try:
+                raise httpx.ReadTimeout("slow")
+            except httpx.ReadTimeout as e:
+                raise RuntimeError("request failed") from e
+        except RuntimeError as error:
+            assert is_transient(error)
+
+
+class TestResiliencePolicy:
+    """Tests for timeouts and backoff."""
+
+    def test_timeout_for_role(self):
+        """Test that exact roles beat role kinds, which beat the default."""
+        policy = ResiliencePolicy(
+            timeout_s=30, role_timeouts={"contestant": 60, "contestant_2": 90}
+        )
+
+        assert role_kind("contestant_12") == "contestant"
+        assert policy.timeout_for("contestant_1") == 60
+        assert policy.timeout_for("contestant_2") == 90
+        assert policy.timeout_for("synthesizer") == 30
+
+    def test_patch_synthesizer_timeout(self):
+        """Test that a synthesizer timeout covers the patch synthesis unless it has its own."""
+        policy = ResiliencePolicy(role_timeouts={"synthesizer": 120})
+        assert policy.timeout_for("patch_synthesizer") == 120
+
+        policy = ResiliencePolicy(role_timeouts={"synthesizer": 120, "patch_synthesizer": 60})
+        assert policy.timeout_for("patch_synthesizer") == 60
+
+    def test_backoff_grows_and_is_capped(self):
+        """Test full-jitter backoff bounds."""
+        policy = ResiliencePolicy(backoff_base_s=1, backoff_max_s=5)
+        rng = random.Random(0)
+
+        assert all(0 <= policy.backoff(0, rng) <= 1 for _ in range(100))
+        assert all(0 <= policy.backoff(2, rng) <= 4 for _ in range(100))
+        assert all(0 <= policy.backoff(10, rng) <= 5 for _ in range(100))
+
+    @pytest.mark.parametrize(
+        "options",
+        [{"max_attempts": 0}, {"timeout_s": 0}, {"role_timeouts": {"judge": -1}}, {"hedge_quantile": 1}],
+    )
+    def test_rejects_invalid_options(self, options):
+        """Test that nonsensical policies fail fast."""
+        with pytest.raises(ValueError):
+            ResiliencePolicy(**options)
+
+
+class TestLatencyTracker:
+    """Tests for the hedging latency window."""
+
+    def test_quantile_per_role_kind(self):
+        """Test that durations are pooled per role kind."""
+        tracker = LatencyTracker()
+        for i in range(1, 101):
+            tracker.record(f"judge_{i % 3 + 1}", i / 100)
+
+        assert tracker.quantile("judge", 0.95) == pytest.approx(0.96)
+        assert tracker.quantile("contestant_1", 0.95) is None
+
+    def test_min_samples(self):
+        """Test that no quantile is reported before enough calls finished."""
+        tracker = LatencyTracker()
+        tracker.record("synthesizer", 1.0)
+
+        assert tracker.quantile("synthesizer", 0.5, min_samples=2) is None
+        assert tracker.quantile("synthesizer", 0.5, min_samples=1) == 1.0
@@ -0,0 +1,107 @@
+"""Unit tests for the rate-limit-aware request scheduler."""
+
+import asyncio
+import time
+
+import pytest
+
+from adversarial_tournament.scheduler import RateLimit, RateLimitScheduler, estimate_tokens
+
+# 10 requests per second, one at a time
+ONE_AT_A_TIME = RateLimit(requests_per_minute=600, burst_s=0.1)
+
+
+class TestRateLimitScheduler:
+    """Tests for RateLimitScheduler."""
+
+    async def test_unlimited_models_pass_through(self):
+        """Test that models without a limit are admitted immediately."""
+        scheduler = RateLimitScheduler(limits={"slow:model": ONE_AT_A_TIME})
+
+        start = time.perf_counter()
+        for _ in range(20):
+            async with scheduler.reserve("other:model", "prompt"):
+                pass
+
+        assert time.perf_counter() - start < 0.05
+
+    async def test_throttles_requests(self):
+        """Test that requests beyond the burst wait for the bucket to refill."""
+        scheduler = RateLimitScheduler(default=ONE_AT_A_TIME)
+
+        start = time.perf_counter()
+        for _ in range(4):
+            async with scheduler.reserve("fake:model", "prompt"):
+                pass
+
+        assert 0.25 < time.perf_counter() - start < 1.0
+
+    async def test_admits_by_priority(self):
+        """Test that queued requests with a lower priority key go first."""
+        scheduler = RateLimitScheduler(default=ONE_AT_A_TIME)
+        order = []
+
+        async def request(name: str, priority: tuple[float, ...]) -> None:
+            async with scheduler.reserve("fake:model", "prompt", priority):
+                order.append(name)
+
+        async with scheduler.reserve("fake:model", "prompt"):
+            pass
+        tasks = [
+            asyncio.create_task(request("phase_zero", (3, 2.0))),
+            asyncio.create_task(request("round_three_new", (0, 2.0))),
+            asyncio.create_task(request("round_three_old", (0, 1.0))),
+        ]
+        await asyncio.gather(*tasks)
+
+        assert order == ["round_three_old", "round_three_new", "phase_zero"]
+
+    async def test_token_budget_corrected_by_usage(self):
+        """Test that overestimated reservations hand their unused tokens back."""
+        scheduler = RateLimitScheduler(
+            default=RateLimit(tokens_per_minute=6000, burst_s=1), expected_output_tokens=40
+        )
+
+        start = time.perf_counter()
+        for _ in range(5):
+            async with scheduler.reserve("fake:model", "x" * 40) as reservation:
+                assert reservation.tokens == estimate_tokens("x" * 40) + 40
+                reservation.used(10)
+
+        assert time.perf_counter() - start < 0.1
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Test that a cancelled request frees its place for the next one."""
+        scheduler = RateLimitScheduler(default=ONE_AT_A_TIME)
+
+        async def request() -> None:
+            async with scheduler.reserve("fake:model", "prompt"):
+                pass
+
+        async with scheduler.reserve("fake:model", "prompt"):
+            pass
+        cancelled = asyncio.create_task(request())
+        await asyncio.sleep(0)
+        assert scheduler.waiting("fake:model") == 1
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        await asyncio.wait_for(request(), timeout=1)
+        assert scheduler.waiting("fake:model") == 0
+
+    async def test_pause(self):
+        """Test that a paused model admits nothing until the pause ends."""
+        scheduler = RateLimitScheduler()
+        scheduler.pause("fake:model", 0.2)
+
+        start = time.perf_counter()
+        async with scheduler.reserve("fake:model", "prompt"):
+            pass
+
+        assert time.perf_counter() - start >= 0.19
+
+    def test_rejects_invalid_limits(self):
+        """Test that rate limits must be positive."""
+        with pytest.raises(ValueError):
+            RateLimit(requests_per_minute=0)
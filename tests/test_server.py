@@ -0,0 +1,142 @@
+"""Tests for the tournament HTTP service, run against a local stand-in model."""
+
+import asyncio
+
+import httpx
+import pytest
+import ujson
+
+from adversarial_tournament import AdversarialTournament, TournamentResult
+from adversarial_tournament.server import TournamentService
+from adversarial_tournament.testing import LatencyProfile, create_simulated_model
+
+
+@pytest.fixture
+async def service(fake_model):
+    service = TournamentService(AdversarialTournament(model=fake_model), max_concurrency=2)
+    server = await service.serve(port=0)
+    yield service, server
+    server.close()
+    await service.close()
+
+
+@pytest.fixture
+async def client(service):
+    _, server = service
+    host, port = server.sockets[0].getsockname()[:2]
+    async with httpx.AsyncClient(base_url=f"http://{host}:{port}") as client:
+        yield client
+
+
+async def _events(client: httpx.AsyncClient, job_id: str) -> list[tuple[str, dict]]:
+    """Read a job's Server-Sent Events until the stream closes."""
+    events, name = [], None
+    async with client.stream("GET", f"/tournaments/{job_id}/events") as response:
+        assert response.headers["content-type"] == "text/event-stream"
+        async for line in response.aiter_lines():
+            if line.startswith("event: "):
+                name = line.removeprefix("event: ")
+            elif line.startswith("data: "):
+                events.append((name, ujson.loads(line.removeprefix("data: "))))
+    return events
+
+
+class TestTournamentService:
+    """Tests for TournamentService."""
+
+    async def test_submit_and_follow(self, client):
+        """Test that a job streams every phase and then its result."""
+        response = await client.post("/tournaments", json={"task": "Write an email"})
+        assert response.status_code == 202
+        job = response.json()
+        assert job["state"] in ("queued", "running")
+
+        events = await _events(client, job["id"])
+
+        names = [name for name, _ in events]
+        assert names[0] == "running"
+        assert names[-1] == "completed"
+        phases = [data["phase"] for name, data in events if name == "phase_completed"]
+        assert phases == ["phase_zero", "round_one", "round_two", "round_three"]
+        assert TournamentResult.model_validate(events[-1][1]).task == "Write an email"
+
+        status = (await client.get(f"/tournaments/{job['id']}")).json()
+        assert status["state"] == "completed"
+        assert status["completed_phases"] == phases
+        assert status["result"]["round_three"]["final_output"] == "Final output for the task."
+
+    async def test_late_subscriber_replays_events(self, client, service):
+        """Test that subscribing after a job finished still replays its progress."""
+        job_id = (await client.post("/tournaments", json={"task": "Write an email"})).json()["id"]
+        await service[0].jobs[job_id]._runner
+
+        names = [name for name, _ in await _events(client, job_id)]
+
+        assert names.count("phase_started") == 4
+        assert names[-1] == "completed"
+
+    async def test_failed_job(self, client):
+        """Test that a failing tournament ends its stream with a failed event."""
+        job_id = (await client.post("/tournaments", json={"task": "FAIL this"})).json()["id"]
+
+        name, data = (await _events(client, job_id))[-1]
+
+        assert name == "failed"
+        assert "simulated model failure" in data["error"]
+        assert (await client.get(f"/tournaments/{job_id}")).json()["state"] == "failed"
+
+    async def test_jobs_share_warm_agents(self, client, service):
+        """Test that concurrent jobs reuse the agents built by the first one."""
+        first = (await client.post("/tournaments", json={"task": "Task 1"})).json()["id"]
+        await _events(client, first)
+        registry = service[0].tournament.agent_registry
+        built = len(registry)
+
+        ids = [
+            (await client.post("/tournaments", json={"task": f"Task {i}"})).json()["id"]
+            for i in range(2, 6)
+        ]
+        await asyncio.gather(*(_events(client, job_id) for job_id in ids))
+
+        assert len(registry) == built
+        health = (await client.get("/health")).json()
+        assert health == {"status": "ok", "running": 0, "queued": 0}
+
+    @pytest.mark.parametrize(
+        ("method", "path", "body", "status"),
+        [
+            ("POST", "/tournaments", b"not json", 400),
+            ("POST", "/tournaments", b'{"task": ""}', 400),
+            ("GET", "/tournaments", b"", 405),
+            ("GET", "/tournaments/unknown", b"", 404),
+            ("GET", "/nowhere", b"", 404),
+        ],
+    )
+    async def test_bad_requests(self, client, method, path, body, status):
+        """Test that malformed requests get a JSON error and the right status."""
+        response = await client.request(method, path, content=body)
+
+        assert response.status_code == status
+        assert "error" in response.json()
+
+    async def test_cancel(self):
+        """Test that a running job can be cancelled."""
+        slow = create_simulated_model(latency=LatencyProfile(first_token_s=5.0, sigma=0.0))
+        service = TournamentService(AdversarialTournament(model=slow))
+        server = await service.serve(port=0)
+        host, port = server.sockets[0].getsockname()[:2]
+        try:
+            async with httpx.AsyncClient(base_url=f"http://{host}:{port}") as client:
+                job_id = (await client.post("/tournaments", json={"task": "Slow"})).json()["id"]
+                await asyncio.sleep(0.05)
+
+                response = await client.delete(f"/tournaments/{job_id}")
+                assert response.status_code == 202
+                name, _ = (await _events(client, job_id))[-1]
+                assert name == "cancelled"
+
+                again = await client.delete(f"/tournaments/{job_id}")
+                assert again.status_code == 409
+        finally:
+            server.close()
+            await service.close()
@@ -0,0 +1,60 @@
+"""Unit tests for the JSONL result sink."""
+
+import gzip
+
+import pytest
+
+from adversarial_tournament import AdversarialTournament
+from adversarial_tournament.sinks import JsonlSink
+
+
+@pytest.fixture
+async def results(fake_model):
+    tournament = AdversarialTournament(model=fake_model)
+    return [await tournament.run(f"Task {i}") for i in range(3)]
+
+
+class TestJsonlSink:
+    """Tests for JsonlSink."""
+
+    def test_one_line_per_result(self, results, tmp_path):
+        """Test that every result becomes one JSON line that reads back equal."""
+        path = tmp_path / "results.jsonl"
+
+        with JsonlSink(path) as sink:
+            for result in results:
+                sink.write(result)
+
+        assert sink.written == 3
+        assert len(path.read_bytes().splitlines()) == 3
+        assert list(JsonlSink.read(path)) == results
+
+    def test_appends_across_runs(self, results, tmp_path):
+        """Test that reopening the sink appends rather than truncating."""
+        path = tmp_path / "results.jsonl"
+        for result in results:
+            with JsonlSink(path, fsync=True) as sink:
+                sink.write(result)
+
+        assert [r.task for r in JsonlSink.read(path)] == ["Task 0", "Task 1", "Task 2"]
+
+    def test_flushes_each_line(self, results, tmp_path):
+        """Test that written lines are visible before the sink is closed."""
+        path = tmp_path / "results.jsonl"
+        sink = JsonlSink(path)
+
+        sink.write(results[0])
+
+        assert path.read_bytes().endswith(b"\n")
+        sink.close()
+
+    @pytest.mark.parametrize("name, compress", [("results.jsonl.gz", None), ("results.jsonl", True)])
+    def test_gzip(self, results, tmp_path, name, compress):
+        """Test gzip output, chosen by suffix or explicitly."""
+        path = tmp_path / name
+        for result in results:
+            with JsonlSink(path, compress=compress) as sink:
+                sink.write(result)
+
+        assert len(gzip.decompress(path.read_bytes()).splitlines()) == 3
+        assert list(JsonlSink.read(path)) == results
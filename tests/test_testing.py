@@ -0,0 +1,45 @@
+"""Unit tests for the simulated model used by benchmarks and offline runs."""
+
+import random
+
+from adversarial_tournament import AdversarialTournament
+from adversarial_tournament.events import TournamentCompleted
+from adversarial_tournament.testing import LatencyProfile, create_simulated_model
+
+
+class TestSimulatedModel:
+    """Tests for the simulated tournament model."""
+
+    async def test_plays_every_role(self):
+        """Test that a full tournament runs against the simulated model."""
+        tournament = AdversarialTournament(
+            model=create_simulated_model(words=10), pipeline_rounds=True
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        assert len(result.round_one.contestant_1_draft.split()) == 10
+        assert result.round_three.final_output
+        assert result.metrics.calls[0].model == "function:simulated"
+
+    async def test_streams(self):
+        """Test that the simulated model supports streamed runs."""
+        tournament = AdversarialTournament(model=create_simulated_model(words=10))
+
+        events = [e async for e in tournament.stream("Write an apology email")]
+
+        assert isinstance(events[-1], TournamentCompleted)
+
+    def test_latency_is_seeded(self):
+        """Test that latency samples are reproducible from the seed."""
+        profile = LatencyProfile(first_token_s=0.5, sigma=0.5)
+
+        first = [profile.sample(random.Random(7)) for _ in range(3)]
+        second = [profile.sample(random.Random(7)) for _ in range(3)]
+
+        assert first == second
+        assert all(sample > 0 for sample in first)
+
+    def test_zero_latency(self):
+        """Test that a zero median disables waiting."""
+        assert LatencyProfile(first_token_s=0).sample(random.Random(0)) == 0.0
@@ -0,0 +1,1185 @@
+"""Unit tests for the tournament orchestrator using a local fake model."""
+
+import asyncio
+import time
+
+import pytest
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.models.function import FunctionModel
+from pydantic_ai.usage import RequestUsage
+
+from adversarial_tournament import AdversarialTournament, ResiliencePolicy, TournamentResult
+from adversarial_tournament import tournament as tournament_module
+from adversarial_tournament.events import (
+    CallCompleted,
+    CallFailed,
+    CallStarted,
+    PartialOutput,
+    PhaseCompleted,
+    PhaseStarted,
+    StreamRestarted,
+    TextDelta,
+    TournamentCompleted,
+)
+from adversarial_tournament.exceptions import BudgetExceeded, TournamentError
+from adversarial_tournament.models import TournamentCheckpoint
+from adversarial_tournament.prompts import build_shared_context
+from adversarial_tournament.scheduler import RateLimit, RateLimitScheduler
+from adversarial_tournament.testing import LatencyProfile, create_simulated_model
+from tests.conftest import fake_tournament_model, fake_tournament_stream
+
+
+class TestRun:
+    """Tests for a single tournament run."""
+
+    async def test_run_produces_result(self, fake_model):
+        """Test that every phase runs and feeds the result."""
+        tournament = AdversarialTournament(model=fake_model)
+
+        result = await tournament.run("Write an apology email")
+
+        assert isinstance(result, TournamentResult)
+        assert result.personas.contestant_1.name == "The Engineer"
+        assert result.round_one.contestant_1_draft == "A complete draft."
+        assert result.round_two.key_issues
+        assert result.round_three.final_output
+
+
+class TestMetrics:
+    """Tests for per-phase and per-call metrics."""
+
+    async def test_records_every_phase_and_call(self, fake_model):
+        """Test that each phase and agent call is timed and its usage kept."""
+        tournament = AdversarialTournament(model=fake_model)
+
+        result = await tournament.run("Write an apology email")
+
+        metrics = result.metrics
+        assert [p.phase for p in metrics.phases] == [
+            "phase_zero",
+            "round_one",
+            "round_two",
+            "round_three",
+        ]
+        assert [(c.phase, c.role) for c in metrics.calls if c.phase != "round_one"] == [
+            ("phase_zero", "persona_generator"),
+            ("round_two", "judge"),
+            ("round_three", "synthesizer"),
+        ]
+        assert all(c.model == "function:fake" for c in metrics.calls)
+        assert metrics.input_tokens > 0
+        assert metrics.output_tokens > 0
+        assert metrics.retries == 0
+        assert metrics.total_duration_s >= sum(p.duration_s for p in metrics.phases)
+
+    async def test_metrics_in_outputs(self, fake_model):
+        """Test that metrics are serialized and rendered."""
+        tournament = AdversarialTournament(model=fake_model)
+
+        result = await tournament.run("Write an apology email")
+
+        assert '"input_tokens"' in result.to_json()
+        assert "## Metrics" in result.to_markdown()
+
+    async def test_streamed_calls_record_usage(self, fake_model):
+        """Test that streamed calls report usage too."""
+        tournament = AdversarialTournament(model=fake_model)
+
+        events = [e async for e in tournament.stream("Write an apology email")]
+
+        metrics = events[-1].result.metrics
+        assert len(metrics.calls) == 5
+        assert all(c.output_tokens > 0 for c in metrics.calls)
+
+
+class TestRoleModels:
+    """Tests for running roles on their own models."""
+
+    async def test_roles_use_their_models(self, fake_model):
+        """Test that each call runs on its role's model, and the rest on the default."""
+        fast = create_simulated_model(model_name="fast")
+        tournament = AdversarialTournament(
+            model=fake_model, role_models={"persona_generator": fast, "judge": fast}
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        models = {c.role: c.model for c in result.metrics.calls}
+        assert models == {
+            "persona_generator": "function:fast",
+            "contestant_1": "function:fake",
+            "contestant_2": "function:fake",
+            "judge": "function:fast",
+            "synthesizer": "function:fake",
+        }
+
+    async def test_patch_synthesis_and_pipelined_judges(self, fake_model):
+        """Test that role kinds cover numbered judges and the patch synthesizer."""
+        fast = create_simulated_model(model_name="fast")
+        tournament = AdversarialTournament(
+            model=fake_model,
+            judges=2,
+            pipeline_rounds=True,
+            synthesis_mode="patch",
+            role_models={"judge": fast, "synthesizer": fast},
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        for call in result.metrics.calls:
+            main_model = call.role.startswith(("persona", "contestant"))
+            assert call.model == ("function:fake" if main_model else "function:fast"), call.role
+
+    def test_from_preset(self):
+        """Test that a preset routes Phase 0 and Round 2 and keeps explicit overrides."""
+        tournament = AdversarialTournament.from_preset(
+            "fast-review", model="openai:gpt-4o", role_models={"judge": "openai:gpt-4o-mini"}
+        )
+
+        assert tournament.model_for("persona_generator") == "openai:gpt-4.1-nano"
+        assert tournament.model_for("judge_2") == "openai:gpt-4o-mini"
+        assert tournament.model_for("patch_synthesizer") == "openai:gpt-4o"
+        with pytest.raises(ValueError, match="unknown model preset"):
+            AdversarialTournament.from_preset("nope")
+
+    def test_rejects_unknown_role(self):
+        """Test that a misspelled role is an error instead of silently ignored."""
+        with pytest.raises(ValueError, match="unknown role in role_models: judges"):
+            AdversarialTournament(role_models={"judges": "openai:gpt-4o-mini"})
+
+
+class TestOverlappedPersonaGeneration:
+    """Tests for starting drafts while personas are still streaming."""
+
+    async def test_draft_starts_before_personas_finish(self):
+        """Test that contestant 1 drafts while the judge persona is still generating."""
+        log: list[str] = []
+
+        async def slow_persona_stream(messages, info):
+            sent = ""
+            async for chunk in fake_tournament_stream(messages, info):
+                sent += chunk[0].json_args or ""
+                if '"judge"' in sent:
+                    # Give the early draft time to start before the judge arrives
+                    await asyncio.sleep(0.3)
+                    sent = ""
+                yield chunk
+            log.append("personas done")
+
+        def logging_model(messages, info):
+            if "YOUR TASK" in messages[-1].parts[-1].content:
+                log.append("draft")
+            return fake_tournament_model(messages, info)
+
+        tournament = AdversarialTournament(
+            model=FunctionModel(logging_model, stream_function=slow_persona_stream),
+            overlap_persona_generation=True,
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        assert log.index("draft") < log.index("personas done")
+        assert result.round_one.contestant_1_draft == "A complete draft."
+        assert result.round_three.final_output
+
+    async def test_overlap_with_pipelined_rounds(self, fake_model):
+        """Test that overlapped Phase 0 composes with pipelined rounds."""
+        tournament = AdversarialTournament(
+            model=fake_model,
+            overlap_persona_generation=True,
+            pipeline_rounds=True,
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        assert result.round_one.contestant_2_draft == "A complete draft."
+        assert result.round_two.key_issues
+
+    async def test_failed_persona_generation_cancels_early_drafts(self):
+        """Test that drafts started early do not outlive a failed Phase 0."""
+        drafts_finished = 0
+
+        async def failing_persona_stream(messages, info):
+            sent = ""
+            async for chunk in fake_tournament_stream(messages, info):
+                sent += chunk[0].json_args or ""
+                if '"judge"' in sent:
+                    await asyncio.sleep(0.02)
+                    raise RuntimeError("stream dropped")
+                yield chunk
+
+        async def slow_model(messages, info):
+            nonlocal drafts_finished
+            await asyncio.sleep(0.2)
+            drafts_finished += 1
+            return fake_tournament_model(messages, info)
+
+        tournament = AdversarialTournament(
+            model=FunctionModel(slow_model, stream_function=failing_persona_stream),
+            overlap_persona_generation=True,
+        )
+
+        with pytest.raises(RuntimeError):
+            await tournament.run("Write an apology email")
+        await asyncio.sleep(0.3)
+
+        assert drafts_finished == 0
+
+
+class TestPipelinedRounds:
+    """Tests for critiquing each draft as soon as it is written."""
+
+    async def test_merges_per_draft_critiques(self, fake_model):
+        """Test that per-draft critiques merge into one RoundTwoCritique."""
+        tournament = AdversarialTournament(model=fake_model, pipeline_rounds=True)
+
+        result = await tournament.run("Write an apology email")
+
+        assert result.round_two.critique_of_contestant_1 == "Too vague."
+        assert result.round_two.critique_of_contestant_2 == "Too vague."
+        assert result.round_two.key_issues == ["Be specific", "Take responsibility"]
+
+    async def test_critique_starts_before_slow_draft_finishes(self):
+        """Test that the faster draft is critiqued while the slower one is running."""
+        log: list[str] = []
+
+        async def timed_model(messages, info):
+            prompt = messages[-1].parts[-1].content
+            if "YOUR TASK" in prompt:
+                slow = "The Communicator" in prompt
+                log.append(f"draft start {'slow' if slow else 'fast'}")
+                await asyncio.sleep(0.05 if slow else 0)
+                log.append(f"draft end {'slow' if slow else 'fast'}")
+            elif "review a draft" in prompt:
+                log.append("critique start")
+            return fake_tournament_model(messages, info)
+
+        tournament = AdversarialTournament(
+            model=FunctionModel(timed_model), pipeline_rounds=True
+        )
+
+        await tournament.run("Write an apology email")
+
+        assert log.index("critique start") < log.index("draft end slow")
+
+    async def test_stream_reports_overlapping_phases(self, fake_model):
+        """Test that both rounds report start and completion when pipelined."""
+        tournament = AdversarialTournament(model=fake_model, pipeline_rounds=True)
+
+        events = [e async for e in tournament.stream("Write an apology email")]
+
+        phases = [
+            (type(e).__name__, e.phase)
+            for e in events
+            if isinstance(e, (PhaseStarted, PhaseCompleted))
+        ]
+        assert phases.index(("PhaseStarted", "round_two")) < phases.index(
+            ("PhaseCompleted", "round_one")
+        )
+        assert phases.index(("PhaseCompleted", "round_two")) < phases.index(
+            ("PhaseStarted", "round_three")
+        )
+
+
+class TestPromptLayout:
+    """Tests for the cache-friendly shared-prefix prompt layout."""
+
+    @staticmethod
+    def _capturing_model(requests: dict):
+        def capture(messages, info):
+            properties = (
+                info.output_tools[0].parameters_json_schema["properties"]
+                if info.output_tools
+                else {}
+            )
+            if "critique_of_contestant_1" in properties:
+                requests["round_two"] = messages[-1]
+                requests.setdefault("round_two_tools", []).append(info.output_tools)
+            elif "final_output" in properties:
+                requests["round_three"] = messages[-1]
+            return fake_tournament_model(messages, info)
+
+        return FunctionModel(capture, model_name="capture")
+
+    async def test_judges_share_prefix(self):
+        """Test that judges send the same tools and open with the task and drafts.
+
+        Round 3 opens with the same text, but its output tool differs, so only
+        requests within a round can share the provider's cached prefix.
+        """
+        requests = {}
+        tournament = AdversarialTournament(
+            model=self._capturing_model(requests), prompt_layout="shared_prefix", judges=2
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        prompt_2 = requests["round_two"].parts[0].content
+        prompt_3 = requests["round_three"].parts[0].content
+        shared = build_shared_context(
+            result.personas.contestants,
+            "Write an apology email",
+            result.round_one.drafts,
+        )
+        assert prompt_2.startswith(shared)
+        assert prompt_3.startswith(shared)
+        assert requests["round_two"].instructions is None
+        assert requests["round_three"].instructions is None
+        assert any(judge.backstory in prompt_2 for judge in result.personas.judges)
+        first, second = requests["round_two_tools"]
+        assert first == second
+
+    async def test_default_layout_keeps_persona_instructions(self):
+        """Test that the default layout still sends the persona as instructions."""
+        requests = {}
+        tournament = AdversarialTournament(model=self._capturing_model(requests))
+
+        await tournament.run("Write an apology email")
+
+        assert requests["round_two"].parts[0].content.startswith("You are The Critic")
+        assert requests["round_two"].instructions.startswith("You are The Critic")
+
+    async def test_reports_cache_read_tokens(self):
+        """Test that provider cache hits reach the call metrics."""
+
+        def cached_model(messages, info):
+            response = fake_tournament_model(messages, info)
+            response.usage = RequestUsage(input_tokens=100, cache_read_tokens=60, output_tokens=10)
+            return response
+
+        tournament = AdversarialTournament(
+            model=FunctionModel(cached_model), prompt_layout="shared_prefix"
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        assert all(call.cache_read_tokens == 60 for call in result.metrics.calls)
+        assert result.metrics.cache_read_tokens == 300
+        assert "300 cached" in result.metrics.to_markdown()
+
+
+class TestFanOut:
+    """Tests for tournaments with more contestants and judges."""
+
+    async def test_runs_every_contestant_and_judge(self, fake_model):
+        """Test that each contestant drafts and each judge critiques every draft."""
+        tournament = AdversarialTournament(model=fake_model, contestants=5, judges=2)
+
+        result = await tournament.run("Write an apology email")
+
+        assert len(result.personas.contestants) == 5
+        assert len(result.personas.judges) == 2
+        assert result.round_one.drafts == ["A complete draft."] * 5
+        assert len(result.round_two.critiques) == 5
+        assert "**The Skeptic 2:** Too long." in result.round_two.critiques[4]
+        roles = sorted(c.role for c in result.metrics.calls)
+        assert roles == [
+            *(f"contestant_{n}" for n in range(1, 6)),
+            "judge_1",
+            "judge_2",
+            "persona_generator",
+            "synthesizer",
+        ]
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"pipeline_rounds": True},
+            {"overlap_persona_generation": True, "pipeline_rounds": True},
+            {"prompt_layout": "shared_prefix"},
+        ],
+    )
+    async def test_execution_modes(self, fake_model, options):
+        """Test that fan-out works with every execution mode."""
+        tournament = AdversarialTournament(
+            model=fake_model, contestants=4, judges=2, **options
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        assert len(result.round_one.drafts) == 4
+        assert len(result.round_two.critiques) == 4
+        assert result.round_three.final_output
+
+    async def test_latency_does_not_grow_with_contestants(self):
+        """Test that five contestants take about as long as two."""
+
+        async def slow_model(messages, info):
+            await asyncio.sleep(0.05)
+            return fake_tournament_model(messages, info)
+
+        async def timed_run(contestants: int) -> float:
+            tournament = AdversarialTournament(
+                model=FunctionModel(slow_model), contestants=contestants
+            )
+            start = time.perf_counter()
+            await tournament.run("Write an apology email")
+            return time.perf_counter() - start
+
+        two = await timed_run(2)
+        five = await timed_run(5)
+
+        assert five < two * 1.5
+
+    async def test_max_concurrent_calls(self):
+        """Test that no more than max_concurrent_calls agent calls run at once."""
+        running = 0
+        peak = 0
+
+        async def tracking_model(messages, info):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return fake_tournament_model(messages, info)
+
+        tournament = AdversarialTournament(
+            model=FunctionModel(tracking_model), contestants=5, max_concurrent_calls=2
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        assert len(result.round_one.drafts) == 5
+        assert peak == 2
+
+    async def test_retries_wrong_persona_count(self):
+        """Test that the generator is asked again when it returns too few personas."""
+        attempts = 0
+
+        def forgetful_model(messages, info):
+            nonlocal attempts
+            response = fake_tournament_model(messages, info)
+            args = response.parts[0].args if info.output_tools else None
+            if isinstance(args, dict) and "extra_contestants" in args:
+                attempts += 1
+                if attempts == 1:
+                    args["extra_contestants"] = []
+            return response
+
+        tournament = AdversarialTournament(
+            model=FunctionModel(forgetful_model), contestants=3
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        assert attempts == 2
+        assert len(result.round_one.drafts) == 3
+        assert result.metrics.calls[0].retries == 1
+
+    def test_rejects_invalid_counts(self, fake_model):
+        """Test that a tournament needs two contestants and a judge."""
+        with pytest.raises(ValueError):
+            AdversarialTournament(model=fake_model, contestants=1)
+        with pytest.raises(ValueError):
+            AdversarialTournament(model=fake_model, judges=0)
+        with pytest.raises(ValueError):
+            AdversarialTournament(model=fake_model, max_concurrent_calls=0)
+
+
+class TestAcceptanceThreshold:
+    """Tests for skipping Round 3 when a draft is already good enough."""
+
+    @staticmethod
+    def _scoring_model(draft_2_score: float) -> FunctionModel:
+        """A fake model whose judges score draft 1 at 5 and draft 2 as given."""
+
+        def respond(messages, info):
+            response = fake_tournament_model(messages, info)
+            args = response.parts[0].args if info.output_tools else None
+            if isinstance(args, dict) and "scores" in args:
+                args["scores"] = [5.0, draft_2_score]
+            elif isinstance(args, dict) and "score" in args:
+                prompt = messages[-1].parts[-1].content
+                args["score"] = draft_2_score if "=== DRAFT 2" in prompt else 5.0
+            return response
+
+        return FunctionModel(respond, model_name="scoring")
+
+    @pytest.mark.parametrize("pipeline_rounds", [False, True])
+    async def test_promotes_accepted_draft(self, pipeline_rounds):
+        """Test that a draft clearing the threshold skips the synthesis call."""
+        tournament = AdversarialTournament(
+            model=self._scoring_model(9.5),
+            acceptance_threshold=9,
+            pipeline_rounds=pipeline_rounds,
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        assert result.promoted_draft == 2
+        assert result.round_two.scores == [5.0, 9.5]
+        assert result.round_three.final_output == result.round_one.contestant_2_draft
+        assert "synthesizer" not in [c.role for c in result.metrics.calls]
+        assert "round_three" not in [p.phase for p in result.metrics.phases]
+        assert "Round 3: Skipped" in result.to_markdown()
+
+    async def test_runs_round_three_below_threshold(self):
+        """Test that Round 3 still runs when no draft is good enough."""
+        tournament = AdversarialTournament(
+            model=self._scoring_model(8.5), acceptance_threshold=9
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        assert result.promoted_draft is None
+        assert result.round_three.final_output == "Final output for the task."
+
+    async def test_scores_without_threshold(self, fake_model):
+        """Test that drafts are scored even when early exit is disabled."""
+        tournament = AdversarialTournament(model=self._scoring_model(10))
+
+        result = await tournament.run("Write an apology email")
+
+        assert result.round_two.scores == [5.0, 10.0]
+        assert result.promoted_draft is None
+
+    @staticmethod
+    def _unscored_model(requests: list[str]) -> FunctionModel:
+        """A fake model whose judges score one draft too few on their first attempt."""
+
+        def respond(messages, info):
+            response = fake_tournament_model(messages, info)
+            args = response.parts[0].args if info.output_tools else None
+            if isinstance(args, dict) and "scores" in args:
+                requests.append("judge")
+                if len(requests) == 1:
+                    args["scores"] = args["scores"][:-1]
+            return response
+
+        return FunctionModel(respond, model_name="unscored")
+
+    @pytest.mark.parametrize("threshold", [None, 9])
+    async def test_scores_required_only_with_threshold(self, threshold):
+        """Test that incomplete scores are retried with a threshold and dropped without."""
+        requests = []
+        tournament = AdversarialTournament(
+            model=self._unscored_model(requests), acceptance_threshold=threshold
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        if threshold is None:
+            assert len(requests) == 1
+            assert result.round_two.scores == []
+        else:
+            assert len(requests) == 2
+            assert result.round_two.scores == [6.0, 6.0]
+
+    def test_rejects_invalid_threshold(self, fake_model):
+        """Test that the threshold must be on the 0-10 scale."""
+        with pytest.raises(ValueError):
+            AdversarialTournament(model=fake_model, acceptance_threshold=11)
+
+
+class TestPatchSynthesis:
+    """Tests for patch-based Round 3 synthesis."""
+
+    async def test_applies_edits_to_base_draft(self, fake_model):
+        """Test that the final output is the base draft with the edits applied."""
+        tournament = AdversarialTournament(model=fake_model, synthesis_mode="patch")
+
+        result = await tournament.run("Write an apology email")
+
+        assert result.round_three.final_output == "A complete draft. Now polished."
+        assert [c.role for c in result.metrics.calls if c.phase == "round_three"] == [
+            "patch_synthesizer"
+        ]
+
+    async def test_falls_back_to_full_synthesis(self):
+        """Test that edits which do not apply trigger a full synthesis."""
+
+        def respond(messages, info):
+            response = fake_tournament_model(messages, info)
+            args = response.parts[0].args if info.output_tools else None
+            if isinstance(args, dict) and "edits" in args:
+                args["edits"][0]["anchor"] = "not in the draft"
+            return response
+
+        tournament = AdversarialTournament(
+            model=FunctionModel(respond, model_name="bad-edits"), synthesis_mode="patch"
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        assert result.round_three.final_output == "Final output for the task."
+        assert [c.role for c in result.metrics.calls if c.phase == "round_three"] == [
+            "patch_synthesizer",
+            "synthesizer",
+        ]
+
+    async def test_generates_fewer_output_tokens(self):
+        """Test that patching long drafts costs less output than rewriting them."""
+        output_tokens = {}
+        for mode in ("full", "patch"):
+            tournament = AdversarialTournament(
+                model=create_simulated_model(words=400), synthesis_mode=mode
+            )
+            result = await tournament.run("Write an incident postmortem")
+            output_tokens[mode] = sum(
+                c.output_tokens for c in result.metrics.calls if c.phase == "round_three"
+            )
+
+        assert output_tokens["patch"] < output_tokens["full"] / 2
+
+
+class TestResilience:
+    """Tests for retries, timeouts, hedging and fallback models."""
+
+    @staticmethod
+    def _flaky_model(failures: dict[str, int], error: Exception) -> FunctionModel:
+        """A fake model whose synthesis calls fail ``failures["synthesizer"]`` times first."""
+
+        def respond(messages, info):
+            tool = info.output_tools[0] if info.output_tools else None
+            if tool and "final_output" in tool.parameters_json_schema.get("properties", {}):
+                if failures["synthesizer"] > 0:
+                    failures["synthesizer"] -= 1
+                    raise error
+            return fake_tournament_model(messages, info)
+
+        return FunctionModel(respond, model_name="flaky")
+
+    async def test_retries_transient_errors(self):
+        """Test that a rate-limited call is retried and its attempts recorded."""
+        tournament = AdversarialTournament(
+            model=self._flaky_model({"synthesizer": 2}, ModelHTTPError(429, "flaky")),
+            resilience=ResiliencePolicy(backoff_base_s=0),
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        synthesis = next(c for c in result.metrics.calls if c.role == "synthesizer")
+        assert synthesis.attempts == 3
+        assert synthesis.retries == 2
+        assert result.round_three.final_output == "Final output for the task."
+
+    async def test_does_not_retry_permanent_errors(self):
+        """Test that errors a retry cannot fix surface immediately."""
+        failures = {"synthesizer": 5}
+        tournament = AdversarialTournament(
+            model=self._flaky_model(failures, ModelHTTPError(400, "flaky")),
+            resilience=ResiliencePolicy(backoff_base_s=0),
+        )
+
+        with pytest.raises(ModelHTTPError):
+            await tournament.run("Write an apology email")
+        assert failures["synthesizer"] == 4
+
+    async def test_falls_back_to_next_model(self, fake_model):
+        """Test that exhausted retries move the call to the fallback model."""
+        tournament = AdversarialTournament(
+            model=self._flaky_model({"synthesizer": 99}, ModelHTTPError(503, "flaky")),
+            resilience=ResiliencePolicy(
+                max_attempts=2, backoff_base_s=0, fallback_models=(fake_model,)
+            ),
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        synthesis = next(c for c in result.metrics.calls if c.role == "synthesizer")
+        assert synthesis.model == "function:fake"
+        assert synthesis.attempts == 3
+        assert result.round_one.contestant_1_draft == "A complete draft."
+
+    async def test_times_out_stuck_calls(self):
+        """Test that a call stuck past its role timeout is retried."""
+        stuck = {"calls": 0}
+
+        async def respond(messages, info):
+            if not info.output_tools and stuck["calls"] == 0:
+                stuck["calls"] += 1
+                await asyncio.sleep(10)
+            return fake_tournament_model(messages, info)
+
+        tournament = AdversarialTournament(
+            model=FunctionModel(respond, model_name="stuck"),
+            resilience=ResiliencePolicy(role_timeouts={"contestant": 0.05}, backoff_base_s=0),
+        )
+
+        start = time.perf_counter()
+        result = await tournament.run("Write an apology email")
+
+        assert time.perf_counter() - start < 2
+        assert sorted(c.attempts for c in result.metrics.calls if c.phase == "round_one") == [1, 2]
+
+    async def test_streamed_retry_restarts_output(self):
+        """Test that retrying a call that already streamed deltas is announced first."""
+        stuck = {"calls": 0}
+
+        async def stream(messages, info):
+            if not info.output_tools and stuck["calls"] == 0:
+                stuck["calls"] += 1
+                yield "Half a"
+                await asyncio.sleep(10)
+            async for chunk in fake_tournament_stream(messages, info):
+                yield chunk
+
+        tournament = AdversarialTournament(
+            model=FunctionModel(fake_tournament_model, stream_function=stream, model_name="stuck"),
+            # Long enough for the first (0.1 s debounced) delta to be published
+            resilience=ResiliencePolicy(role_timeouts={"contestant": 0.3}, backoff_base_s=0),
+        )
+
+        events = [e async for e in tournament.stream("Write an apology email")]
+
+        restarts = [e for e in events if isinstance(e, StreamRestarted)]
+        assert len(restarts) == 1 and restarts[0].phase == "round_one"
+        role = restarts[0].role
+        deltas = [e for e in events if isinstance(e, (TextDelta, StreamRestarted)) and e.role == role]
+        restart = deltas.index(restarts[0])
+        assert "".join(e.delta for e in deltas[:restart]) == "Half a"
+        assert "".join(e.delta for e in deltas[restart + 1 :]) == "A complete draft."
+
+    async def test_hedges_straggler(self):
+        """Test that a call outliving the role's recent latency is duplicated."""
+        straggled = {"calls": 0}
+
+        async def respond(messages, info):
+            prompt = messages[-1].parts[-1].content
+            if "Straggle" in prompt and not info.output_tools and straggled["calls"] == 0:
+                straggled["calls"] += 1
+                await asyncio.sleep(10)
+            return fake_tournament_model(messages, info)
+
+        tournament = AdversarialTournament(
+            model=FunctionModel(respond, model_name="straggler"),
+            resilience=ResiliencePolicy(hedge_quantile=0.95, hedge_min_samples=2),
+        )
+        await tournament.run("Warm-up task")
+
+        start = time.perf_counter()
+        result = await tournament.run("Straggle task")
+
+        assert time.perf_counter() - start < 2
+        # Warm-up latencies are tiny, so other calls may be hedged too
+        assert any(c.hedged for c in result.metrics.calls if c.phase == "round_one")
+        assert result.round_one.contestant_1_draft == "A complete draft."
+
+
+class TestBudget:
+    """Tests for deadlines, token budgets and cancelling sibling calls."""
+
+    @staticmethod
+    def _model(stall: str, cancelled: list[str], fail: bool = False) -> FunctionModel:
+        """A fake model whose first call of the ``stall`` kind hangs (or fails with ``fail``).
+
+        ``stall`` is "draft" (a Round 1 call) or an output field naming the
+        agent ("final_output" for the synthesizer). Cancelled calls are
+        recorded in ``cancelled``.
+        """
+        stalled = []
+
+        async def respond(messages, info):
+            properties = (
+                info.output_tools[0].parameters_json_schema.get("properties", {})
+                if info.output_tools
+                else {}
+            )
+            kind = "draft" if not info.output_tools else next(iter(properties))
+            if stall in (kind, *properties) and not stalled:
+                stalled.append(stall)
+                if fail:
+                    raise RuntimeError("contestant failed")
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(stall)
+                    raise
+            elif kind == "draft" and fail:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(kind)
+                    raise
+            return fake_tournament_model(messages, info)
+
+        return FunctionModel(respond, model_name="stalling")
+
+    async def test_deadline_promotes_best_draft(self):
+        """Test that a run past its deadline returns the top-scored draft."""
+        cancelled = []
+        tournament = AdversarialTournament(
+            model=self._model("final_output", cancelled), deadline_s=0.3
+        )
+
+        start = time.perf_counter()
+        result = await tournament.run("Write an apology email")
+
+        assert time.perf_counter() - start < 2
+        assert result.partial
+        assert result.stop_reason == "deadline"
+        assert result.completed_phases == ["phase_zero", "round_one", "round_two"]
+        assert result.promoted_draft == result.round_two.best_draft()[0]
+        assert result.round_three.final_output == "A complete draft."
+        assert "stopped at its deadline" in result.round_three.collaboration_discussion
+        assert cancelled == ["final_output"]
+        assert "Skipped (stopped at the deadline" in result.to_markdown()
+
+    async def test_deadline_within_round_one(self):
+        """Test that a finished draft is returned while its sibling is cancelled."""
+        cancelled = []
+        tournament = AdversarialTournament(model=self._model("draft", cancelled), deadline_s=0.3)
+
+        result = await tournament.run("Write an apology email")
+
+        assert result.completed_phases == ["phase_zero"]
+        assert result.round_one is None and result.round_two is None
+        assert result.promoted_draft == 2
+        assert result.round_three.final_output == "A complete draft."
+        assert cancelled == ["draft"]
+        assert TournamentResult.model_validate_json(result.model_dump_json()) == result
+
+    async def test_token_budget(self, fake_model):
+        """Test that a spent token budget stops the run before Round 3."""
+        full = await AdversarialTournament(model=fake_model).run("Write an apology email")
+        drafting = sum(
+            c.input_tokens + c.output_tokens for c in full.metrics.calls if c.phase != "round_three"
+        )
+        tournament = AdversarialTournament(model=fake_model, token_budget=drafting)
+
+        result = await tournament.run("Write an apology email")
+
+        assert result.stop_reason == "token_budget"
+        assert "round_three" not in result.completed_phases
+        assert all(c.phase != "round_three" for c in result.metrics.calls)
+
+    async def test_budget_exceeded_without_a_draft(self, fake_model):
+        """Test that a run stopped before any draft raises BudgetExceeded."""
+        tournament = AdversarialTournament(model=fake_model, token_budget=1)
+
+        with pytest.raises(BudgetExceeded, match="token budget") as excinfo:
+            await tournament.run("Write an apology email")
+        assert excinfo.value.completed_phases == ["phase_zero"]
+
+    async def test_failure_cancels_sibling_calls(self):
+        """Test that a failing contestant cancels the other instead of letting it run on."""
+        cancelled = []
+        tournament = AdversarialTournament(model=self._model("draft", cancelled, fail=True))
+
+        start = time.perf_counter()
+        with pytest.raises(RuntimeError, match="contestant failed"):
+            await tournament.run("Write an apology email")
+
+        assert time.perf_counter() - start < 2
+        assert cancelled == ["draft"]
+
+    def test_rejects_invalid_limits(self):
+        """Test that non-positive deadlines and budgets are rejected."""
+        with pytest.raises(ValueError, match="deadline_s"):
+            AdversarialTournament(deadline_s=0)
+        with pytest.raises(ValueError, match="token_budget"):
+            AdversarialTournament(token_budget=0)
+
+
+class TestScheduler:
+    """Tests for sharing a rate-limit scheduler between tournaments."""
+
+    async def test_older_tournament_finishes_first(self, fake_model):
+        """Test that a throttled tournament that started first is not starved by a newer one."""
+        scheduler = RateLimitScheduler(
+            default=RateLimit(requests_per_minute=1200, burst_s=0.05)
+        )
+        first = AdversarialTournament(model=fake_model, scheduler=scheduler)
+        second = AdversarialTournament(model=fake_model, scheduler=scheduler)
+        finished = []
+
+        async def run(name, tournament):
+            await tournament.run("Write an apology email")
+            finished.append(name)
+
+        older = asyncio.create_task(run("first", first))
+        await asyncio.sleep(0.01)
+        await asyncio.gather(older, run("second", second))
+
+        assert finished == ["first", "second"]
+        assert scheduler.waiting("function:fake") == 0
+
+
+class TestCheckpoint:
+    """Tests for phase checkpoints and resuming."""
+
+    @staticmethod
+    def _failing_synthesis_model() -> FunctionModel:
+        """A fake model whose Round 3 synthesis always fails."""
+
+        def respond(messages, info):
+            tool = info.output_tools[0] if info.output_tools else None
+            if tool and "final_output" in tool.parameters_json_schema.get("properties", {}):
+                raise RuntimeError("synthesis crashed")
+            return fake_tournament_model(messages, info)
+
+        return FunctionModel(respond, model_name="crashy")
+
+    async def test_saves_every_phase(self, fake_model, tmp_path):
+        """Test that a finished run leaves a checkpoint with every phase."""
+        tournament = AdversarialTournament(model=fake_model, checkpoint_dir=tmp_path)
+
+        result = await tournament.run("Write an apology email")
+
+        checkpoint = TournamentCheckpoint.load(tournament.checkpoint_path("Write an apology email"))
+        assert checkpoint.completed_phases == ["phase_zero", "round_one", "round_two", "round_three"]
+        assert checkpoint.round_three == result.round_three
+
+    async def test_resumes_after_failed_round_three(self, fake_model, tmp_path):
+        """Test that only the failed phase runs again after a crash."""
+        task = "Write an apology email"
+        crashed = AdversarialTournament(
+            model=self._failing_synthesis_model(), checkpoint_dir=tmp_path
+        )
+        with pytest.raises(RuntimeError):
+            await crashed.run(task)
+        path = crashed.checkpoint_path(task)
+        assert TournamentCheckpoint.load(path).completed_phases == [
+            "phase_zero",
+            "round_one",
+            "round_two",
+        ]
+
+        tournament = AdversarialTournament(model=fake_model, checkpoint_dir=tmp_path)
+        result = await tournament.resume(path)
+
+        assert [c.role for c in result.metrics.calls] == ["synthesizer"]
+        assert result.round_one.contestant_1_draft == "A complete draft."
+        assert result.round_three.final_output == "Final output for the task."
+        assert TournamentCheckpoint.load(path).round_three == result.round_three
+
+    async def test_run_many_resumes_checkpointed_tasks(self, fake_model, tmp_path):
+        """Test that a resumed batch only reruns what is missing."""
+        tournament = AdversarialTournament(model=fake_model, checkpoint_dir=tmp_path)
+        await tournament.run("Task A")
+
+        results = [
+            r async for r in tournament.run_many(["Task A", "Task B"], resume=True)
+        ]
+
+        calls = {r.task: len(r.metrics.calls) for r in results}
+        assert calls == {"Task A": 0, "Task B": 5}
+
+    async def test_concurrent_runs_keep_separate_checkpoints(self, fake_model, tmp_path):
+        """Test that runs of one task in flight together never share a checkpoint file."""
+        tournament = AdversarialTournament(model=fake_model, checkpoint_dir=tmp_path)
+
+        results = [r async for r in tournament.run_many(["Task A", "Task A"])]
+        await asyncio.gather(tournament.run("Task B"), tournament.run("Task B"))
+
+        assert all(isinstance(r, TournamentResult) for r in results)
+        assert {path.name for path in tmp_path.iterdir()} == {
+            tournament.checkpoint_path(task, run).name
+            for task in ("Task A", "Task B")
+            for run in (0, 1)
+        }
+        other = AdversarialTournament(model=fake_model, judges=2, checkpoint_dir=tmp_path)
+        assert other.checkpoint_path("Task A") != tournament.checkpoint_path("Task A")
+
+    async def test_rejects_mismatched_checkpoint(self, fake_model, tmp_path):
+        """Test that a checkpoint only resumes with the same contestant and judge counts."""
+        tournament = AdversarialTournament(model=fake_model, judges=2)
+
+        with pytest.raises(ValueError, match="judges"):
+            await tournament.resume(TournamentCheckpoint(task="Write an email"))
+
+
+class TestStream:
+    """Tests for streaming tournament progress."""
+
+    async def test_stream_events(self, fake_model):
+        """Test that every phase streams and the result comes last."""
+        tournament = AdversarialTournament(model=fake_model)
+
+        events = [e async for e in tournament.stream("Write an apology email")]
+
+        assert isinstance(events[-1], TournamentCompleted)
+        assert [e.phase for e in events if isinstance(e, PhaseStarted)] == [
+            "phase_zero",
+            "round_one",
+            "round_two",
+            "round_three",
+        ]
+        assert any(isinstance(e, PartialOutput) and e.phase == "round_two" for e in events)
+
+    async def test_deltas_rebuild_outputs(self, fake_model):
+        """Test that concatenated deltas reproduce the final outputs."""
+        tournament = AdversarialTournament(model=fake_model)
+
+        events = [e async for e in tournament.stream("Write an apology email")]
+        result = events[-1].result
+
+        def text(role: str, field: str | None = None) -> str:
+            return "".join(
+                e.delta
+                for e in events
+                if isinstance(e, TextDelta) and e.role == role and e.field == field
+            )
+
+        assert text("contestant_1") == result.round_one.contestant_1_draft
+        assert text("judge", "critique_of_contestant_1") == result.round_two.critique_of_contestant_1
+        assert text("synthesizer", "final_output") == result.round_three.final_output
+        completed = [e.output for e in events if isinstance(e, PhaseCompleted)]
+        assert completed[-1] == result.round_three
+
+    async def test_structured_fields_stream_incrementally(self):
+        """Test that critique and final output fields stream while they are generated."""
+        model = create_simulated_model(
+            LatencyProfile(first_token_s=0, per_token_s=0.002), words=100
+        )
+        tournament = AdversarialTournament(model=model)
+
+        events = [e async for e in tournament.stream("Write an apology email")]
+        result = events[-1].result
+
+        def deltas(field: str) -> list[str]:
+            return [e.delta for e in events if isinstance(e, TextDelta) and e.field == field]
+
+        assert len(deltas("final_output")) > 1
+        assert len(deltas("critique_of_contestant_1")) > 1
+        assert "".join(deltas("final_output")) == result.round_three.final_output
+
+    async def test_phase_events_only(self, fake_model):
+        """Test that deltas=False yields phase events and the result, nothing streamed."""
+        tournament = AdversarialTournament(model=fake_model)
+
+        events = [e async for e in tournament.stream("Write an apology email", deltas=False)]
+
+        assert {type(e) for e in events} == {PhaseStarted, PhaseCompleted, TournamentCompleted}
+        assert len(events) == 9
+
+    async def test_stream_propagates_failure(self, fake_model):
+        """Test that a failing call raises from the stream."""
+        tournament = AdversarialTournament(model=fake_model)
+
+        with pytest.raises(RuntimeError):
+            async for _ in tournament.stream("FAIL"):
+                pass
+
+
+class TestHooks:
+    """Tests for the phase and call hooks and run_events."""
+
+    async def test_hooks_receive_phases_and_calls(self, fake_model):
+        """Test that hooks see every phase and call with its timing, usage and prompt size."""
+        seen = []
+        tournament = AdversarialTournament(
+            model=fake_model,
+            on_phase_start=seen.append,
+            on_phase_end=seen.append,
+            on_call_start=seen.append,
+            on_call_end=seen.append,
+        )
+
+        result = await tournament.run("Write an apology email")
+
+        assert [type(e) for e in seen[:2]] == [PhaseStarted, CallStarted]
+        starts = [e for e in seen if isinstance(e, CallStarted)]
+        ends = [e for e in seen if isinstance(e, CallCompleted)]
+        assert [e.metrics for e in ends] == result.metrics.calls
+        assert sorted((e.role, e.model, e.prompt_chars) for e in starts) == sorted(
+            (e.role, e.metrics.model, e.prompt_chars) for e in ends
+        )
+        assert all(e.prompt_chars > 0 for e in starts)
+        phase_ends = [e for e in seen if isinstance(e, PhaseCompleted)]
+        assert [e.metrics for e in phase_ends] == result.metrics.phases
+
+    async def test_failed_call(self, fake_model):
+        """Test that a failing call ends with CallFailed carrying its error."""
+        ends = []
+        tournament = AdversarialTournament(model=fake_model, on_call_end=ends.append)
+
+        with pytest.raises(RuntimeError):
+            await tournament.run("FAIL")
+
+        assert len(ends) == 1 and isinstance(ends[0], CallFailed)
+        assert ends[0].role == "persona_generator"
+        assert isinstance(ends[0].error, RuntimeError)
+
+    async def test_run_events(self, fake_model):
+        """Test that run_events yields phase and call events, no deltas, and the result last."""
+        tournament = AdversarialTournament(model=fake_model)
+
+        events = [e async for e in tournament.run_events("Write an apology email")]
+
+        assert isinstance(events[-1], TournamentCompleted)
+        assert {type(e) for e in events} == {
+            PhaseStarted,
+            PhaseCompleted,
+            CallStarted,
+            CallCompleted,
+            TournamentCompleted,
+        }
+        calls = [e for e in events if isinstance(e, CallCompleted)]
+        assert [e.metrics for e in calls] == events[-1].result.metrics.calls
+
+    async def test_no_call_events_without_listeners(self, fake_model, monkeypatch):
+        """Test that call events are not even built when nothing receives them."""
+
+        def unexpected(*args):
+            raise AssertionError("call event built without a listener")
+
+        monkeypatch.setattr(tournament_module, "CallStarted", unexpected)
+        monkeypatch.setattr(tournament_module, "CallCompleted", unexpected)
+        tournament = AdversarialTournament(model=fake_model, on_phase_end=lambda event: None)
+
+        result = await tournament.run("Write an apology email")
+
+        assert result.round_three.final_output
+
+
+class TestRunMany:
+    """Tests for batch execution with bounded concurrency."""
+
+    async def test_yields_every_result(self, fake_model):
+        """Test that each task produces exactly one result."""
+        tournament = AdversarialTournament(model=fake_model)
+        tasks = [f"Task {i}" for i in range(5)]
+
+        results = [r async for r in tournament.run_many(tasks, max_concurrency=2)]
+
+        assert sorted(r.task for r in results) == tasks
+
+    async def test_failure_does_not_stop_batch(self, fake_model):
+        """Test that a failing task is yielded as an error and others finish."""
+        tournament = AdversarialTournament(model=fake_model)
+
+        results = [
+            r async for r in tournament.run_many(["ok 1", "FAIL", "ok 2"], max_concurrency=3)
+        ]
+
+        errors = [r for r in results if isinstance(r, TournamentError)]
+        assert len(errors) == 1
+        assert errors[0].task == "FAIL"
+        assert isinstance(errors[0].error, RuntimeError)
+        assert sorted(r.task for r in results if isinstance(r, TournamentResult)) == [
+            "ok 1",
+            "ok 2",
+        ]
+
+    async def test_respects_max_concurrency(self):
+        """Test that no more than max_concurrency tournaments run at once."""
+        running: set[str] = set()
+        peak = 0
+
+        async def tracking_model(messages, info):
+            nonlocal peak
+            task = messages[0].parts[-1].content
+            if task.startswith("Create personas for this task: "):
+                running.add(task)
+                peak = max(peak, len(running))
+                await asyncio.sleep(0.01)
+                running.discard(task)
+            return fake_tournament_model(messages, info)
+
+        tournament = AdversarialTournament(model=FunctionModel(tracking_model))
+        tasks = [f"Task {i}" for i in range(6)]
+
+        results = [r async for r in tournament.run_many(tasks, max_concurrency=2)]
+
+        assert len(results) == 6
+        assert peak == 2
+
+    async def test_rejects_invalid_concurrency(self, fake_model):
+        """Test that max_concurrency must be positive."""
+        tournament = AdversarialTournament(model=fake_model)
+
+        with pytest.raises(ValueError):
+            async for _ in tournament.run_many(["Task"], max_concurrency=0):
+                pass